@@ -29,6 +29,7 @@ from redbot.core._cli import interactive_config, confirm, parse_cli_flags
 from redbot.setup import get_data_dir, get_name, save_config
 from redbot.core import data_manager, _drivers
 from redbot.core._debuginfo import DebugInfo
+from redbot.core._loop_monitor import LoopLagMonitor
 from redbot.core._sharedlibdeprecation import SharedLibImportWarner
 
 
@@ -324,6 +325,10 @@ async def run_bot(red: Red, cli_flags: Namespace) -> None:
     log.debug("Data Path: %s", data_manager._base_data_path())
     log.debug("Storage Type: %s", data_manager.storage_type())
 
+    if cli_flags.monitor_loop_lag:
+        red._loop_monitor = LoopLagMonitor(threshold=cli_flags.loop_lag_threshold / 1000)
+        red._loop_monitor.start()
+
     # lib folder has to be in sys.path before trying to load any 3rd-party cog (GH-3061)
     # We might want to change handling of requirements in Downloader at later date
     LIB_PATH = data_manager.cog_data_path(raw_name="Downloader") / "lib"
@@ -435,6 +440,10 @@ async def shutdown_handler(red, signal_type=None, exit_code=None):
     if exit_code is not None:
         red._shutdown_mode = exit_code
 
+    if red._loop_monitor is not None:
+        # the loop is going to be stopped soon, which the monitor would consider a stall
+        red._loop_monitor.stop()
+
     try:
         if not red.is_closed():
             await red.close()
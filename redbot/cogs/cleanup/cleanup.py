@@ -1,7 +1,11 @@
 import contextlib
+import hashlib
+import json
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Callable, List, Optional, Set, Union
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import discord
 
@@ -9,6 +13,7 @@ from redbot.core import commands, Config
 from redbot.core.bot import Red
 from redbot.core.commands import positive_int, RawUserIdConverter
 from redbot.core.i18n import Translator, cog_i18n
+from redbot.core.utils import bounded_gather
 from redbot.core.utils.chat_formatting import humanize_number
 from redbot.core.utils.mod import slow_deletion, mass_purge
 from redbot.core.utils.predicates import MessagePredicate
@@ -19,13 +24,91 @@ _ = Translator("Cleanup", __file__)
 
 log = logging.getLogger("red.cleanup")
 
+#: Minimum number of deleted messages for the progress of a cleanup to be shown.
+PROGRESS_THRESHOLD = 500
+#: Minimum time (in seconds) between updates of a cleanup's progress message.
+PROGRESS_INTERVAL = 5
+#: Maximum number of channels cleaned up at once by server-wide cleanups.
+CHANNEL_CONCURRENCY = 5
+#: Maximum number of distinct messages remembered when looking for duplicates.
+DUPLICATE_FINGERPRINTS = 10_000
+
+
+class _CleanupProgress:
+    """Shows the number of deleted messages in a single, throttled progress message."""
+
+    def __init__(self, channel: discord.abc.Messageable, *, enabled: bool = True) -> None:
+        self.channel = channel
+        self.enabled = enabled
+        self._message: Optional[discord.Message] = None
+        self._last_update = time.monotonic()
+
+    async def update(self, deleted: int) -> None:
+        if not self.enabled or deleted < PROGRESS_THRESHOLD:
+            return
+        if time.monotonic() - self._last_update < PROGRESS_INTERVAL:
+            return
+        self._last_update = time.monotonic()
+        content = _("Deleted {num} messages so far...").format(num=humanize_number(deleted))
+        with contextlib.suppress(discord.HTTPException):
+            if self._message is None:
+                self._message = await self.channel.send(content)
+            else:
+                await self._message.edit(content=content)
+
+    async def close(self) -> None:
+        if self._message is not None:
+            with contextlib.suppress(discord.HTTPException):
+                await self._message.delete()
+            self._message = None
+
+
+class _DuplicateFilter:
+    """
+    Message check matching the messages that repeat a message it has already seen.
+
+    Only a fingerprint of each distinct message is kept, and at most
+    `DUPLICATE_FINGERPRINTS` of them, the least recently repeated ones are forgotten first.
+    Messages with attachments are never matched.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self.max_size = DUPLICATE_FINGERPRINTS if max_size is None else max_size
+        self._seen: OrderedDict[bytes, None] = OrderedDict()
+
+    @staticmethod
+    def fingerprint(message: discord.Message) -> bytes:
+        data = json.dumps(
+            [
+                message.author.id,
+                " ".join(message.content.split()),
+                [embed.to_dict() for embed in message.embeds],
+                [sticker.id for sticker in message.stickers],
+            ],
+            sort_keys=True,
+        )
+        return hashlib.blake2b(data.encode(), digest_size=16).digest()
+
+    def __call__(self, message: discord.Message) -> bool:
+        if message.attachments:
+            return False
+        fingerprint = self.fingerprint(message)
+        if fingerprint in self._seen:
+            self._seen.move_to_end(fingerprint)
+            return True
+        self._seen[fingerprint] = None
+        if len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+        return False
+
 
 @cog_i18n(_)
 class Cleanup(commands.Cog):
     """This cog contains commands used for "cleaning up" (deleting) messages.
 
     This is designed as a moderator tool and offers many convenient use cases.
-    All cleanup commands only apply to the channel the command is executed in.
+    All cleanup commands only apply to the channel the command is executed in,
+    except for `[p]cleanup server`.
 
     Messages older than two weeks cannot be mass deleted.
     This is a limitation of the API.
@@ -57,12 +140,24 @@ class Cleanup(commands.Cog):
         if number > 2**63 - 1:
             return await ctx.send(_("Try a smaller number instead."))
 
-        prompt = await ctx.send(
+        return await Cleanup.confirm(
+            ctx,
             _("Are you sure you want to delete {number} messages?").format(
                 number=humanize_number(number)
-            )
-            + " (yes/no)"
+            ),
         )
+
+    @staticmethod
+    async def confirm(ctx: commands.Context, question: str) -> bool:
+        """
+        Asks the user to confirm a cleanup.
+
+        Tries its best to cleanup after itself if the response is positive.
+        """
+        if ctx.assume_yes:
+            return True
+
+        prompt = await ctx.send(question + " (yes/no)")
         response = await ctx.bot.wait_for("message", check=MessagePredicate.same_context(ctx))
 
         if response.content.lower().startswith("y"):
@@ -76,7 +171,7 @@ class Cleanup(commands.Cog):
             return False
 
     @staticmethod
-    async def get_messages_for_deletion(
+    async def iter_messages_for_deletion(
         *,
         channel: Union[
             discord.TextChannel,
@@ -91,9 +186,10 @@ class Cleanup(commands.Cog):
         before: Union[discord.Message, datetime] = None,
         after: Union[discord.Message, datetime] = None,
         delete_pinned: bool = False,
-    ) -> List[discord.Message]:
+    ) -> AsyncIterator[discord.Message]:
         """
-        Gets a list of messages meeting the requirements to be deleted.
+        Iterates over the messages meeting the requirements to be deleted,
+        fetching the channel's history as they're consumed.
         Generally, the requirements are:
         - We don't have the number of messages to be deleted already
         - The message passes a provided check (if no check is provided,
@@ -122,18 +218,170 @@ class Cleanup(commands.Cog):
                 after = after.created_at
             after = max(after, two_weeks_ago)
 
-        collected = []
+        collected = 0
         async for message in channel.history(
             limit=limit, before=before, after=after, oldest_first=False
         ):
             if message.created_at < two_weeks_ago:
                 break
             if message_filter(message):
-                collected.append(message)
-                if number is not None and number <= len(collected):
+                yield message
+                collected += 1
+                if number is not None and number <= collected:
                     break
 
-        return collected
+    @classmethod
+    async def get_messages_for_deletion(
+        cls,
+        *,
+        channel: Union[
+            discord.TextChannel,
+            discord.VoiceChannel,
+            discord.StageChannel,
+            discord.DMChannel,
+            discord.Thread,
+        ],
+        number: Optional[int] = None,
+        check: Callable[[discord.Message], bool] = lambda x: True,
+        limit: Optional[int] = None,
+        before: Union[discord.Message, datetime] = None,
+        after: Union[discord.Message, datetime] = None,
+        delete_pinned: bool = False,
+    ) -> List[discord.Message]:
+        """
+        Gets a list of messages meeting the requirements to be deleted.
+
+        See `iter_messages_for_deletion()` for the requirements.
+        """
+        return [
+            message
+            async for message in cls.iter_messages_for_deletion(
+                channel=channel,
+                number=number,
+                check=check,
+                limit=limit,
+                before=before,
+                after=after,
+                delete_pinned=delete_pinned,
+            )
+        ]
+
+    async def purge_messages(
+        self,
+        ctx: commands.Context,
+        messages: AsyncIterator[discord.Message],
+        *,
+        reason: str,
+        delete_invoking: bool = True,
+    ) -> int:
+        """
+        Deletes the messages from the context's channel as they're fetched,
+        showing the progress of large cleanups.
+
+        Returns the number of deleted messages, including the invoking message
+        when ``delete_invoking`` is ``True``.
+        """
+        channel = ctx.channel
+        show_progress = not ctx.guild or await self.config.guild(ctx.guild).notify()
+        progress = _CleanupProgress(channel, enabled=show_progress)
+
+        async def to_delete():
+            async for message in messages:
+                yield message
+            if delete_invoking:
+                yield ctx.message
+
+        try:
+            deleted = await mass_purge(
+                to_delete(), channel, reason=reason, progress=progress.update
+            )
+        finally:
+            await progress.close()
+        log.info("%s Messages deleted: %s.", reason, deleted)
+        return deleted
+
+    @staticmethod
+    def get_cleanable_channels(
+        guild: discord.Guild, member: discord.Member
+    ) -> List[
+        Union[discord.TextChannel, discord.VoiceChannel, discord.StageChannel, discord.Thread]
+    ]:
+        """
+        Gets the channels and active threads of the guild in which the bot can read
+        and delete messages, and in which the given member can manage messages.
+        """
+        channels = []
+        for channel in (
+            *guild.text_channels,
+            *guild.voice_channels,
+            *guild.stage_channels,
+            *guild.threads,
+        ):
+            bot_perms = channel.permissions_for(guild.me)
+            member_perms = channel.permissions_for(member)
+            if (
+                bot_perms.read_message_history
+                and bot_perms.manage_messages
+                and member_perms.view_channel
+                and member_perms.manage_messages
+            ):
+                channels.append(channel)
+        return channels
+
+    async def purge_channels(
+        self,
+        ctx: commands.Context,
+        channels: List[
+            Union[discord.TextChannel, discord.VoiceChannel, discord.StageChannel, discord.Thread]
+        ],
+        *,
+        check: Callable[[discord.Message], bool],
+        reason: Callable[[discord.abc.GuildChannel], str],
+        delete_pinned: bool = False,
+    ) -> Tuple[Dict[int, int], List[discord.abc.GuildChannel]]:
+        """
+        Deletes the messages from the last two weeks that pass the check in all given channels,
+        cleaning up to `CHANNEL_CONCURRENCY` channels at once.
+
+        Each channel's messages are deleted as they're fetched and the total progress
+        of large cleanups is shown in the context's channel.
+
+        ``reason`` is called with each channel to get the audit log reason of its cleanup.
+
+        Returns the number of deleted messages by channel ID
+        and the channels in which the cleanup failed.
+        """
+        show_progress = await self.config.guild(ctx.guild).notify()
+        progress = _CleanupProgress(ctx.channel, enabled=show_progress)
+        deleted: Dict[int, int] = {}
+        failed = []
+
+        async def purge_channel(channel) -> None:
+            async def report_progress(channel_deleted: int) -> None:
+                deleted[channel.id] = channel_deleted
+                await progress.update(sum(deleted.values()))
+
+            # the history of each channel stops at the messages that can't be bulk deleted
+            to_delete = self.iter_messages_for_deletion(
+                channel=channel, check=check, before=ctx.message, delete_pinned=delete_pinned
+            )
+            channel_reason = reason(channel)
+            try:
+                deleted[channel.id] = await mass_purge(
+                    to_delete, channel, reason=channel_reason, progress=report_progress
+                )
+            except discord.HTTPException:
+                log.warning("Failed to clean up channel %s.", channel.id, exc_info=True)
+                failed.append(channel)
+            else:
+                log.info("%s Messages deleted: %s.", channel_reason, deleted[channel.id])
+
+        # messages of different channels are deleted with separate rate limits
+        try:
+            await bounded_gather(*map(purge_channel, channels), limit=CHANNEL_CONCURRENCY)
+        finally:
+            await progress.close()
+        return deleted, failed
 
     async def send_optional_notification(
         self,
@@ -147,14 +395,32 @@ class Cleanup(commands.Cog):
         ],
         *,
         subtract_invoking: bool = False,
+        channel_count: Optional[int] = None,
     ) -> None:
         """
         Sends a notification to the channel that a certain number of messages have been deleted.
+
+        ``channel_count`` is the number of channels the messages were deleted from,
+        when it isn't only the given channel.
         """
         if not channel.guild or await self.config.guild(channel.guild).notify():
             if subtract_invoking:
                 num -= 1
-            if num == 1:
+            if channel_count is not None:
+                if num == 0:
+                    msg = _("No messages were deleted.")
+                elif num == 1:
+                    msg = _("1 message was deleted in 1 channel.")
+                elif channel_count == 1:
+                    msg = _("{num} messages were deleted in 1 channel.").format(
+                        num=humanize_number(num)
+                    )
+                else:
+                    msg = _("{num} messages were deleted in {channels} channels.").format(
+                        num=humanize_number(num), channels=humanize_number(channel_count)
+                    )
+                await channel.send(msg, delete_after=5)
+            elif num == 1:
                 await channel.send(_("1 message was deleted."), delete_after=5)
             else:
                 await channel.send(
@@ -222,26 +488,23 @@ class Cleanup(commands.Cog):
             else:
                 return False
 
-        to_delete = await self.get_messages_for_deletion(
+        to_delete = self.iter_messages_for_deletion(
             channel=channel,
             number=number,
             check=check,
             before=ctx.message,
             delete_pinned=delete_pinned,
         )
-        to_delete.append(ctx.message)
 
-        reason = "{} ({}) deleted {} messages containing '{}' in channel #{}.".format(
+        reason = "{} ({}) deleted messages containing '{}' in channel #{}.".format(
             author,
             author.id,
-            humanize_number(len(to_delete), override_locale="en_us"),
             text,
             channel.id,
         )
-        log.info(reason)
 
-        await mass_purge(to_delete, channel, reason=reason)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        deleted = await self.purge_messages(ctx, to_delete, reason=reason)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command()
     @commands.guild_only()
@@ -288,31 +551,102 @@ class Cleanup(commands.Cog):
             else:
                 return False
 
-        to_delete = await self.get_messages_for_deletion(
+        to_delete = self.iter_messages_for_deletion(
             channel=channel,
             number=number,
             check=check,
             before=ctx.message,
             delete_pinned=delete_pinned,
         )
-        to_delete.append(ctx.message)
 
         reason = (
-            "{} ({}) deleted {} messages"
+            "{} ({}) deleted messages"
             " made by {} ({}) in channel #{}."
             "".format(
                 author,
                 author.id,
-                humanize_number(len(to_delete), override_locale="en_US"),
                 member or "???",
                 _id,
                 channel.name,
             )
         )
-        log.info(reason)
 
-        await mass_purge(to_delete, channel, reason=reason)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        deleted = await self.purge_messages(ctx, to_delete, reason=reason)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
+
+    @cleanup.command(name="server", aliases=["guild"])
+    @commands.guild_only()
+    @commands.mod_or_permissions(manage_messages=True)
+    @commands.bot_has_permissions(manage_messages=True)
+    async def cleanup_server(
+        self,
+        ctx: commands.Context,
+        user: Union[discord.Member, RawUserIdConverter],
+        delete_pinned: bool = False,
+    ):
+        """Delete the messages from a specified user in all channels of the server.
+
+        Only the messages from the last two weeks are deleted, in the channels
+        and active threads in which both you and the bot can manage messages.
+
+        Examples:
+        - `[p]cleanup server @Twentysix`
+        - `[p]cleanup server 123456789123456789 True`
+
+        **Arguments:**
+
+        - `<user>` The user whose messages are to be cleaned up.
+        - `<delete_pinned>` Whether to delete pinned messages or not. Defaults to False
+        """
+        member = None
+        if isinstance(user, discord.Member):
+            member = user
+            _id = member.id
+        else:
+            _id = user
+
+        # the command's permission check only applies to the current channel
+        channels = self.get_cleanable_channels(ctx.guild, ctx.author)
+        if not channels:
+            await ctx.send(_("There are no channels in which we can both manage messages."))
+            return
+        cont = await self.confirm(
+            ctx,
+            _(
+                "Are you sure you want to delete the messages from {user}"
+                " sent in the last two weeks in {channels} channels?"
+            ).format(user=member or _id, channels=humanize_number(len(channels))),
+        )
+        if not cont:
+            return
+
+        author = ctx.author
+
+        def check(m):
+            return m.author.id == _id
+
+        def reason(channel):
+            return "{} ({}) deleted messages made by {} ({}) in channel #{}.".format(
+                author, author.id, member or "???", _id, channel.name
+            )
+
+        deleted, failed = await self.purge_channels(
+            ctx, channels, check=check, reason=reason, delete_pinned=delete_pinned
+        )
+
+        with contextlib.suppress(discord.HTTPException):
+            await ctx.message.delete()
+        if failed:
+            await ctx.send(
+                _("I couldn't delete the messages in {channels} channels.").format(
+                    channels=humanize_number(len(failed))
+                )
+            )
+        await self.send_optional_notification(
+            sum(deleted.values()),
+            ctx.channel,
+            channel_count=sum(1 for num in deleted.values() if num),
+        )
 
     @cleanup.command()
     @commands.guild_only()
@@ -352,20 +686,18 @@ class Cleanup(commands.Cog):
         if after is None:
             raise commands.BadArgument
 
-        to_delete = await self.get_messages_for_deletion(
+        to_delete = self.iter_messages_for_deletion(
             channel=channel, number=None, after=after, delete_pinned=delete_pinned
         )
 
-        reason = "{} ({}) deleted {} messages in channel #{}.".format(
+        reason = "{} ({}) deleted messages in channel #{}.".format(
             author,
             author.id,
-            humanize_number(len(to_delete), override_locale="en_US"),
             channel.name,
         )
-        log.info(reason)
 
-        await mass_purge(to_delete, channel, reason=reason)
-        await self.send_optional_notification(len(to_delete), channel)
+        deleted = await self.purge_messages(ctx, to_delete, reason=reason, delete_invoking=False)
+        await self.send_optional_notification(deleted, channel)
 
     @cleanup.command()
     @commands.guild_only()
@@ -407,21 +739,18 @@ class Cleanup(commands.Cog):
         if before is None:
             raise commands.BadArgument
 
-        to_delete = await self.get_messages_for_deletion(
+        to_delete = self.iter_messages_for_deletion(
             channel=channel, number=number, before=before, delete_pinned=delete_pinned
         )
-        to_delete.append(ctx.message)
 
-        reason = "{} ({}) deleted {} messages in channel #{}.".format(
+        reason = "{} ({}) deleted messages in channel #{}.".format(
             author,
             author.id,
-            humanize_number(len(to_delete), override_locale="en_US"),
             channel.name,
         )
-        log.info(reason)
 
-        await mass_purge(to_delete, channel, reason=reason)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        deleted = await self.purge_messages(ctx, to_delete, reason=reason)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command()
     @commands.guild_only()
@@ -461,20 +790,17 @@ class Cleanup(commands.Cog):
             return await ctx.send(
                 _("Could not find a message with the ID of {id}.".format(id=two))
             )
-        to_delete = await self.get_messages_for_deletion(
+        to_delete = self.iter_messages_for_deletion(
             channel=channel, before=mtwo, after=mone, delete_pinned=delete_pinned
         )
-        to_delete.append(ctx.message)
-        reason = "{} ({}) deleted {} messages in channel #{}.".format(
+        reason = "{} ({}) deleted messages in channel #{}.".format(
             author,
             author.id,
-            humanize_number(len(to_delete), override_locale="en_US"),
             channel.name,
         )
-        log.info(reason)
 
-        await mass_purge(to_delete, channel, reason=reason)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        deleted = await self.purge_messages(ctx, to_delete, reason=reason)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command()
     @commands.guild_only()
@@ -502,18 +828,14 @@ class Cleanup(commands.Cog):
             if not cont:
                 return
 
-        to_delete = await self.get_messages_for_deletion(
+        to_delete = self.iter_messages_for_deletion(
             channel=channel, number=number, before=ctx.message, delete_pinned=delete_pinned
         )
-        to_delete.append(ctx.message)
 
-        reason = "{} ({}) deleted {} messages in channel #{}.".format(
-            author, author.id, len(to_delete), channel.name
-        )
-        log.info(reason)
+        reason = "{} ({}) deleted messages in channel #{}.".format(author, author.id, channel.name)
 
-        await mass_purge(to_delete, channel, reason=reason)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        deleted = await self.purge_messages(ctx, to_delete, reason=reason)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command(name="bot")
     @commands.guild_only()
@@ -578,29 +900,22 @@ class Cleanup(commands.Cog):
                 )
             return False
 
-        to_delete = await self.get_messages_for_deletion(
+        to_delete = self.iter_messages_for_deletion(
             channel=channel,
             number=number,
             check=check,
             before=ctx.message,
             delete_pinned=delete_pinned,
         )
-        to_delete.append(ctx.message)
 
-        reason = (
-            "{} ({}) deleted {}"
-            " command messages in channel #{}."
-            "".format(
-                author,
-                author.id,
-                humanize_number(len(to_delete), override_locale="en_US"),
-                channel.name,
-            )
+        reason = "{} ({}) deleted command messages in channel #{}.".format(
+            author,
+            author.id,
+            channel.name,
         )
-        log.info(reason)
 
-        await mass_purge(to_delete, channel, reason=reason)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        deleted = await self.purge_messages(ctx, to_delete, reason=reason)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command(name="self")
     @check_self_permissions()
@@ -658,36 +973,38 @@ class Cleanup(commands.Cog):
                 return True
             return False
 
-        to_delete = await self.get_messages_for_deletion(
+        to_delete = self.iter_messages_for_deletion(
             channel=channel,
             number=number,
             check=check,
             before=ctx.message,
             delete_pinned=delete_pinned,
         )
-        if can_mass_purge:
-            to_delete.append(ctx.message)
 
         if ctx.guild:
             channel_name = "channel " + channel.name
         else:
             channel_name = str(channel)
 
-        reason = "{} ({}) deleted {} messages sent by the bot in {}.".format(
-            author,
-            author.id,
-            humanize_number(len(to_delete), override_locale="en_US"),
-            channel_name,
-        )
-        log.info(reason)
-
         if can_mass_purge:
-            await mass_purge(to_delete, channel, reason=reason)
+            reason = "{} ({}) deleted messages sent by the bot in {}.".format(
+                author,
+                author.id,
+                channel_name,
+            )
+            deleted = await self.purge_messages(ctx, to_delete, reason=reason)
         else:
+            to_delete = [message async for message in to_delete]
+            reason = "{} ({}) deleted {} messages sent by the bot in {}.".format(
+                author,
+                author.id,
+                humanize_number(len(to_delete), override_locale="en_US"),
+                channel_name,
+            )
+            log.info(reason)
             await slow_deletion(to_delete)
-        await self.send_optional_notification(
-            len(to_delete), channel, subtract_invoking=can_mass_purge
-        )
+            deleted = len(to_delete)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=can_mass_purge)
 
     @cleanup.command(name="duplicates", aliases=["spam"])
     @commands.guild_only()
@@ -702,46 +1019,25 @@ class Cleanup(commands.Cog):
 
         - `<number>` The number of messages to check for duplicates. Must be a positive integer.
         """
-        msgs = []
-        spam = []
-
-        def check(m):
-            if m.attachments:
-                return False
-            c = (
-                m.author.id,
-                m.content,
-                [embed.to_dict() for embed in m.embeds],
-                [sticker.id for sticker in m.stickers],
+        if number > 100:
+            cont = await self.confirm(
+                ctx,
+                _("Are you sure you want to check {number} messages for duplicates?").format(
+                    number=humanize_number(number)
+                ),
             )
-            if c in msgs:
-                spam.append(m)
-                return True
-            else:
-                msgs.append(c)
-                return False
-
-        to_delete = await self.get_messages_for_deletion(
-            channel=ctx.channel, limit=number, check=check, before=ctx.message
-        )
-
-        if len(to_delete) > 100:
-            cont = await self.check_100_plus(ctx, len(to_delete))
             if not cont:
                 return
 
-        log.info(
-            "%s (%s) deleted %s spam messages in channel %s (%s).",
-            ctx.author,
-            ctx.author.id,
-            len(to_delete),
-            ctx.channel,
-            ctx.channel.id,
+        to_delete = self.iter_messages_for_deletion(
+            channel=ctx.channel, limit=number, check=_DuplicateFilter(), before=ctx.message
+        )
+        reason = "{} ({}) deleted duplicate messages in channel #{}.".format(
+            ctx.author, ctx.author.id, ctx.channel.name
         )
 
-        to_delete.append(ctx.message)
-        await mass_purge(to_delete, ctx.channel, reason="Duplicate message cleanup")
-        await self.send_optional_notification(len(to_delete), ctx.channel, subtract_invoking=True)
+        deleted = await self.purge_messages(ctx, to_delete, reason=reason)
+        await self.send_optional_notification(deleted, ctx.channel, subtract_invoking=True)
 
     @commands.group()
     @commands.admin_or_permissions(manage_messages=True)
@@ -1,11 +1,13 @@
+import asyncio
 import calendar
 import logging
 import random
+import time
 from collections import defaultdict, deque, namedtuple
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from math import ceil
-from typing import cast, Iterable, Literal
+from typing import cast, Dict, Iterable, Literal, Optional, Set, Tuple, Union
 
 import discord
 
@@ -96,6 +98,116 @@ def guild_only_check():
     return commands.check(pred)
 
 
+class CooldownCache:
+    """
+    In-memory copy of the members' ``next_payday`` and ``last_slot`` timestamps.
+
+    The entries are keyed by ``(guild_id, user_id)`` with ``guild_id`` being ``None``
+    for the global bank. Changes are saved to Config in batches, at most
+    ``flush_interval`` seconds after they're made or as soon as ``max_dirty``
+    entries are waiting to be saved, which limits how many changes can be lost in a crash.
+    Entries that weren't used for ``ttl`` seconds are evicted after they're saved.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        *,
+        flush_interval: float = 30,
+        max_dirty: int = 500,
+        ttl: float = 3600,
+    ) -> None:
+        self.config = config
+        self.flush_interval = flush_interval
+        self.max_dirty = max_dirty
+        self.ttl = ttl
+        self._entries: Dict[Tuple[Optional[int], int], dict] = {}
+        self._last_used: Dict[Tuple[Optional[int], int], float] = {}
+        self._dirty: Set[Tuple[Optional[int], int]] = set()
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def get_key(
+        member: Union[discord.Member, discord.User], global_bank: bool
+    ) -> Tuple[Optional[int], int]:
+        return (None if global_bank else member.guild.id, member.id)
+
+    def _get_group(self, key: Tuple[Optional[int], int]):
+        guild_id, user_id = key
+        if guild_id is None:
+            return self.config.user_from_id(user_id)
+        return self.config.member_from_ids(guild_id, user_id)
+
+    async def get(self, key: Tuple[Optional[int], int]) -> dict:
+        entry = self._entries.get(key)
+        if entry is None:
+            data = await self._get_group(key).all()
+            # the entry could have been loaded by someone else in the meantime
+            entry = self._entries.setdefault(key, data)
+        self._last_used[key] = time.monotonic()
+        return entry
+
+    async def set(self, key: Tuple[Optional[int], int], name: str, value: int) -> None:
+        entry = await self.get(key)
+        entry[name] = value
+        self._dirty.add(key)
+        if len(self._dirty) >= self.max_dirty:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Save the changed entries to Config and evict the unused ones."""
+        async with self._flush_lock:
+            dirty, self._dirty = self._dirty, set()
+            while dirty:
+                key = dirty.pop()
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                try:
+                    await self._get_group(key).set(entry.copy())
+                except BaseException:
+                    self._dirty |= dirty
+                    self._dirty.add(key)
+                    raise
+
+            cutoff = time.monotonic() - self.ttl
+            for key, last_used in list(self._last_used.items()):
+                if last_used < cutoff and key not in self._dirty:
+                    del self._last_used[key]
+                    del self._entries[key]
+
+    async def forget_user(self, user_id: int) -> None:
+        """Drop all entries of the given user without saving them."""
+        async with self._flush_lock:
+            for key in [key for key in self._entries if key[1] == user_id]:
+                del self._entries[key]
+                self._last_used.pop(key, None)
+            self._dirty = {key for key in self._dirty if key[1] != user_id}
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to save the payday and slot cooldowns.")
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+
 class SetParser:
     def __init__(self, argument):
         allowed = ("+", "-")
@@ -156,6 +268,13 @@ class Economy(commands.Cog):
         self.config.register_user(**self.default_user_settings)
         self.config.register_role(**self.default_role_settings)
         self.slot_register = defaultdict(dict)
+        self.cooldowns = CooldownCache(self.config)
+
+    async def cog_load(self) -> None:
+        self.cooldowns.start()
+
+    async def cog_unload(self) -> None:
+        await self.cooldowns.close()
 
     async def red_delete_data_for_user(
         self,
@@ -166,6 +285,7 @@ class Economy(commands.Cog):
         if requester != "discord_deleted_user":
             return
 
+        await self.cooldowns.forget_user(user_id)
         await self.config.user_from_id(user_id).clear()
 
         all_members = await self.config.all_members()
@@ -298,11 +418,12 @@ class Economy(commands.Cog):
 
         cur_time = calendar.timegm(ctx.message.created_at.utctimetuple())
         credits_name = await bank.get_currency_name(ctx.guild)
-        if await bank.is_global():  # Role payouts will not be used
+        global_bank = await bank.is_global()
+        cooldown_key = self.cooldowns.get_key(author, global_bank)
+        cooldowns = await self.cooldowns.get(cooldown_key)
+        if global_bank:  # Role payouts will not be used
             # Gets the latest time the user used the command successfully and adds the global payday time
-            next_payday = (
-                await self.config.user(author).next_payday() + await self.config.PAYDAY_TIME()
-            )
+            next_payday = cooldowns["next_payday"] + await self.config.PAYDAY_TIME()
             if cur_time >= next_payday:
                 try:
                     await bank.deposit_credits(author, await self.config.PAYDAY_CREDITS())
@@ -319,7 +440,7 @@ class Economy(commands.Cog):
                     )
                     return
                 # Sets the current time as the latest payday
-                await self.config.user(author).next_payday.set(cur_time)
+                await self.cooldowns.set(cooldown_key, "next_payday", cur_time)
 
                 pos = await bank.get_leaderboard_position(author)
                 await ctx.send(
@@ -348,10 +469,7 @@ class Economy(commands.Cog):
                 )
         else:
             # Gets the users latest successfully payday and adds the guilds payday time
-            next_payday = (
-                await self.config.member(author).next_payday()
-                + await self.config.guild(guild).PAYDAY_TIME()
-            )
+            next_payday = cooldowns["next_payday"] + await self.config.guild(guild).PAYDAY_TIME()
             if cur_time >= next_payday:
                 credit_amount = await self.config.guild(guild).PAYDAY_CREDITS()
                 for role in author.roles:
@@ -378,7 +496,7 @@ class Economy(commands.Cog):
                 # Sets the latest payday time to the current time
                 next_payday = cur_time
 
-                await self.config.member(author).next_payday.set(next_payday)
+                await self.cooldowns.set(cooldown_key, "next_payday", next_payday)
                 pos = await bank.get_leaderboard_position(author)
                 await ctx.send(
                     _(
@@ -546,10 +664,12 @@ class Economy(commands.Cog):
         author = ctx.author
         guild = ctx.guild
         channel = ctx.channel
-        if await bank.is_global():
+        global_bank = await bank.is_global()
+        cooldown_key = self.cooldowns.get_key(author, global_bank)
+        last_slot = (await self.cooldowns.get(cooldown_key))["last_slot"]
+        if global_bank:
             valid_bid = await self.config.SLOT_MIN() <= bid <= await self.config.SLOT_MAX()
             slot_time = await self.config.SLOT_TIME()
-            last_slot = await self.config.user(author).last_slot()
         else:
             valid_bid = (
                 await self.config.guild(guild).SLOT_MIN()
@@ -557,7 +677,6 @@ class Economy(commands.Cog):
                 <= await self.config.guild(guild).SLOT_MAX()
             )
             slot_time = await self.config.guild(guild).SLOT_TIME()
-            last_slot = await self.config.member(author).last_slot()
         now = calendar.timegm(ctx.message.created_at.utctimetuple())
 
         if (now - last_slot) < slot_time:
@@ -569,10 +688,7 @@ class Economy(commands.Cog):
         if not await bank.can_spend(author, bid):
             await ctx.send(_("You ain't got enough money, friend."))
             return
-        if await bank.is_global():
-            await self.config.user(author).last_slot.set(now)
-        else:
-            await self.config.member(author).last_slot.set(now)
+        await self.cooldowns.set(cooldown_key, "last_slot", now)
         await self.slot_machine(author, channel, bid)
 
     @staticmethod
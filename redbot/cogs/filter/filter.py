@@ -1,8 +1,10 @@
 import asyncio
 import discord
-import re
+import logging
+import time
+from collections import defaultdict
 from datetime import timezone
-from typing import Union, Set, Literal, Optional
+from typing import Dict, Iterable, Union, Set, Literal, Optional, Tuple
 
 from redbot.core import Config, modlog, commands
 from redbot.core.bot import Red
@@ -11,7 +13,15 @@ from redbot.core.utils.predicates import MessagePredicate
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import pagify, humanize_list
 
+from .matcher import WordMatcher
+
 _ = Translator("Filter", __file__)
+log = logging.getLogger("red.filter")
+
+#: How often (in seconds) the changed filter counts are saved to Config.
+FILTER_COUNT_FLUSH_INTERVAL = 60
+#: Width (in seconds) of the buckets that the filter counts are grouped in by their reset time.
+FILTER_COUNT_BUCKET = 60
 
 
 @cog_i18n(_)
@@ -33,13 +43,23 @@ class Filter(commands.Cog):
             "filterban_time": 0,
             "filter_names": False,
             "filter_default_name": "John Doe",
+            "filter_normalize": False,
         }
         default_member_settings = {"filter_count": 0, "next_reset_time": 0}
         default_channel_settings = {"filter": []}
         self.config.register_guild(**default_guild_settings)
         self.config.register_member(**default_member_settings)
         self.config.register_channel(**default_channel_settings)
-        self.pattern_cache = {}
+        self.matcher_cache: Dict[Tuple[int, Optional[int]], WordMatcher] = {}
+        # guild settings without the filter list, which is only used through the matchers
+        self.settings_cache: Dict[int, dict] = {}
+        # The members' filter counts of the current autoban timeframe, keyed by
+        # (guild_id, member_id) and saved to Config lazily. Each count is in the bucket
+        # of its reset time, so that the expired counts can be dropped without scanning all of them.
+        self._filter_counts: Dict[Tuple[int, int], dict] = {}
+        self._filter_count_buckets: Dict[int, Set[Tuple[int, int]]] = defaultdict(set)
+        self._dirty_filter_counts: Set[Tuple[int, int]] = set()
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def red_delete_data_for_user(
         self,
@@ -50,6 +70,9 @@ class Filter(commands.Cog):
         if requester != "discord_deleted_user":
             return
 
+        for key in [key for key in self._filter_counts if key[1] == user_id]:
+            self._dirty_filter_counts.discard(key)
+            del self._filter_counts[key]
         all_members = await self.config.all_members()
 
         async for guild_id, guild_data in AsyncIter(all_members.items(), steps=100):
@@ -58,6 +81,12 @@ class Filter(commands.Cog):
 
     async def cog_load(self) -> None:
         await self.register_casetypes()
+        self._flush_task = asyncio.create_task(self._flush_filter_counts_loop())
+
+    async def cog_unload(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        await self.flush_filter_counts()
 
     @staticmethod
     async def register_casetypes() -> None:
@@ -103,6 +132,7 @@ class Filter(commands.Cog):
         """
         guild = ctx.guild
         await self.config.guild(guild).filter_default_name.set(name)
+        self.settings_cache.pop(guild.id, None)
         await ctx.send(_("The name to use on filtered names has been set."))
 
     @filterset.command(name="ban")
@@ -135,11 +165,13 @@ class Filter(commands.Cog):
             async with self.config.guild(ctx.guild).all() as guild_data:
                 guild_data["filterban_count"] = 0
                 guild_data["filterban_time"] = 0
+            self.settings_cache.pop(ctx.guild.id, None)
             await ctx.send(_("Autoban disabled."))
         else:
             async with self.config.guild(ctx.guild).all() as guild_data:
                 guild_data["filterban_count"] = count
                 guild_data["filterban_time"] = timeframe
+            self.settings_cache.pop(ctx.guild.id, None)
             await ctx.send(_("Count and time have been set."))
 
     @commands.group(name="filter")
@@ -274,7 +306,6 @@ class Filter(commands.Cog):
         """
         added = await self.add_to_filter(channel, words)
         if added:
-            self.invalidate_cache(ctx.guild, ctx.channel)
             await ctx.send(_("Words added to filter."))
         else:
             await ctx.send(_("Words already in the filter."))
@@ -304,7 +335,6 @@ class Filter(commands.Cog):
         removed = await self.remove_from_filter(channel, words)
         if removed:
             await ctx.send(_("Words removed from filter."))
-            self.invalidate_cache(ctx.guild, ctx.channel)
         else:
             await ctx.send(_("Those words weren't in the filter."))
 
@@ -325,7 +355,6 @@ class Filter(commands.Cog):
         server = ctx.guild
         added = await self.add_to_filter(server, words)
         if added:
-            self.invalidate_cache(ctx.guild)
             await ctx.send(_("Words successfully added to filter."))
         else:
             await ctx.send(_("Those words were already in the filter."))
@@ -347,7 +376,6 @@ class Filter(commands.Cog):
         server = ctx.guild
         removed = await self.remove_from_filter(server, words)
         if removed:
-            self.invalidate_cache(ctx.guild)
             await ctx.send(_("Words successfully removed from filter."))
         else:
             await ctx.send(_("Those words weren't in the filter."))
@@ -363,11 +391,33 @@ class Filter(commands.Cog):
         async with self.config.guild(guild).all() as guild_data:
             current_setting = guild_data["filter_names"]
             guild_data["filter_names"] = not current_setting
+        self.settings_cache.pop(guild.id, None)
         if current_setting:
             await ctx.send(_("Names and nicknames will no longer be filtered."))
         else:
             await ctx.send(_("Names and nicknames will now be filtered."))
 
+    @filterset.command(name="normalize")
+    async def filter_normalize(self, ctx: commands.Context):
+        """Toggle normalization of messages and names before filtering.
+
+        With normalization enabled, filtered words also match when they're written
+        with diacritics, fullwidth letters, or lookalike letters from other alphabets.
+
+        This is disabled by default.
+        """
+        guild = ctx.guild
+
+        async with self.config.guild(guild).all() as guild_data:
+            current_setting = guild_data["filter_normalize"]
+            guild_data["filter_normalize"] = not current_setting
+        self.settings_cache.pop(guild.id, None)
+        self.invalidate_cache(guild)
+        if current_setting:
+            await ctx.send(_("Messages and names will no longer be normalized."))
+        else:
+            await ctx.send(_("Messages and names will now be normalized."))
+
     def invalidate_cache(
         self,
         guild: discord.Guild,
@@ -380,12 +430,97 @@ class Filter(commands.Cog):
             ]
         ] = None,
     ) -> None:
-        """Invalidate a cached pattern"""
-        self.pattern_cache.pop((guild.id, channel and channel.id), None)
+        """Invalidate a cached matcher"""
+        self.matcher_cache.pop((guild.id, channel and channel.id), None)
         if channel is None:
-            for keyset in list(self.pattern_cache.keys()):  # cast needed, no remove
+            for keyset in list(self.matcher_cache.keys()):  # cast needed, no remove
                 if guild.id == keyset[0]:
-                    self.pattern_cache.pop(keyset, None)
+                    self.matcher_cache.pop(keyset, None)
+
+    async def get_guild_settings(self, guild: discord.Guild) -> dict:
+        """Get the guild's settings, except for the filter list."""
+        settings = self.settings_cache.get(guild.id)
+        if settings is None:
+            settings = await self.config.guild(guild).all()
+            del settings["filter"]
+            self.settings_cache[guild.id] = settings
+        return settings
+
+    async def _get_filter_count(self, guild_id: int, member_id: int) -> dict:
+        key = (guild_id, member_id)
+        filter_count = self._filter_counts.get(key)
+        if filter_count is None:
+            data = await self.config.member_from_ids(guild_id, member_id).all()
+            filter_count = self._filter_counts.setdefault(key, data)
+            self._filter_count_buckets[
+                int(filter_count["next_reset_time"] // FILTER_COUNT_BUCKET)
+            ].add(key)
+        return filter_count
+
+    def _update_filter_count(
+        self, guild_id: int, member_id: int, filter_count: dict, *, count: int, next_reset_time
+    ) -> None:
+        key = (guild_id, member_id)
+        old_bucket = int(filter_count["next_reset_time"] // FILTER_COUNT_BUCKET)
+        new_bucket = int(next_reset_time // FILTER_COUNT_BUCKET)
+        if old_bucket != new_bucket:
+            self._filter_count_buckets[old_bucket].discard(key)
+            self._filter_count_buckets[new_bucket].add(key)
+        filter_count["filter_count"] = count
+        filter_count["next_reset_time"] = next_reset_time
+        self._dirty_filter_counts.add(key)
+
+    async def flush_filter_counts(self) -> None:
+        """Save the changed filter counts to Config and drop the expired ones."""
+        dirty, self._dirty_filter_counts = self._dirty_filter_counts, set()
+        while dirty:
+            key = dirty.pop()
+            filter_count = self._filter_counts.get(key)
+            if filter_count is None:
+                continue
+            try:
+                await self.config.member_from_ids(*key).set(filter_count.copy())
+            except BaseException:
+                self._dirty_filter_counts |= dirty
+                self._dirty_filter_counts.add(key)
+                raise
+
+        current_bucket = int(time.time() // FILTER_COUNT_BUCKET)
+        for bucket in [bucket for bucket in self._filter_count_buckets if bucket < current_bucket]:
+            keys = self._filter_count_buckets.pop(bucket)
+            for key in keys:
+                if key in self._dirty_filter_counts:
+                    self._filter_count_buckets[current_bucket].add(key)
+                else:
+                    self._filter_counts.pop(key, None)
+
+    async def _flush_filter_counts_loop(self) -> None:
+        while True:
+            await asyncio.sleep(FILTER_COUNT_FLUSH_INTERVAL)
+            try:
+                await self.flush_filter_counts()
+            except Exception:
+                log.exception("Failed to save the filter counts.")
+
+    def _get_cached_matchers(
+        self,
+        server_or_channel: Union[
+            discord.Guild,
+            discord.TextChannel,
+            discord.VoiceChannel,
+            discord.StageChannel,
+            discord.ForumChannel,
+        ],
+    ) -> Iterable[WordMatcher]:
+        """Get the cached matchers that use the filter list of the given server or channel."""
+        if isinstance(server_or_channel, discord.Guild):
+            return [
+                matcher
+                for (guild_id, _channel_id), matcher in self.matcher_cache.items()
+                if guild_id == server_or_channel.id
+            ]
+        matcher = self.matcher_cache.get((server_or_channel.guild.id, server_or_channel.id))
+        return [matcher] if matcher is not None else []
 
     async def add_to_filter(
         self,
@@ -398,22 +533,25 @@ class Filter(commands.Cog):
         ],
         words: list,
     ) -> bool:
-        added = False
+        added = []
         if isinstance(server_or_channel, discord.Guild):
             async with self.config.guild(server_or_channel).filter() as cur_list:
                 for w in words:
                     if w.lower() not in cur_list and w:
                         cur_list.append(w.lower())
-                        added = True
+                        added.append(w.lower())
 
         else:
             async with self.config.channel(server_or_channel).filter() as cur_list:
                 for w in words:
                     if w.lower() not in cur_list and w:
                         cur_list.append(w.lower())
-                        added = True
+                        added.append(w.lower())
 
-        return added
+        for matcher in self._get_cached_matchers(server_or_channel):
+            for w in added:
+                matcher.add(w)
+        return bool(added)
 
     async def remove_from_filter(
         self,
@@ -426,22 +564,25 @@ class Filter(commands.Cog):
         ],
         words: list,
     ) -> bool:
-        removed = False
+        removed = []
         if isinstance(server_or_channel, discord.Guild):
             async with self.config.guild(server_or_channel).filter() as cur_list:
                 for w in words:
                     if w.lower() in cur_list:
                         cur_list.remove(w.lower())
-                        removed = True
+                        removed.append(w.lower())
 
         else:
             async with self.config.channel(server_or_channel).filter() as cur_list:
                 for w in words:
                     if w.lower() in cur_list:
                         cur_list.remove(w.lower())
-                        removed = True
+                        removed.append(w.lower())
 
-        return removed
+        for matcher in self._get_cached_matchers(server_or_channel):
+            for w in removed:
+                matcher.remove(w)
+        return bool(removed)
 
     async def filter_hits(
         self,
@@ -464,51 +605,31 @@ class Filter(commands.Cog):
             else:
                 channel = server_or_channel
 
-        hits: Set[str] = set()
-
         try:
-            pattern = self.pattern_cache[(guild.id, channel and channel.id)]
+            matcher = self.matcher_cache[(guild.id, channel and channel.id)]
         except KeyError:
-            word_list = set(await self.config.guild(guild).filter())
+            matcher = WordMatcher(
+                await self.config.guild(guild).filter(),
+                normalize=(await self.get_guild_settings(guild))["filter_normalize"],
+            )
             if channel:
-                word_list |= set(await self.config.channel(channel).filter())
-
-            if word_list:
-                pattern = re.compile(
-                    "|".join(rf"\b{re.escape(w)}\b" for w in word_list), flags=re.I
-                )
-            else:
-                pattern = None
+                for word in await self.config.channel(channel).filter():
+                    matcher.add(word)
 
-            self.pattern_cache[(guild.id, channel and channel.id)] = pattern
+            matcher = self.matcher_cache.setdefault((guild.id, channel and channel.id), matcher)
 
-        if pattern:
-            hits |= set(pattern.findall(text))
-        return hits
+        return matcher.find(text)
 
     async def check_filter(self, message: discord.Message):
         guild = message.guild
         author = message.author
-        guild_data = await self.config.guild(guild).all()
-        member_data = await self.config.member(author).all()
-        filter_count = guild_data["filterban_count"]
-        filter_time = guild_data["filterban_time"]
-        user_count = member_data["filter_count"]
-        next_reset_time = member_data["next_reset_time"]
-        created_at = message.created_at
-
-        if filter_count > 0 and filter_time > 0:
-            if created_at.timestamp() >= next_reset_time:
-                next_reset_time = created_at.timestamp() + filter_time
-                async with self.config.member(author).all() as member_data:
-                    member_data["next_reset_time"] = next_reset_time
-                    if user_count > 0:
-                        user_count = 0
-                        member_data["filter_count"] = user_count
-
         hits = await self.filter_hits(message.content, message.channel)
 
         if hits:
+            guild_data = await self.get_guild_settings(guild)
+            filter_count = guild_data["filterban_count"]
+            filter_time = guild_data["filterban_time"]
+            created_at = message.created_at
             # modlog doesn't accept PartialMessageable
             channel = (
                 None
@@ -536,9 +657,22 @@ class Filter(commands.Cog):
             else:
                 self.bot.dispatch("filter_message_delete", message, hits)
                 if filter_count > 0 and filter_time > 0:
+                    member_count = await self._get_filter_count(guild.id, author.id)
+                    user_count = member_count["filter_count"]
+                    next_reset_time = member_count["next_reset_time"]
+                    # the timeframe starts with the first filtered message after the last one ended
+                    if created_at.timestamp() >= next_reset_time:
+                        user_count = 0
+                        next_reset_time = created_at.timestamp() + filter_time
                     user_count += 1
-                    await self.config.member(author).filter_count.set(user_count)
-                    if user_count >= filter_count and created_at.timestamp() < next_reset_time:
+                    self._update_filter_count(
+                        guild.id,
+                        author.id,
+                        member_count,
+                        count=user_count,
+                        next_reset_time=next_reset_time,
+                    )
+                    if user_count >= filter_count:
                         reason = _("Autoban (too many filtered messages.)")
                         try:
                             await guild.ban(author, reason=reason)
@@ -601,7 +735,7 @@ class Filter(commands.Cog):
             return  # Discord Hierarchy applies to nicks
         if await self.bot.is_automod_immune(member):
             return
-        guild_data = await self.config.guild(member.guild).all()
+        guild_data = await self.get_guild_settings(member.guild)
         if not guild_data["filter_names"]:
             return
 
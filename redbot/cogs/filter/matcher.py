@@ -0,0 +1,232 @@
+"""
+Matching of filtered words and phrases with an Aho-Corasick automaton.
+
+A single pass over a message finds all filtered words in it,
+so the matching time doesn't depend on the number of filtered words.
+"""
+import functools
+import unicodedata
+from collections import deque
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+__all__ = ("WordMatcher", "normalize_text")
+
+# Letters from other scripts that look like latin letters. The table isn't exhaustive,
+# it covers the lookalikes that are commonly used to get around word filters.
+_HOMOGLYPHS = str.maketrans(
+    {
+        # Cyrillic
+        "а": "a",
+        "в": "b",
+        "е": "e",
+        "ё": "e",
+        "з": "3",
+        "і": "i",
+        "ї": "i",
+        "ј": "j",
+        "к": "k",
+        "м": "m",
+        "н": "h",
+        "о": "o",
+        "р": "p",
+        "с": "c",
+        "т": "t",
+        "у": "y",
+        "х": "x",
+        "ѕ": "s",
+        "ԁ": "d",
+        "ԛ": "q",
+        "ԝ": "w",
+        # Greek
+        "α": "a",
+        "β": "b",
+        "ε": "e",
+        "η": "n",
+        "ι": "i",
+        "κ": "k",
+        "ν": "v",
+        "ο": "o",
+        "ρ": "p",
+        "τ": "t",
+        "υ": "u",
+        "χ": "x",
+    }
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_char(char: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", char)
+    return "".join(c for c in decomposed.casefold() if not unicodedata.combining(c)).translate(
+        _HOMOGLYPHS
+    )
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize the given text for matching.
+
+    Compatibility characters (such as fullwidth letters) are replaced with their
+    canonical forms, diacritics are removed, the text is case folded
+    and common homoglyphs are replaced with the latin letters they look like.
+    """
+    return "".join(map(_normalize_char, text))
+
+
+def _is_word_char(char: str) -> bool:
+    # same as `\w` in `re`
+    return char.isalnum() or char == "_"
+
+
+class WordMatcher:
+    """
+    Case-insensitive matcher of whole words and phrases.
+
+    A word only matches when there's a word boundary (``\\b`` in `re`)
+    on both sides of it.
+
+    Words can be added and removed at any time. They're counted,
+    so a word that was added twice needs to be removed twice to no longer match.
+
+    Parameters
+    ----------
+    words : Iterable[str]
+        The words to match.
+    normalize : bool
+        Whether the words and the matched text should be normalized with `normalize_text()`.
+    """
+
+    def __init__(self, words: Iterable[str] = (), *, normalize: bool = False) -> None:
+        self.normalize = normalize
+        self._counts: Dict[str, int] = {}
+        # the trie, with the root at index 0
+        self._children: List[Dict[str, int]] = [{}]
+        self._word_lengths: List[int] = [0]
+        # failure links and the lengths of all words ending at each node,
+        # computed lazily after the trie changes
+        self._fail: List[int] = []
+        self._outputs: List[Tuple[int, ...]] = []
+        self._dirty = True
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, word: str) -> bool:
+        return self._prepare_word(word) in self._counts
+
+    def _prepare_word(self, word: str) -> str:
+        return normalize_text(word) if self.normalize else word.lower()
+
+    def add(self, word: str) -> None:
+        """Add a word to the matcher."""
+        word = self._prepare_word(word)
+        if not word:
+            return
+        count = self._counts.get(word, 0)
+        self._counts[word] = count + 1
+        if count:
+            return
+        node = 0
+        for char in word:
+            next_node = self._children[node].get(char)
+            if next_node is None:
+                next_node = len(self._children)
+                self._children[node][char] = next_node
+                self._children.append({})
+                self._word_lengths.append(0)
+            node = next_node
+        self._word_lengths[node] = len(word)
+        self._dirty = True
+
+    def remove(self, word: str) -> bool:
+        """Remove a word from the matcher, returning whether it was in it."""
+        word = self._prepare_word(word)
+        count = self._counts.get(word)
+        if count is None:
+            return False
+        if count > 1:
+            self._counts[word] = count - 1
+            return True
+        del self._counts[word]
+        # the nodes are kept, they don't affect the matching without a word ending in them
+        node = 0
+        for char in word:
+            node = self._children[node][char]
+        self._word_lengths[node] = 0
+        self._dirty = True
+        return True
+
+    def _build(self) -> None:
+        children = self._children
+        fail = [0] * len(children)
+        outputs: List[Tuple[int, ...]] = [()] * len(children)
+        queue = deque(children[0].values())
+        for node in queue:
+            outputs[node] = (self._word_lengths[node],) if self._word_lengths[node] else ()
+        while queue:
+            node = queue.popleft()
+            for char, child in children[node].items():
+                state = fail[node]
+                while state and char not in children[state]:
+                    state = fail[state]
+                fail[child] = children[state].get(char, 0)
+                own = (self._word_lengths[child],) if self._word_lengths[child] else ()
+                outputs[child] = own + outputs[fail[child]]
+                queue.append(child)
+        self._fail = fail
+        self._outputs = outputs
+        self._dirty = False
+
+    def _prepare_text(self, text: str) -> Tuple[str, Sequence[int]]:
+        if self.normalize:
+            chars = []
+            positions = []
+            for idx, char in enumerate(text):
+                normalized = _normalize_char(char)
+                chars.append(normalized)
+                positions.extend([idx] * len(normalized))
+            return "".join(chars), positions
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered, range(len(text))
+        # some characters lowercase to multiple characters (e.g. "İ")
+        return "".join(c if len(c.lower()) != 1 else c.lower() for c in text), range(len(text))
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Find the words in the given text.
+
+        Returns
+        -------
+        Set[str]
+            The parts of the text that matched any of the words.
+        """
+        if not self._counts:
+            return set()
+        if self._dirty:
+            self._build()
+        prepared, positions = self._prepare_text(text)
+        children = self._children
+        fail = self._fail
+        outputs = self._outputs
+        length = len(prepared)
+        is_word = [_is_word_char(char) for char in prepared]
+
+        def is_boundary(idx: int) -> bool:
+            before = idx > 0 and is_word[idx - 1]
+            after = idx < length and is_word[idx]
+            return before != after
+
+        hits: Set[str] = set()
+        state = 0
+        for end, char in enumerate(prepared, 1):
+            while state and char not in children[state]:
+                state = fail[state]
+            state = children[state].get(char, 0)
+            for word_length in outputs[state]:
+                start = end - word_length
+                if is_boundary(start) and is_boundary(end):
+                    hits.add(text[positions[start] : positions[end - 1] + 1])
+        return hits
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional
 
 import discord
 from redbot.core import Config, commands
 from redbot.core.bot import Red
+from .duplicates import DuplicateDetector
+from .name_history import NameHistory
 
 
 class MixinMeta(ABC):
@@ -16,7 +18,11 @@ class MixinMeta(ABC):
     def __init__(self, *_args):
         self.config: Config
         self.bot: Red
-        self.cache: dict
+        self.delete_repeats_cache: Dict[int, int]
+        self.duplicate_detector: DuplicateDetector
+        self.name_history: NameHistory
+        self.track_all_names_cache: Optional[bool]
+        self.track_nicknames_cache: Dict[int, bool]
 
     @staticmethod
     @abstractmethod
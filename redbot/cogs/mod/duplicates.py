@@ -0,0 +1,91 @@
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Tuple
+
+
+class DuplicateDetectorStats(NamedTuple):
+    authors: int
+    checks: int
+    duplicates: int
+    evictions: int
+
+
+class DuplicateDetector:
+    """
+    Detects authors repeating the same message over and over.
+
+    Only the hash of the author's last message and the number of times
+    it was sent in a row are kept for each author, so the memory used
+    doesn't depend on the length of the messages or the number of repeats.
+
+    Authors that haven't sent a message in ``ttl`` seconds are forgotten
+    and at most ``max_authors`` authors are tracked at once,
+    the least recently active authors are forgotten first.
+    """
+
+    def __init__(self, *, max_authors: int = 100_000, ttl: float = 3600) -> None:
+        self.max_authors = max_authors
+        self.ttl = ttl
+        # (guild ID, author ID) -> [last message's hash, times sent in a row, last activity],
+        # ordered from the least to the most recently active author
+        self._authors: OrderedDict[Tuple[int, int], List] = OrderedDict()
+        self._checks = 0
+        self._duplicates = 0
+        self._evictions = 0
+
+    def check(self, guild_id: int, author_id: int, content: str, repeats: int) -> bool:
+        """
+        Record the author's message and return whether it's been sent
+        at least ``repeats`` times in a row.
+        """
+        now = time.monotonic()
+        key = (guild_id, author_id)
+        content_hash = hash(content)
+        self._checks += 1
+
+        entry = self._authors.get(key)
+        if entry is None:
+            entry = self._authors[key] = [content_hash, 1, now]
+        else:
+            self._authors.move_to_end(key)
+            if entry[0] == content_hash:
+                entry[1] += 1
+            else:
+                entry[0] = content_hash
+                entry[1] = 1
+            entry[2] = now
+        self._evict(now)
+
+        if entry[1] >= repeats:
+            self._duplicates += 1
+            return True
+        return False
+
+    def _evict(self, now: float) -> None:
+        authors = self._authors
+        expired = now - self.ttl
+        while authors:
+            key, entry = next(iter(authors.items()))
+            if len(authors) <= self.max_authors and entry[2] > expired:
+                break
+            del authors[key]
+            self._evictions += 1
+
+    def clear_guild(self, guild_id: int) -> None:
+        """Forget all authors in the guild."""
+        for key in [key for key in self._authors if key[0] == guild_id]:
+            del self._authors[key]
+
+    def forget_user(self, user_id: int) -> None:
+        """Forget the user in all guilds."""
+        for key in [key for key in self._authors if key[1] == user_id]:
+            del self._authors[key]
+
+    def stats(self) -> DuplicateDetectorStats:
+        """Get the detector's statistics."""
+        return DuplicateDetectorStats(
+            authors=len(self._authors),
+            checks=self._checks,
+            duplicates=self._duplicates,
+            evictions=self._evictions,
+        )
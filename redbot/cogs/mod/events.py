@@ -1,7 +1,6 @@
 import logging
 from datetime import timezone
-from collections import defaultdict, deque
-from typing import List, Optional
+from typing import Optional
 
 import discord
 from redbot.core import i18n, modlog, commands
@@ -22,19 +21,17 @@ class Events(MixinMeta):
         guild = message.guild
         author = message.author
 
-        guild_cache = self.cache.get(guild.id, None)
-        if guild_cache is None:
+        repeats = self.delete_repeats_cache.get(guild.id)
+        if repeats is None:
             repeats = await self.config.guild(guild).delete_repeats()
-            if repeats == -1:
-                return False
-            guild_cache = self.cache[guild.id] = defaultdict(lambda: deque(maxlen=repeats))
+            self.delete_repeats_cache[guild.id] = repeats
+        if repeats == -1:
+            return False
 
         if not message.content:
             return False
 
-        guild_cache[author].append(message.content)
-        msgs = guild_cache[author]
-        if len(msgs) == msgs.maxlen and len(set(msgs)) == 1:
+        if self.duplicate_detector.check(guild.id, author.id, message.content, repeats):
             try:
                 await message.delete()
                 return True
@@ -159,31 +156,29 @@ class Events(MixinMeta):
         if not deleted:
             await self.check_mention_spam(message)
 
-    @staticmethod
-    def _update_past_names(name: str, name_list: List[Optional[str]]) -> None:
-        while None in name_list:  # clean out null entries from a bug
-            name_list.remove(None)
-        if name in name_list:
-            # Ensure order is maintained without duplicates occurring
-            name_list.remove(name)
-        name_list.append(name)
-        while len(name_list) > 20:
-            name_list.pop(0)
+    async def _is_tracking_names(self, guild: Optional[discord.Guild] = None) -> bool:
+        if self.track_all_names_cache is None:
+            self.track_all_names_cache = await self.config.track_all_names()
+        if not self.track_all_names_cache:
+            return False
+        if guild is None:
+            return True
+        track_nicknames = self.track_nicknames_cache.get(guild.id)
+        if track_nicknames is None:
+            track_nicknames = await self.config.guild(guild).track_nicknames()
+            self.track_nicknames_cache[guild.id] = track_nicknames
+        return track_nicknames
 
     @commands.Cog.listener()
     async def on_user_update(self, before: discord.User, after: discord.User):
         if before.name != after.name:
-            track_all_names = await self.config.track_all_names()
-            if not track_all_names:
+            if not await self._is_tracking_names():
                 return
-            async with self.config.user(before).past_names() as name_list:
-                self._update_past_names(before.name, name_list)
+            await self.name_history.add_name(before.id, "past_names", before.name)
         if before.display_name != after.display_name:
-            track_all_names = await self.config.track_all_names()
-            if not track_all_names:
+            if not await self._is_tracking_names():
                 return
-            async with self.config.user(before).past_display_names() as name_list:
-                self._update_past_names(before.display_name, name_list)
+            await self.name_history.add_name(before.id, "past_display_names", before.display_name)
 
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
@@ -191,9 +186,6 @@ class Events(MixinMeta):
             guild = after.guild
             if (not guild) or await self.bot.cog_disabled_in_guild(self, guild):
                 return
-            track_all_names = await self.config.track_all_names()
-            track_nicknames = await self.config.guild(guild).track_nicknames()
-            if (not track_all_names) or (not track_nicknames):
+            if not await self._is_tracking_names(guild):
                 return
-            async with self.config.member(before).past_nicks() as nick_list:
-                self._update_past_names(before.nick, nick_list)
+            await self.name_history.add_nick(guild.id, before.id, before.nick)
@@ -1,13 +1,13 @@
-import asyncio
 import contextlib
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 
 import discord
-from redbot.core import commands, i18n, modlog
+from redbot.core import commands, i18n, modlog, scheduler
 from redbot.core.commands import RawUserIdConverter
-from redbot.core.utils import AsyncIter
+from redbot.core.utils import AsyncIter, bounded_gather
 from redbot.core.utils.chat_formatting import (
     pagify,
     humanize_number,
@@ -15,13 +15,22 @@ from redbot.core.utils.chat_formatting import (
     humanize_list,
     format_perms_list,
 )
-from redbot.core.utils.mod import get_audit_reason
+from redbot.core.utils.mod import get_audit_reason, mass_ban
 from .abc import MixinMeta
 from .utils import is_allowed_by_hierarchy
 
 log = logging.getLogger("red.mod")
 _ = i18n.Translator("Mod", __file__)
 
+#: Time after which the unban of an expired tempban is retried when it couldn't be done.
+TEMPBAN_RETRY_DELAY = timedelta(seconds=60)
+#: Maximum number of requests made at once by massban.
+MASSBAN_CONCURRENCY = 5
+#: Minimum number of users to ban for massban to show its progress.
+MASSBAN_PROGRESS_THRESHOLD = 50
+#: Minimum time (in seconds) between updates of massban's progress message.
+MASSBAN_PROGRESS_INTERVAL = 5
+
 
 class KickBanMixin(MixinMeta):
     """
@@ -104,6 +113,36 @@ class KickBanMixin(MixinMeta):
             return False
         return True
 
+    async def _check_ban_hierarchy(
+        self, author: discord.Member, member: discord.Member
+    ) -> Optional[str]:
+        """Get the reason why the author can't ban the member or ``None`` if they can."""
+        guild = member.guild
+        if author == member:
+            return _("I cannot let you do that. Self-harm is bad {}").format("\N{PENSIVE FACE}")
+        elif not await is_allowed_by_hierarchy(self.bot, self.config, guild, author, member):
+            return _(
+                "I cannot let you do that. You are "
+                "not higher than the user in the role "
+                "hierarchy."
+            )
+        elif guild.me.top_role <= member.top_role or member == guild.owner:
+            return _("I cannot do that due to Discord hierarchy rules.")
+        return None
+
+    async def _send_ban_dm(self, member: discord.Member, reason: Optional[str]) -> None:
+        with contextlib.suppress(discord.HTTPException):
+            em = discord.Embed(
+                title=bold(_("You have been banned from {guild}.").format(guild=member.guild)),
+                color=await self.bot.get_embed_color(member),
+            )
+            em.add_field(
+                name=_("**Reason**"),
+                value=reason if reason is not None else _("No reason was given."),
+                inline=False,
+            )
+            await member.send(embed=em)
+
     async def ban_user(
         self,
         user: Union[discord.Member, discord.User, discord.Object],
@@ -121,36 +160,13 @@ class KickBanMixin(MixinMeta):
             return False, _("Invalid days. Must be between 0 and 7.")
 
         if isinstance(user, discord.Member):
-            if author == user:
-                return (
-                    False,
-                    _("I cannot let you do that. Self-harm is bad {}").format("\N{PENSIVE FACE}"),
-                )
-            elif not await is_allowed_by_hierarchy(self.bot, self.config, guild, author, user):
-                return (
-                    False,
-                    _(
-                        "I cannot let you do that. You are "
-                        "not higher than the user in the role "
-                        "hierarchy."
-                    ),
-                )
-            elif guild.me.top_role <= user.top_role or user == guild.owner:
-                return False, _("I cannot do that due to Discord hierarchy rules.")
+            failure_reason = await self._check_ban_hierarchy(author, user)
+            if failure_reason is not None:
+                return False, failure_reason
 
             toggle = await self.config.guild(guild).dm_on_kickban()
             if toggle:
-                with contextlib.suppress(discord.HTTPException):
-                    em = discord.Embed(
-                        title=bold(_("You have been banned from {guild}.").format(guild=guild)),
-                        color=await self.bot.get_embed_color(user),
-                    )
-                    em.add_field(
-                        name=_("**Reason**"),
-                        value=reason if reason is not None else _("No reason was given."),
-                        inline=False,
-                    )
-                    await user.send(embed=em)
+                await self._send_ban_dm(user, reason)
 
             ban_type = "ban"
         else:
@@ -164,6 +180,9 @@ class KickBanMixin(MixinMeta):
                 if user.id in tempbans:
                     async with self.config.guild(guild).current_tempbans() as tempbans:
                         tempbans.remove(user.id)
+                    await scheduler.cancel(
+                        self.qualified_name, self._get_tempban_job_id(guild.id, user.id)
+                    )
                     removed_temp = True
                 else:
                     return (
@@ -226,62 +245,86 @@ class KickBanMixin(MixinMeta):
 
         return True, success_message
 
-    async def tempban_expirations_task(self) -> None:
-        while True:
-            try:
-                await self._check_tempban_expirations()
-            except Exception:
-                log.exception("Something went wrong in check_tempban_expirations:")
+    @staticmethod
+    def _get_tempban_job_id(guild_id: int, user_id: int) -> str:
+        return f"tempban-{guild_id}-{user_id}"
+
+    async def _schedule_tempban_expiration(
+        self, guild_id: int, user_id: int, unban_time: datetime
+    ) -> None:
+        await scheduler.schedule(
+            self.qualified_name,
+            self._get_tempban_job_id(guild_id, user_id),
+            unban_time,
+            {"guild": guild_id, "user": user_id},
+        )
 
-            await asyncio.sleep(60)
+    async def _schedule_tempban_expirations(self) -> None:
+        """Schedule the expirations of the tempbans that don't have them scheduled.
 
-    async def _check_tempban_expirations(self) -> None:
+        The scheduled jobs are stored separately from Mod's data,
+        this makes sure that no tempban is left without one.
+        """
         guilds_data = await self.config.all_guilds()
         async for guild_id, guild_data in AsyncIter(guilds_data.items(), steps=100):
-            if not (guild := self.bot.get_guild(guild_id)):
-                continue
-            if guild.unavailable or not guild.me.guild_permissions.ban_members:
-                continue
-            if await self.bot.cog_disabled_in_guild(self, guild):
-                continue
-
-            guild_tempbans = guild_data["current_tempbans"]
-            if not guild_tempbans:
-                continue
-            async with self.config.guild(guild).current_tempbans.get_lock():
-                if await self._check_guild_tempban_expirations(guild, guild_tempbans):
-                    await self.config.guild(guild).current_tempbans.set(guild_tempbans)
-
-    async def _check_guild_tempban_expirations(
-        self, guild: discord.Guild, guild_tempbans: List[int]
-    ) -> bool:
-        changed = False
-        for uid in guild_tempbans.copy():
+            for uid in guild_data["current_tempbans"]:
+                job_id = self._get_tempban_job_id(guild_id, uid)
+                if scheduler.get_job(self.qualified_name, job_id) is not None:
+                    continue
+                banned_until = await self.config.member_from_ids(guild_id, uid).banned_until()
+                await self._schedule_tempban_expiration(
+                    guild_id, uid, datetime.fromtimestamp(banned_until or 0, timezone.utc)
+                )
+
+    async def _handle_tempban_expiration(self, job: scheduler.Job) -> None:
+        guild_id = job.payload["guild"]
+        uid = job.payload["user"]
+        guild = self.bot.get_guild(guild_id)
+        # the unban is retried until the bot is in the guild and able to unban
+        if (
+            guild is None
+            or guild.unavailable
+            or not guild.me.guild_permissions.ban_members
+            or await self.bot.cog_disabled_in_guild(self, guild)
+        ):
+            await self._schedule_tempban_expiration(
+                guild_id, uid, datetime.now(timezone.utc) + TEMPBAN_RETRY_DELAY
+            )
+            return
+
+        async with self.config.guild(guild).current_tempbans.get_lock():
+            guild_tempbans = await self.config.guild(guild).current_tempbans()
+            if uid not in guild_tempbans:
+                return
             unban_time = datetime.fromtimestamp(
                 await self.config.member_from_ids(guild.id, uid).banned_until(),
                 timezone.utc,
             )
-            if datetime.now(timezone.utc) > unban_time:
-                try:
-                    await guild.unban(discord.Object(id=uid), reason=_("Tempban finished"))
-                except discord.NotFound:
-                    # user is not banned anymore
-                    guild_tempbans.remove(uid)
-                    changed = True
-                except discord.HTTPException as e:
-                    # 50013: Missing permissions error code or 403: Forbidden status
-                    if e.code == 50013 or e.status == 403:
-                        log.info(
-                            f"Failed to unban ({uid}) user from "
-                            f"{guild.name}({guild.id}) guild due to permissions."
-                        )
-                        break  # skip the rest of this guild
-                    log.info(f"Failed to unban member: error code: {e.code}")
+            if datetime.now(timezone.utc) < unban_time:
+                # the user was tempbanned again
+                await self._schedule_tempban_expiration(guild_id, uid, unban_time)
+                return
+
+            try:
+                await guild.unban(discord.Object(id=uid), reason=_("Tempban finished"))
+            except discord.NotFound:
+                # user is not banned anymore
+                pass
+            except discord.HTTPException as e:
+                # 50013: Missing permissions error code or 403: Forbidden status
+                if e.code == 50013 or e.status == 403:
+                    log.info(
+                        f"Failed to unban ({uid}) user from "
+                        f"{guild.name}({guild.id}) guild due to permissions."
+                    )
                 else:
-                    # user unbanned successfully
-                    guild_tempbans.remove(uid)
-                    changed = True
-        return changed
+                    log.info(f"Failed to unban member: error code: {e.code}")
+                await self._schedule_tempban_expiration(
+                    guild_id, uid, datetime.now(timezone.utc) + TEMPBAN_RETRY_DELAY
+                )
+                return
+            guild_tempbans.remove(uid)
+            await self.config.guild(guild).current_tempbans.set(guild_tempbans)
 
     @commands.command()
     @commands.guild_only()
@@ -424,9 +467,9 @@ class KickBanMixin(MixinMeta):
         User IDs need to be provided in order to ban
         using this command.
         """
-        banned = []
-        errors = {}
-        upgrades = []
+        banned: List[int] = []
+        errors: Dict[int, str] = {}
+        upgrades: List[str] = []
 
         async def show_results():
             text = _("Banned {num} users from the server.").format(
@@ -468,15 +511,20 @@ class KickBanMixin(MixinMeta):
 
         tempbans = await self.config.guild(guild).current_tempbans()
 
-        for user_id in user_ids:
-            if user_id in tempbans:
-                # We need to check if a user is tempbanned here because otherwise they won't be processed later on.
-                continue
+        async def is_banned(user_id: int) -> bool:
             try:
                 await guild.fetch_ban(discord.Object(user_id))
             except discord.NotFound:
-                pass
-            else:
+                return False
+            return True
+
+        # We need to check if a user is tempbanned here because otherwise they won't be processed later on.
+        to_check = [user_id for user_id in user_ids if user_id not in tempbans]
+        results = await bounded_gather(
+            *(is_banned(user_id) for user_id in to_check), limit=MASSBAN_CONCURRENCY
+        )
+        for user_id, already_banned in zip(to_check, results):
+            if already_banned:
                 errors[user_id] = _("User with ID {user_id} is already banned.").format(
                     user_id=user_id
                 )
@@ -488,7 +536,7 @@ class KickBanMixin(MixinMeta):
             return
 
         # We need to check here, if any of the users isn't a member and if they are,
-        # we need to use our `ban_user()` method to do hierarchy checks.
+        # we need to do hierarchy checks for them.
         members: Dict[int, discord.Member] = {}
         to_query: List[int] = []
 
@@ -506,74 +554,114 @@ class KickBanMixin(MixinMeta):
             members.update((member.id, member) for member in queried_members)
             to_query = to_query[100:]
 
-        # Call `ban_user()` method for all users that turned out to be guild members.
         for user_id, member in members.items():
-            try:
-                # using `reason` here would shadow the reason passed to command
-                success, failure_reason = await self.ban_user(
-                    user=member, ctx=ctx, days=days, reason=reason, create_modlog_case=True
-                )
-                if success:
-                    banned.append(user_id)
-                else:
-                    errors[user_id] = _("Failed to ban user {user_id}: {reason}").format(
-                        user_id=user_id, reason=failure_reason
-                    )
-            except Exception as e:
+            failure_reason = await self._check_ban_hierarchy(author, member)
+            if failure_reason is not None:
                 errors[user_id] = _("Failed to ban user {user_id}: {reason}").format(
-                    user_id=user_id, reason=e
+                    user_id=user_id, reason=failure_reason
                 )
 
-        user_ids = remove_processed(user_ids)
-
-        if not user_ids:
-            await show_results()
-            return
+        to_notify = [member for user_id, member in members.items() if user_id not in errors]
+        if to_notify and await self.config.guild(guild).dm_on_kickban():
+            await bounded_gather(
+                *(self._send_ban_dm(member, reason) for member in to_notify),
+                limit=MASSBAN_CONCURRENCY,
+            )
 
-        for user_id in user_ids:
-            user = discord.Object(id=user_id)
-            audit_reason = get_audit_reason(author, reason, shorten=True)
+        upgraded = [user_id for user_id in remove_processed(user_ids) if user_id in tempbans]
+        if upgraded:
             async with self.config.guild(guild).current_tempbans() as tempbans:
-                if user_id in tempbans:
-                    tempbans.remove(user_id)
-                    upgrades.append(str(user_id))
-                    log.info(
-                        "%s (%s) upgraded the tempban for %s to a permaban.",
-                        author,
-                        author.id,
-                        user_id,
-                    )
-                    banned.append(user_id)
+                for user_id in upgraded:
+                    if user_id in tempbans:
+                        tempbans.remove(user_id)
+            for user_id in upgraded:
+                await scheduler.cancel(
+                    self.qualified_name, self._get_tempban_job_id(guild.id, user_id)
+                )
+                log.info(
+                    "%s (%s) upgraded the tempban for %s to a permaban.",
+                    author,
+                    author.id,
+                    user_id,
+                )
+            upgrades.extend(map(str, upgraded))
+            banned.extend(upgraded)
+
+        to_ban = remove_processed(user_ids)
+        progress_message = None
+        if len(to_ban) >= MASSBAN_PROGRESS_THRESHOLD:
+            progress_message = await ctx.send(
+                _("Banning {num} users...").format(num=humanize_number(len(to_ban)))
+            )
+        last_update = time.monotonic()
+        banned_count = 0
+        async for progress in mass_ban(
+            guild,
+            to_ban,
+            reason=get_audit_reason(author, reason, shorten=True),
+            delete_message_seconds=days * 86400,
+            concurrency=MASSBAN_CONCURRENCY,
+        ):
+            banned.extend(progress.banned)
+            banned_count += len(progress.banned)
+            for user_id, error in progress.failed.items():
+                if isinstance(error, discord.NotFound):
+                    errors[user_id] = _("User with ID {user_id} not found").format(user_id=user_id)
+                elif isinstance(error, discord.Forbidden):
+                    errors[user_id] = _(
+                        "Could not ban user with ID {user_id}: missing permissions."
+                    ).format(user_id=user_id)
                 else:
-                    try:
-                        await guild.ban(
-                            user, reason=audit_reason, delete_message_seconds=days * 86400
-                        )
-                        log.info("%s (%s) hackbanned %s", author, author.id, user_id)
-                    except discord.NotFound:
-                        errors[user_id] = _("User with ID {user_id} not found").format(
-                            user_id=user_id
+                    errors[user_id] = _("Failed to ban user {user_id}: {reason}").format(
+                        user_id=user_id,
+                        reason=error if error is not None else _("An unexpected error occurred."),
+                    )
+            if (
+                progress_message is not None
+                and time.monotonic() - last_update >= MASSBAN_PROGRESS_INTERVAL
+            ):
+                last_update = time.monotonic()
+                with contextlib.suppress(discord.HTTPException):
+                    await progress_message.edit(
+                        content=_("Banned {done} of {num} users...").format(
+                            done=humanize_number(banned_count),
+                            num=humanize_number(len(to_ban)),
                         )
-                        continue
-                    except discord.Forbidden:
-                        errors[user_id] = _(
-                            "Could not ban user with ID {user_id}: missing permissions."
-                        ).format(user_id=user_id)
-                        continue
-                    else:
-                        banned.append(user_id)
+                    )
+        log.info(
+            "%s (%s) massbanned %s users, deleting %s days worth of messages.",
+            author,
+            author.id,
+            banned_count,
+            days,
+        )
 
-            await modlog.create_case(
-                self.bot,
-                guild,
-                ctx.message.created_at,
-                "hackban",
-                user_id,
-                author,
-                reason,
-                until=None,
-                channel=None,
-            )
+        banned_ids = set(banned)
+        await modlog.create_cases(
+            self.bot,
+            guild,
+            ctx.message.created_at,
+            "ban",
+            [member for user_id, member in members.items() if user_id in banned_ids],
+            author,
+            reason,
+            until=None,
+            channel=None,
+        )
+        await modlog.create_cases(
+            self.bot,
+            guild,
+            ctx.message.created_at,
+            "hackban",
+            [user_id for user_id in banned if user_id not in members],
+            author,
+            reason,
+            until=None,
+            channel=None,
+        )
+        if progress_message is not None:
+            with contextlib.suppress(discord.HTTPException):
+                await progress_message.delete()
         await show_results()
 
     @commands.command()
@@ -640,6 +728,7 @@ class KickBanMixin(MixinMeta):
         await self.config.member(member).banned_until.set(unban_time.timestamp())
         async with self.config.guild(guild).current_tempbans() as current_tempbans:
             current_tempbans.append(member.id)
+        await self._schedule_tempban_expiration(guild.id, member.id, unban_time)
 
         with contextlib.suppress(discord.HTTPException):
             # We don't want blocked DMs preventing us from banning
@@ -3,15 +3,17 @@ import logging
 import re
 from abc import ABC
 from collections import defaultdict
-from typing import Literal
+from typing import Dict, Literal, Optional
 
-from redbot.core import Config, commands
+from redbot.core import Config, commands, scheduler
 from redbot.core.bot import Red
 from redbot.core.i18n import Translator, cog_i18n
 from redbot.core.utils import AsyncIter
 from redbot.core.utils._internal_utils import send_to_owners_with_prefix_replaced
 from redbot.core.utils.chat_formatting import inline
+from .duplicates import DuplicateDetector
 from .events import Events
+from .name_history import NameHistory
 from .kickban import KickBanMixin
 from .names import ModInfo
 from .slowmode import Slowmode
@@ -78,8 +80,11 @@ class Mod(
         self.config.register_channel(**self.default_channel_settings)
         self.config.register_member(**self.default_member_settings)
         self.config.register_user(**self.default_user_settings)
-        self.cache: dict = {}
-        self.tban_expiry_task = asyncio.create_task(self.tempban_expirations_task())
+        self.delete_repeats_cache: Dict[int, int] = {}
+        self.duplicate_detector = DuplicateDetector()
+        self.name_history = NameHistory(self.config)
+        self.track_all_names_cache: Optional[bool] = None
+        self.track_nicknames_cache: Dict[int, bool] = {}
         self.last_case: dict = defaultdict(dict)
 
     async def red_delete_data_for_user(
@@ -91,6 +96,7 @@ class Mod(
         if requester != "discord_deleted_user":
             return
 
+        await self.name_history.forget_user(user_id)
         all_members = await self.config.all_members()
 
         async for guild_id, guild_data in AsyncIter(all_members.items(), steps=100):
@@ -98,6 +104,7 @@ class Mod(
                 await self.config.member_from_ids(guild_id, user_id).clear()
 
         await self.config.user_from_id(user_id).clear()
+        self.duplicate_detector.forget_user(user_id)
 
         guild_data = await self.config.all_guilds()
 
@@ -109,12 +116,19 @@ class Mod(
                     except ValueError:
                         pass
                     # possible with a context switch between here and getting all guilds
+                await scheduler.cancel(
+                    self.qualified_name, self._get_tempban_job_id(guild_id, user_id)
+                )
 
     async def cog_load(self) -> None:
         await self._maybe_update_config()
+        scheduler.register_handler(self.qualified_name, self._handle_tempban_expiration)
+        await self._schedule_tempban_expirations()
+        self.name_history.start()
 
-    def cog_unload(self):
-        self.tban_expiry_task.cancel()
+    async def cog_unload(self):
+        scheduler.unregister_handler(self.qualified_name)
+        await self.name_history.close()
 
     async def _maybe_update_config(self):
         """Maybe update `delete_delay` value set by Config prior to Mod 1.0.0."""
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from redbot.core import Config
+
+log = logging.getLogger("red.mod")
+
+#: Maximum number of past names kept for each user, display name and nickname.
+MAX_PAST_NAMES = 20
+
+_USER_FIELDS = ("past_names", "past_display_names")
+_MEMBER_FIELDS = ("past_nicks",)
+
+
+class NameHistory:
+    """
+    In-memory copy of the users' past names and the members' past nicknames.
+
+    The entries are keyed by ``(guild_id, user_id)`` with ``guild_id`` being ``None``
+    for the user's names, each name list is kept in a fixed-size buffer.
+    Changes are saved to Config in batches, at most ``flush_interval`` seconds
+    after they're made or as soon as ``max_dirty`` lists are waiting to be saved,
+    so a burst of name changes doesn't cause a write for each of them.
+    Entries that weren't used for ``ttl`` seconds are evicted after they're saved.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        *,
+        flush_interval: float = 30,
+        max_dirty: int = 500,
+        ttl: float = 3600,
+    ) -> None:
+        self.config = config
+        self.flush_interval = flush_interval
+        self.max_dirty = max_dirty
+        self.ttl = ttl
+        self._entries: Dict[Tuple[Optional[int], int], Dict[str, Deque[str]]] = {}
+        self._last_used: Dict[Tuple[Optional[int], int], float] = {}
+        self._dirty: Set[Tuple[Tuple[Optional[int], int], str]] = set()
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def _get_group(self, key: Tuple[Optional[int], int]):
+        guild_id, user_id = key
+        if guild_id is None:
+            return self.config.user_from_id(user_id)
+        return self.config.member_from_ids(guild_id, user_id)
+
+    @staticmethod
+    def _make_buffer(names: Iterable[Optional[str]]) -> Deque[str]:
+        # null entries could be saved due to a bug in the past
+        return deque(filter(None, names), maxlen=MAX_PAST_NAMES)
+
+    async def _get(self, key: Tuple[Optional[int], int]) -> Dict[str, Deque[str]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            fields = _USER_FIELDS if key[0] is None else _MEMBER_FIELDS
+            group = self._get_group(key)
+            data = {field: self._make_buffer(await group.get_raw(field)) for field in fields}
+            # the entry could have been loaded by someone else in the meantime
+            entry = self._entries.setdefault(key, data)
+        self._last_used[key] = time.monotonic()
+        return entry
+
+    async def get_names(self, user_id: int) -> Tuple[List[str], List[str]]:
+        """Get the user's past usernames and display names, from the oldest to the newest."""
+        entry = await self._get((None, user_id))
+        return list(entry["past_names"]), list(entry["past_display_names"])
+
+    async def get_nicks(self, guild_id: int, user_id: int) -> List[str]:
+        """Get the member's past nicknames, from the oldest to the newest."""
+        entry = await self._get((guild_id, user_id))
+        return list(entry["past_nicks"])
+
+    async def add_name(self, user_id: int, field: str, name: str) -> None:
+        """Add a name to the user's ``past_names`` or ``past_display_names``."""
+        await self._add((None, user_id), field, name)
+
+    async def add_nick(self, guild_id: int, user_id: int, nick: str) -> None:
+        """Add a nickname to the member's past nicknames."""
+        await self._add((guild_id, user_id), "past_nicks", nick)
+
+    async def _add(self, key: Tuple[Optional[int], int], field: str, name: str) -> None:
+        names = (await self._get(key))[field]
+        if name in names:
+            # Ensure order is maintained without duplicates occurring
+            names.remove(name)
+        names.append(name)
+        self._dirty.add((key, field))
+        if len(self._dirty) >= self.max_dirty:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Save the changed name lists to Config and evict the unused entries."""
+        async with self._flush_lock:
+            dirty, self._dirty = self._dirty, set()
+            while dirty:
+                key, field = dirty.pop()
+                try:
+                    await self._get_group(key).set_raw(
+                        field, value=list(self._entries[key][field])
+                    )
+                except BaseException:
+                    self._dirty |= dirty
+                    self._dirty.add((key, field))
+                    raise
+
+            cutoff = time.monotonic() - self.ttl
+            dirty_keys = {key for key, _field in self._dirty}
+            for key, last_used in list(self._last_used.items()):
+                if last_used < cutoff and key not in dirty_keys:
+                    del self._last_used[key]
+                    del self._entries[key]
+
+    async def forget_user(self, user_id: int) -> None:
+        """Drop all entries of the given user without saving them."""
+        async with self._flush_lock:
+            for key in [key for key in self._entries if key[1] == user_id]:
+                del self._entries[key]
+                self._last_used.pop(key, None)
+            self._dirty = {item for item in self._dirty if item[0][1] != user_id}
+
+    async def clear(self) -> None:
+        """Drop all entries without saving them."""
+        async with self._flush_lock:
+            self._entries.clear()
+            self._last_used.clear()
+            self._dirty.clear()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Failed to save the name history.")
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
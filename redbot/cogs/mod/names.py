@@ -22,9 +22,8 @@ class ModInfo(MixinMeta):
     """
 
     async def get_names(self, member: discord.Member) -> Tuple[List[str], List[str], List[str]]:
-        user_data = await self.config.user(member).all()
-        usernames, display_names = user_data["past_names"], user_data["past_display_names"]
-        nicks = await self.config.member(member).past_nicks()
+        usernames, display_names = await self.name_history.get_names(member.id)
+        nicks = await self.name_history.get_nicks(member.guild.id, member.id)
         usernames = list(map(escape_spoilers_and_mass_mentions, filter(None, usernames)))
         display_names = list(map(escape_spoilers_and_mass_mentions, filter(None, display_names)))
         nicks = list(map(escape_spoilers_and_mass_mentions, filter(None, nicks)))
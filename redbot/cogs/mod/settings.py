@@ -1,5 +1,4 @@
 import asyncio
-from collections import defaultdict, deque
 from datetime import timedelta
 
 from redbot.core import commands, i18n
@@ -293,12 +292,14 @@ class ModSettings(MixinMeta):
         if repeats is not None:
             if repeats == -1:
                 await self.config.guild(guild).delete_repeats.set(repeats)
-                self.cache.pop(guild.id, None)  # remove cache with old repeat limits
+                self.delete_repeats_cache[guild.id] = repeats
+                self.duplicate_detector.clear_guild(guild.id)
                 await ctx.send(_("Repeated messages will be ignored."))
             elif 2 <= repeats <= 20:
                 await self.config.guild(guild).delete_repeats.set(repeats)
-                # purge and update cache to new repeat limits
-                self.cache[guild.id] = defaultdict(lambda: deque(maxlen=repeats))
+                self.delete_repeats_cache[guild.id] = repeats
+                # start counting the repeats anew with the new limit
+                self.duplicate_detector.clear_guild(guild.id)
                 await ctx.send(
                     _("Messages repeated up to {num} times will be deleted.").format(num=repeats)
                 )
@@ -437,6 +438,7 @@ class ModSettings(MixinMeta):
         else:
             msg = _("Nickname changes will no longer be tracked.")
         await self.config.guild(guild).track_nicknames.set(enabled)
+        self.track_nicknames_cache[guild.id] = enabled
         await ctx.send(msg)
 
     @modset.command()
@@ -464,6 +466,7 @@ class ModSettings(MixinMeta):
                 "To delete existing name data, use {command}."
             ).format(command=inline(f"{ctx.clean_prefix}modset deletenames"))
         await self.config.track_all_names.set(enabled)
+        self.track_all_names_cache = enabled
         await ctx.send(msg)
 
     @modset.command()
@@ -490,6 +493,7 @@ class ModSettings(MixinMeta):
             return
 
         async with ctx.typing():
+            await self.name_history.clear()
             # Nickname data
             async with self.config._get_base_group(self.config.MEMBER).all() as mod_member_data:
                 guilds_to_remove = []
@@ -8,12 +8,59 @@ from redbot.core import commands, modlog
 from redbot.core.bot import Red
 from redbot.core.i18n import Translator, cog_i18n
 from redbot.core.utils.chat_formatting import bold, box, pagify
-from redbot.core.utils.menus import menu
 from redbot.core.utils.predicates import MessagePredicate
+from redbot.core.utils.views import SimpleMenu
+from redbot.vendored.discord.ext import menus
 
 _ = Translator("ModLog", __file__)
 
 
+async def _render_case(case: modlog.Case, embed: bool) -> Union[str, discord.Embed]:
+    if embed:
+        return await case.message_content(embed=True)
+    created_at = datetime.fromtimestamp(case.created_at, tz=timezone.utc)
+    return (
+        f"{await case.message_content(embed=False)}\n"
+        f"{bold(_('Timestamp:'))} {discord.utils.format_dt(created_at)}"
+    )
+
+
+class _CasePageSource(menus.PageSource):
+    """Page source that only fetches the displayed case, from the oldest case."""
+
+    def __init__(
+        self, first_page: modlog.CasePage, guild: discord.Guild, *, member_id: int, embed: bool
+    ) -> None:
+        self.guild = guild
+        self.member_id = member_id
+        self.embed = embed
+        self._page_count = first_page.page_count
+        self._cached_page = first_page
+
+    def is_paginating(self) -> bool:
+        return self._page_count > 1
+
+    def get_max_pages(self) -> int:
+        return self._page_count
+
+    async def get_page(self, page_number: int) -> modlog.CasePage:
+        if not 0 <= page_number < self._page_count:
+            raise IndexError(page_number)
+        if self._cached_page.page_number != page_number:
+            self._cached_page = await modlog.get_case_page(
+                self.guild, page_number, per_page=1, newest_first=False, member_id=self.member_id
+            )
+        return self._cached_page
+
+    async def format_page(
+        self, view: discord.ui.View, page: modlog.CasePage
+    ) -> Union[str, discord.Embed]:
+        if not page.cases:
+            return _("This case no longer exists.")
+        # the case's reason is shortened so that the case always fits in a single message
+        return await _render_case(page.cases[0], embed=self.embed)
+
+
 @cog_i18n(_)
 class ModLog(commands.Cog):
     """Browse and manage modlog cases. To manage modlog settings, use `[p]modlogset`."""
@@ -37,88 +84,47 @@ class ModLog(commands.Cog):
             return
         else:
             if await ctx.embed_requested():
-                await ctx.send(embed=await case.message_content(embed=True))
+                await ctx.send(embed=await _render_case(case, embed=True))
             else:
-                created_at = datetime.fromtimestamp(case.created_at, tz=timezone.utc)
-                message = (
-                    f"{await case.message_content(embed=False)}\n"
-                    f"{bold(_('Timestamp:'))} {discord.utils.format_dt(created_at)}"
-                )
-                await ctx.send(message)
+                await ctx.send(await _render_case(case, embed=False))
 
     @commands.command()
     @commands.guild_only()
     async def casesfor(self, ctx: commands.Context, *, member: Union[discord.Member, int]):
         """Display cases for the specified member."""
+        member_id = member if isinstance(member, int) else member.id
         async with ctx.typing():
-            try:
-                if isinstance(member, int):
-                    cases = await modlog.get_cases_for_member(
-                        bot=ctx.bot, guild=ctx.guild, member_id=member
-                    )
-                else:
-                    cases = await modlog.get_cases_for_member(
-                        bot=ctx.bot, guild=ctx.guild, member=member
-                    )
-            except discord.NotFound:
-                return await ctx.send(_("That user does not exist."))
-            except discord.HTTPException:
-                return await ctx.send(
-                    _("Something unexpected went wrong while fetching that user by ID.")
-                )
-
-            if not cases:
-                return await ctx.send(_("That user does not have any cases."))
-
-            embed_requested = await ctx.embed_requested()
-            if embed_requested:
-                rendered_cases = [await case.message_content(embed=True) for case in cases]
-            else:
-                rendered_cases = []
-                for case in cases:
-                    created_at = datetime.fromtimestamp(case.created_at, tz=timezone.utc)
-                    message = (
-                        f"{await case.message_content(embed=False)}\n"
-                        f"{bold(_('Timestamp:'))} {discord.utils.format_dt(created_at)}"
-                    )
-                    rendered_cases.append(message)
-
-        await menu(ctx, rendered_cases)
+            first_page = await modlog.get_case_page(
+                ctx.guild, 0, per_page=1, newest_first=False, member_id=member_id
+            )
+            if not first_page.page_count:
+                await ctx.send(_("That user does not have any cases."))
+                return
+            source = _CasePageSource(
+                first_page, ctx.guild, member_id=member_id, embed=await ctx.embed_requested()
+            )
+        await SimpleMenu(source).start(ctx)
 
     @commands.command()
     @commands.guild_only()
     async def listcases(self, ctx: commands.Context, *, member: Union[discord.Member, int]):
         """List cases for the specified member."""
+        member_id = member if isinstance(member, int) else member.id
         async with ctx.typing():
-            try:
-                if isinstance(member, int):
-                    cases = await modlog.get_cases_for_member(
-                        bot=ctx.bot, guild=ctx.guild, member_id=member
-                    )
-                else:
-                    cases = await modlog.get_cases_for_member(
-                        bot=ctx.bot, guild=ctx.guild, member=member
+            # only the member's cases are fetched, the pages are sized by their content
+            content = "\n\n".join(
+                [
+                    await _render_case(case, embed=False)
+                    async for case in modlog.iter_cases(
+                        ctx.guild, newest_first=False, member_id=member_id
                     )
-            except discord.NotFound:
-                return await ctx.send(_("That user does not exist."))
-            except discord.HTTPException:
-                return await ctx.send(
-                    _("Something unexpected went wrong while fetching that user by ID.")
-                )
-            if not cases:
-                return await ctx.send(_("That user does not have any cases."))
-
-            rendered_cases = []
-            message = ""
-            for case in cases:
-                created_at = datetime.fromtimestamp(case.created_at, tz=timezone.utc)
-                message += (
-                    f"{await case.message_content(embed=False)}\n"
-                    f"{bold(_('Timestamp:'))} {discord.utils.format_dt(created_at)}\n\n"
-                )
-            for page in pagify(message, ["\n\n", "\n"], priority=True):
-                rendered_cases.append(page)
-        await menu(ctx, rendered_cases)
+                ]
+            )
+            if not content:
+                await ctx.send(_("That user does not have any cases."))
+                return
+            pages = list(pagify(content, ["\n\n", "\n"], priority=True))
+        await SimpleMenu(pages).start(ctx)
 
     @commands.command()
     @commands.guild_only()
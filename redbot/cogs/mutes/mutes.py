@@ -3,12 +3,12 @@ import contextlib
 import logging
 from abc import ABC
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Literal, Optional, Tuple, Union, cast
+from typing import Dict, List, Literal, Optional, Set, Tuple, Union
 
 import discord
 
 from redbot.core.bot import Red
-from redbot.core import commands, i18n, modlog, Config
+from redbot.core import commands, i18n, modlog, scheduler, Config
 from redbot.core.utils import AsyncIter, bounded_gather, can_user_react_in
 from redbot.core.utils.chat_formatting import (
     bold,
@@ -24,6 +24,7 @@ from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
 
 from .converters import MuteTime
 from .models import ChannelMuteResponse, MuteResponse
+from .overwrites import OverwriteEdit, OverwriteExecutor
 from .voicemutes import VoiceMutes
 
 T_ = i18n.Translator("Mutes", __file__)
@@ -55,6 +56,9 @@ MUTE_UNMUTE_ISSUES = {
     ),
     "left_guild": _("The user has left the server while applying an overwrite."),
     "unknown_channel": _("The channel I tried to mute or unmute the user in isn't found."),
+    "overwrite_failed": _(
+        "Discord failed to update the permissions in {location}, please try again later."
+    ),
     "role_missing": _("The mute role no longer exists."),
     "voice_mute_permission": _(
         "Because I don't have the Move Members permission, this will take into effect when the user rejoins."
@@ -71,6 +75,9 @@ _ = T_
 
 log = logging.getLogger("red.cogs.mutes")
 
+#: Time after which an automatic unmute in a guild with Mutes disabled is tried again.
+UNMUTE_RETRY_DELAY = timedelta(seconds=60)
+
 __version__ = "1.0.0"
 
 
@@ -106,13 +113,19 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         self.config.register_channel(muted_users={})
         self._server_mutes: Dict[int, Dict[int, dict]] = {}
         self._channel_mutes: Dict[int, Dict[int, dict]] = {}
-        self._unmute_tasks: Dict[str, asyncio.Task] = {}
-        self._unmute_task: Optional[asyncio.Task] = None
+        # index of the channel mutes by guild ID and user ID, it's kept in sync
+        # with _channel_mutes by _set_channel_mute() and _pop_channel_mute()
+        self._member_channel_mutes: Dict[int, Dict[int, Set[int]]] = {}
         self.mute_role_cache: Dict[int, int] = {}
+        # all channel overwrite edits go through it, so that they're made concurrently
+        # while backing off together when Discord starts rate limiting them
+        self._overwrites = OverwriteExecutor()
         # this is a dict of guild ID's and asyncio.Events
         # to wait for a guild to finish channel unmutes before
         # checking for manual overwrites
         self._channel_mute_events: Dict[int, asyncio.Event] = {}
+        # (channel ID, user ID) pairs of the channel mutes that are being automatically unmuted
+        self._channel_unmutes_in_progress: Set[Tuple[int, int]] = set()
         self._ready = asyncio.Event()
         self._init_task: Optional[asyncio.Task] = None
         self._ready_raised = False
@@ -176,8 +189,9 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         for c_id, mutes in channel_data.items():
             self._channel_mutes[c_id] = {}
             for user_id, mute in mutes["muted_users"].items():
-                self._channel_mutes[c_id][int(user_id)] = mute
-        self._unmute_task = asyncio.create_task(self._handle_automatic_unmute())
+                self._set_channel_mute(c_id, int(user_id), mute)
+        scheduler.register_handler(self.qualified_name, self._handle_unmute_job)
+        await self._schedule_unmutes()
         self._ready.set()
 
     async def _maybe_update_config(self):
@@ -227,10 +241,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
     def cog_unload(self):
         if self._init_task is not None:
             self._init_task.cancel()
-        if self._unmute_task is not None:
-            self._unmute_task.cancel()
-        for task in self._unmute_tasks.values():
-            task.cancel()
+        scheduler.unregister_handler(self.qualified_name)
 
     async def is_allowed_by_hierarchy(
         self, guild: discord.Guild, mod: discord.Member, user: discord.Member
@@ -238,74 +249,144 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         is_special = mod == guild.owner or await self.bot.is_owner(mod)
         return mod.top_role > user.top_role or is_special
 
-    async def _handle_automatic_unmute(self):
-        """This is the core task creator and loop
-        for automatic unmutes
+    def _set_channel_mute(self, channel_id: int, user_id: int, data: dict) -> None:
+        self._channel_mutes.setdefault(channel_id, {})[user_id] = data
+        if data:
+            guild_mutes = self._member_channel_mutes.setdefault(data["guild"], {})
+            guild_mutes.setdefault(user_id, set()).add(channel_id)
+
+    def _pop_channel_mute(self, channel_id: int, user_id: int) -> Optional[dict]:
+        data = self._channel_mutes.get(channel_id, {}).pop(user_id, None)
+        if data:
+            guild_mutes = self._member_channel_mutes.get(data["guild"], {})
+            channel_ids = guild_mutes.get(user_id, set())
+            channel_ids.discard(channel_id)
+            if not channel_ids:
+                guild_mutes.pop(user_id, None)
+        return data
+
+    def _get_member_channel_mutes(self, guild_id: int, user_id: int) -> Dict[int, dict]:
+        """Get the member's channel mutes in the guild, by channel ID."""
+        channel_ids = self._member_channel_mutes.get(guild_id, {}).get(user_id, ())
+        return {channel_id: self._channel_mutes[channel_id][user_id] for channel_id in channel_ids}
+
+    @staticmethod
+    def _get_server_unmute_job_id(guild_id: int, user_id: int) -> str:
+        return f"server-unmute-{guild_id}-{user_id}"
+
+    @staticmethod
+    def _get_channel_unmute_job_id(channel_id: int, user_id: int) -> str:
+        return f"channel-unmute-{channel_id}-{user_id}"
+
+    async def _schedule_server_unmute(self, guild_id: int, user_id: int, until: float) -> None:
+        await scheduler.schedule(
+            self.qualified_name,
+            self._get_server_unmute_job_id(guild_id, user_id),
+            datetime.fromtimestamp(until, timezone.utc),
+            {"guild": guild_id, "member": user_id},
+        )
 
-        A resolution of 30 seconds seems appropriate
-        to allow for decent resolution on low timed
-        unmutes and without being too busy on our event loop
-        """
-        await self.bot.wait_until_red_ready()
-        await self._ready.wait()
-        if self._ready_raised:
-            raise RuntimeError("Mutes cog is in a bad state, cancelling automatic unmute task.")
-        while True:
-            await self._clean_tasks()
-            try:
-                await self._handle_server_unmutes()
-            except Exception:
-                log.error("error checking server unmutes", exc_info=True)
-            await asyncio.sleep(0.1)
-            try:
-                await self._handle_channel_unmutes()
-            except Exception:
-                log.error("error checking channel unmutes", exc_info=True)
-            await asyncio.sleep(30)
+    async def _schedule_channel_unmute(
+        self, guild_id: int, channel_id: int, user_id: int, until: float
+    ) -> None:
+        await scheduler.schedule(
+            self.qualified_name,
+            self._get_channel_unmute_job_id(channel_id, user_id),
+            datetime.fromtimestamp(until, timezone.utc),
+            {"guild": guild_id, "channel": channel_id, "member": user_id},
+        )
 
-    async def _clean_tasks(self):
-        """This is here to cleanup our tasks
-        and log when we have something going wrong
-        inside our tasks.
+    async def _schedule_unmutes(self):
+        """Schedule the automatic unmutes of the mutes that don't have them scheduled.
+
+        The scheduled jobs are stored separately from Mutes's data,
+        this makes sure that no timed mute is left without one.
         """
-        log.debug("Cleaning unmute tasks")
-        for task_id in list(self._unmute_tasks.keys()):
-            task = self._unmute_tasks[task_id]
+        for g_id, mutes in self._server_mutes.items():
+            for u_id, data in mutes.items():
+                if not data["until"]:
+                    continue
+                job_id = self._get_server_unmute_job_id(g_id, u_id)
+                if scheduler.get_job(self.qualified_name, job_id) is None:
+                    await self._schedule_server_unmute(g_id, u_id, data["until"])
+        for c_id, mutes in self._channel_mutes.items():
+            for u_id, data in mutes.items():
+                if not data or not data["until"]:
+                    continue
+                job_id = self._get_channel_unmute_job_id(c_id, u_id)
+                if scheduler.get_job(self.qualified_name, job_id) is None:
+                    await self._schedule_channel_unmute(data["guild"], c_id, u_id, data["until"])
+
+    async def _handle_unmute_job(self, job: scheduler.Job):
+        """This is the handler of the scheduled automatic unmutes"""
+        guild = self.bot.get_guild(job.payload["guild"])
+        # the unmute is retried until the bot is in the guild and the cog is enabled in it
+        if guild is None or await self.bot.cog_disabled_in_guild(self, guild):
+            await scheduler.schedule(
+                job.owner,
+                job.id,
+                datetime.now(timezone.utc) + UNMUTE_RETRY_DELAY,
+                job.payload,
+            )
+            return
+        await i18n.set_contextual_locales_from_guild(self.bot, guild)
+        if "channel" in job.payload:
+            await self._handle_channel_unmute(guild, job.payload["channel"], job.payload["member"])
+        else:
+            await self._handle_server_unmute(guild, job.payload["member"])
 
-            if task.cancelled():
-                self._unmute_tasks.pop(task_id, None)
-                continue
+    async def _handle_server_unmute(self, guild: discord.Guild, user_id: int):
+        """This is where the logic for role unmutes is taken care of"""
+        data = self._server_mutes.get(guild.id, {}).get(user_id)
+        if not data or not data["until"]:
+            return
+        if data["until"] - datetime.now(timezone.utc).timestamp() >= 1:
+            # the user was muted again
+            await self._schedule_server_unmute(guild.id, user_id, data["until"])
+            return
+        await self._auto_unmute_user(guild, data)
 
-            if task.done():
-                try:
-                    r = task.result()
-                except Exception as exc:
-                    log.error("An unexpected error occurred in the unmute task", exc_info=exc)
-                self._unmute_tasks.pop(task_id, None)
+    async def _handle_channel_unmute(self, guild: discord.Guild, channel_id: int, user_id: int):
+        """This is where the logic for handling channel unmutes is taken care of"""
+        data = self._channel_mutes.get(channel_id, {}).get(user_id)
+        if not data or not data["until"]:
+            return
+        if (channel_id, user_id) in self._channel_unmutes_in_progress:
+            return
+        now = datetime.now(timezone.utc).timestamp()
+        if data["until"] - now >= 1:
+            # the user was muted again
+            await self._schedule_channel_unmute(guild.id, channel_id, user_id, data["until"])
+            return
 
-    async def _handle_server_unmutes(self):
-        """This is where the logic for role unmutes is taken care of"""
-        log.debug("Checking server unmutes")
-        for g_id in self._server_mutes:
-            guild = self.bot.get_guild(g_id)
-            if guild is None or await self.bot.cog_disabled_in_guild(self, guild):
+        # the user is unmuted at once in all channels where their mute ends within a minute
+        channels = {channel_id: data}
+        for c_id, mute_data in self._get_member_channel_mutes(guild.id, user_id).items():
+            if (
+                c_id == channel_id
+                or not mute_data["until"]
+                or mute_data["until"] - now >= 60.0
+                or (c_id, user_id) in self._channel_unmutes_in_progress
+                or guild.get_channel(c_id) is None
+            ):
                 continue
-            await i18n.set_contextual_locales_from_guild(self.bot, guild)
-            for u_id in self._server_mutes[guild.id]:
-                if self._server_mutes[guild.id][u_id]["until"] is None:
-                    continue
-                time_to_unmute = (
-                    self._server_mutes[guild.id][u_id]["until"]
-                    - datetime.now(timezone.utc).timestamp()
-                )
-                if time_to_unmute < 60.0:
-                    task_name = f"server-unmute-{g_id}-{u_id}"
-                    if task_name in self._unmute_tasks:
-                        continue
-                    log.debug(f"Creating task: {task_name}")
-                    self._unmute_tasks[task_name] = asyncio.create_task(
-                        self._auto_unmute_user(guild, self._server_mutes[guild.id][u_id])
+            channels[c_id] = mute_data
+        in_progress = {(c_id, user_id) for c_id in channels}
+        self._channel_unmutes_in_progress |= in_progress
+
+        try:
+            for c_id in channels:
+                if c_id != channel_id:
+                    await scheduler.cancel(
+                        self.qualified_name, self._get_channel_unmute_job_id(c_id, user_id)
                     )
+            if len(channels) > 1:
+                member = guild.get_member(user_id)
+                await self._auto_channel_unmute_user_multi(member, guild, channels)
+            elif guild_channel := guild.get_channel(channel_id):
+                await self._auto_channel_unmute_user(guild_channel, data)
+        finally:
+            self._channel_unmutes_in_progress -= in_progress
 
     async def _auto_unmute_user(self, guild: discord.Guild, data: dict):
         """
@@ -363,58 +444,6 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                 log.info(error_msg)
                 return
 
-    async def _handle_channel_unmutes(self):
-        """This is where the logic for handling channel unmutes is taken care of"""
-        log.debug("Checking channel unmutes")
-        multiple_mutes = {}
-        for c_id, c_data in self._channel_mutes.items():
-            for u_id in self._channel_mutes[c_id]:
-                if (
-                    not self._channel_mutes[c_id][u_id]
-                    or not self._channel_mutes[c_id][u_id]["until"]
-                ):
-                    continue
-                guild = self.bot.get_guild(self._channel_mutes[c_id][u_id]["guild"])
-                if guild is None or await self.bot.cog_disabled_in_guild(self, guild):
-                    continue
-                time_to_unmute = (
-                    self._channel_mutes[c_id][u_id]["until"]
-                    - datetime.now(timezone.utc).timestamp()
-                )
-                if time_to_unmute < 60.0:
-                    if guild not in multiple_mutes:
-                        multiple_mutes[guild] = {}
-                    if u_id not in multiple_mutes[guild]:
-                        multiple_mutes[guild][u_id] = {c_id: self._channel_mutes[c_id][u_id]}
-                    else:
-                        multiple_mutes[guild][u_id][c_id] = self._channel_mutes[c_id][u_id]
-
-        for guild, users in multiple_mutes.items():
-            await i18n.set_contextual_locales_from_guild(self.bot, guild)
-            for user, channels in users.items():
-                if len(channels) > 1:
-                    task_name = f"server-unmute-channels-{guild.id}-{user}"
-                    if task_name in self._unmute_tasks:
-                        continue
-                    log.debug(f"Creating task: {task_name}")
-                    member = guild.get_member(user)
-                    self._unmute_tasks[task_name] = asyncio.create_task(
-                        self._auto_channel_unmute_user_multi(member, guild, channels)
-                    )
-
-                else:
-                    for channel, mute_data in channels.items():
-                        task_name = f"channel-unmute-{channel}-{user}"
-                        log.debug(f"Creating task: {task_name}")
-                        if task_name in self._unmute_tasks:
-                            continue
-                        if guild_channel := guild.get_channel(channel):
-                            self._unmute_tasks[task_name] = asyncio.create_task(
-                                self._auto_channel_unmute_user(guild_channel, mute_data)
-                            )
-
-        del multiple_mutes
-
     async def _auto_channel_unmute_user_multi(
         self, member: discord.Member, guild: discord.Guild, channels: Dict[int, dict]
     ):
@@ -500,18 +529,16 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             async with self.config.channel(channel).muted_users() as muted_users:
                 if str(data["member"]) in muted_users:
                     del muted_users[str(data["member"])]
-            if (
-                channel.id in self._channel_mutes
-                and data["member"] in self._channel_mutes[channel.id]
-            ):
-                del self._channel_mutes[channel.id][data["member"]]
+            self._pop_channel_mute(channel.id, data["member"])
             return None
         result = await self.channel_unmute_user(
             channel.guild, channel, author, member, _("Automatic unmute")
         )
-        async with self.config.channel(channel).muted_users() as muted_users:
-            if str(member.id) in muted_users:
-                del muted_users[str(member.id)]
+        # the mute is kept when the unmute can be retried
+        if member.id not in self._channel_mutes.get(channel.id, {}):
+            async with self.config.channel(channel).muted_users() as muted_users:
+                if str(member.id) in muted_users:
+                    del muted_users[str(member.id)]
         if result.success:
             if create_case:
                 if data.get("voice_mute", False):
@@ -653,6 +680,9 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                 )
                 del self._server_mutes[guild.id][after.id]
                 should_save = True
+                await scheduler.cancel(
+                    self.qualified_name, self._get_server_unmute_job_id(guild.id, after.id)
+                )
                 await self._send_dm_notification(
                     after, None, guild, _("Server unmute"), _("Manually removed mute role")
                 )
@@ -757,33 +787,34 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                     log.debug("created case")
             if to_del:
                 for u_id in to_del:
-                    del self._channel_mutes[after.id][u_id]
+                    self._pop_channel_mute(after.id, u_id)
+                    await scheduler.cancel(
+                        self.qualified_name, self._get_channel_unmute_job_id(after.id, u_id)
+                    )
                 await self.config.channel(after).muted_users.set(self._channel_mutes[after.id])
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         guild = member.guild
-        if await self.bot.cog_disabled_in_guild(self, guild):
+        # this only uses the in-memory state, so that joins during a raid don't hit Config
+        mute_data = self._server_mutes.get(guild.id, {}).get(member.id)
+        if mute_data is None:
             return
-        mute_role = await self.config.guild(guild).mute_role()
+        mute_role = self.mute_role_cache.get(guild.id)
         if not mute_role:
             # timeouts already restore on rejoin
             return
+        if await self.bot.cog_disabled_in_guild(self, guild):
+            return
         await i18n.set_contextual_locales_from_guild(self.bot, guild)
-        if guild.id in self._server_mutes:
-            if member.id in self._server_mutes[guild.id]:
-                role = guild.get_role(mute_role)
-                if not role:
-                    return
-                if self._server_mutes[guild.id][member.id]["until"]:
-                    until = datetime.fromtimestamp(
-                        self._server_mutes[guild.id][member.id]["until"]
-                    )
-                else:
-                    until = None
-                await self.mute_user(
-                    guild, guild.me, member, until, _("Previously muted in this server.")
-                )
+        role = guild.get_role(mute_role)
+        if not role:
+            return
+        if mute_data["until"]:
+            until = datetime.fromtimestamp(mute_data["until"])
+        else:
+            until = None
+        await self.mute_user(guild, guild.me, member, until, _("Previously muted in this server."))
 
     @commands.group()
     @commands.guild_only()
@@ -944,18 +975,15 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                     name=name, permissions=perms, reason=_("Mute role setup")
                 )
                 await self.config.guild(ctx.guild).mute_role.set(role.id)
+                self.mute_role_cache[ctx.guild.id] = role.id
                 # save the role early incase of issue later
             except discord.errors.Forbidden:
                 return await ctx.send(_("I could not create a muted role in this server."))
-            errors = []
-            tasks = []
-            for channel in ctx.guild.channels:
-                tasks.append(self._set_mute_role_overwrites(role, channel))
-            errors = await bounded_gather(*tasks)
-            if any(errors):
+            errors = await self._set_mute_role_overwrites(role, ctx.guild.channels)
+            if errors:
                 msg = _(
                     "I could not set overwrites for the following channels: {channels}"
-                ).format(channels=humanize_list([i for i in errors if i]))
+                ).format(channels=humanize_list(errors))
                 for page in pagify(msg, delims=[" "]):
                     await ctx.send(page)
 
@@ -970,14 +998,16 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             )
 
     async def _set_mute_role_overwrites(
-        self, role: discord.Role, channel: discord.abc.GuildChannel
-    ) -> Optional[str]:
+        self, role: discord.Role, channels: List[discord.abc.GuildChannel]
+    ) -> List[str]:
         """
-        This sets the supplied role and channel overwrites to what we want
+        This sets the supplied role's overwrites in the channels to what we want
         by default for a mute role
+
+        Returns the mentions of the channels the overwrites couldn't be set in.
+        Channels that already have the overwrites set are skipped,
+        so running this again only retries the failed channels.
         """
-        if not channel.permissions_for(channel.guild.me).manage_permissions:
-            return channel.mention
         overs = discord.PermissionOverwrite()
         overs.send_messages = False
         overs.send_messages_in_threads = False
@@ -986,11 +1016,16 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         overs.use_application_commands = False
         overs.add_reactions = False
         overs.speak = False
-        try:
-            await channel.set_permissions(role, overwrite=overs, reason=_("Mute role setup"))
-            return None
-        except discord.errors.Forbidden:
-            return channel.mention
+        failed = []
+        edits = []
+        for channel in channels:
+            if channel.permissions_for(channel.guild.me).manage_permissions:
+                edits.append(OverwriteEdit(channel, role, overs))
+            else:
+                failed.append(channel)
+        errors = await self._overwrites.apply(edits, reason=_("Mute role setup"))
+        failed.extend(edit.channel for edit, _error in errors)
+        return [channel.mention for channel in failed]
 
     @muteset.command(name="defaulttime", aliases=["time"])
     @commands.mod_or_permissions(manage_messages=True)
@@ -1560,11 +1595,14 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                 self._channel_mute_events[guild.id] = asyncio.Event()
             for user in users:
                 tasks = []
-                for channel in guild.channels:
+                for channel_id in self._get_member_channel_mutes(guild.id, user.id):
+                    if (channel := guild.get_channel(channel_id)) is None:
+                        continue
                     tasks.append(
                         self.channel_unmute_user(guild, channel, author, user, audit_reason)
                     )
-                results = await bounded_gather(*tasks)
+                # the overwrite edits are limited by the overwrite executor
+                results = await asyncio.gather(*tasks)
                 for result in results:
                     if not result.success:
                         issue_list.append(result)
@@ -1690,7 +1728,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         if not await self.is_allowed_by_hierarchy(guild, author, user):
             ret.reason = _(MUTE_UNMUTE_ISSUES["hierarchy_problem"])
             return ret
-        mute_role = await self.config.guild(guild).mute_role()
+        mute_role = self.mute_role_cache.get(guild.id)
 
         if mute_role:
             role = guild.get_role(mute_role)
@@ -1721,6 +1759,12 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                     del self._server_mutes[guild.id][user.id]
                 ret.reason = _(MUTE_UNMUTE_ISSUES["permissions_issue_role"])
                 return ret
+            if until:
+                await self._schedule_server_unmute(guild.id, user.id, until.timestamp())
+            else:
+                await scheduler.cancel(
+                    self.qualified_name, self._get_server_unmute_job_id(guild.id, user.id)
+                )
             if user.voice:
                 try:
                     await user.move_to(user.voice.channel)
@@ -1759,7 +1803,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         """
         ret: MuteResponse = MuteResponse(success=False, reason=None, user=user)
 
-        mute_role_id = await self.config.guild(guild).mute_role()
+        mute_role_id = self.mute_role_cache.get(guild.id)
         if not await self.is_allowed_by_hierarchy(guild, author, user):
             ret.reason = _(MUTE_UNMUTE_ISSUES["hierarchy_problem"])
             return ret
@@ -1771,6 +1815,9 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             if guild.id in self._server_mutes:
                 if user.id in self._server_mutes[guild.id]:
                     del self._server_mutes[guild.id][user.id]
+                    await scheduler.cancel(
+                        self.qualified_name, self._get_server_unmute_job_id(guild.id, user.id)
+                    )
             if not guild.me.guild_permissions.manage_roles or mute_role >= guild.me.top_role:
                 reasons.append(_(MUTE_UNMUTE_ISSUES["permissions_issue_role"]))
             else:
@@ -1836,9 +1883,7 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             ret.reason = _(MUTE_UNMUTE_ISSUES["hierarchy_problem"])
             return ret
 
-        if channel.id not in self._channel_mutes:
-            self._channel_mutes[channel.id] = {}
-        current_mute = self._channel_mutes[channel.id].get(user.id)
+        current_mute = self._channel_mutes.get(channel.id, {}).get(user.id)
 
         # Determine if this is voice mute -> channel mute upgrade
         is_mute_upgrade = (
@@ -1872,35 +1917,28 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             )
             return ret
 
-        self._channel_mutes[channel.id][user.id] = {
-            "author": author.id,
-            "guild": guild.id,
-            "member": user.id,
-            "until": until.timestamp() if until else None,
-            "voice_mute": voice_mute,
-        }
+        self._set_channel_mute(
+            channel.id,
+            user.id,
+            {
+                "author": author.id,
+                "guild": guild.id,
+                "member": user.id,
+                "until": until.timestamp() if until else None,
+                "voice_mute": voice_mute,
+            },
+        )
         try:
-            await channel.set_permissions(user, overwrite=overwrites, reason=reason)
+            await self._overwrites.edit(channel, user, overwrites, reason=reason)
             async with self.config.channel(channel).muted_users() as muted_users:
                 muted_users[str(user.id)] = self._channel_mutes[channel.id][user.id]
         except discord.NotFound as e:
-            if channel.id in self._channel_mutes and user.id in self._channel_mutes[channel.id]:
-                del self._channel_mutes[channel.id][user.id]
+            self._pop_channel_mute(channel.id, user.id)
             if e.code == 10003:
-                if (
-                    channel.id in self._channel_mutes
-                    and user.id in self._channel_mutes[channel.id]
-                ):
-                    del self._channel_mutes[channel.id][user.id]
                 ret.reason = _(MUTE_UNMUTE_ISSUES["unknown_channel"])
                 return ret
 
             elif e.code == 10009:
-                if (
-                    channel.id in self._channel_mutes
-                    and user.id in self._channel_mutes[channel.id]
-                ):
-                    del self._channel_mutes[channel.id][user.id]
                 ret.reason = _(MUTE_UNMUTE_ISSUES["left_guild"])
                 return ret
 
@@ -1909,6 +1947,21 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
                 location=channel.mention
             )
             return ret
+        except discord.HTTPException:
+            # the mute isn't saved, so that it can be tried again
+            if current_mute is not None:
+                self._set_channel_mute(channel.id, user.id, current_mute)
+            else:
+                self._pop_channel_mute(channel.id, user.id)
+            ret.reason = _(MUTE_UNMUTE_ISSUES["overwrite_failed"]).format(location=channel.mention)
+            return ret
+
+        if until:
+            await self._schedule_channel_unmute(guild.id, channel.id, user.id, until.timestamp())
+        else:
+            await scheduler.cancel(
+                self.qualified_name, self._get_channel_unmute_job_id(channel.id, user.id)
+            )
 
         if move_channel:
             try:
@@ -1922,6 +1975,17 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
         ret.success = True
         return ret
 
+    async def _keep_channel_mute(
+        self, guild_id: int, channel_id: int, user_id: int, mute: dict
+    ) -> None:
+        """Keep the mute after a failed unmute, so that the unmute can be tried again."""
+        self._set_channel_mute(channel_id, user_id, mute)
+        if mute["until"]:
+            retry_at = datetime.now(timezone.utc) + UNMUTE_RETRY_DELAY
+            await self._schedule_channel_unmute(
+                guild_id, channel_id, user_id, max(mute["until"], retry_at.timestamp())
+            )
+
     async def channel_unmute_user(
         self,
         guild: discord.Guild,
@@ -1968,8 +2032,11 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             return ret
 
         overwrites.update(**old_values)
-        if channel.id in self._channel_mutes and user.id in self._channel_mutes[channel.id]:
-            current_mute = self._channel_mutes[channel.id].pop(user.id)
+        current_mute = self._pop_channel_mute(channel.id, user.id)
+        if current_mute is not None:
+            await scheduler.cancel(
+                self.qualified_name, self._get_channel_unmute_job_id(channel.id, user.id)
+            )
         else:
             ret.reason = _(MUTE_UNMUTE_ISSUES["already_unmuted"]).format(location=channel.mention)
             return ret
@@ -1987,12 +2054,9 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             return ret
 
         try:
-            if overwrites.is_empty():
-                await channel.set_permissions(
-                    user, overwrite=cast(discord.PermissionOverwrite, None), reason=reason
-                )
-            else:
-                await channel.set_permissions(user, overwrite=overwrites, reason=reason)
+            await self._overwrites.edit(
+                channel, user, None if overwrites.is_empty() else overwrites, reason=reason
+            )
             async with self.config.channel(channel).muted_users() as muted_users:
                 if str(user.id) in muted_users:
                     del muted_users[str(user.id)]
@@ -2004,6 +2068,16 @@ class Mutes(VoiceMutes, commands.Cog, metaclass=CompositeMetaClass):
             elif e.code == 10009:
                 ret.reason = _(MUTE_UNMUTE_ISSUES["left_guild"])
                 return ret
+        except discord.Forbidden:
+            await self._keep_channel_mute(guild.id, channel.id, user.id, current_mute)
+            ret.reason = _(MUTE_UNMUTE_ISSUES["permissions_issue_channel"]).format(
+                location=channel.mention
+            )
+            return ret
+        except discord.HTTPException:
+            await self._keep_channel_mute(guild.id, channel.id, user.id, current_mute)
+            ret.reason = _(MUTE_UNMUTE_ISSUES["overwrite_failed"]).format(location=channel.mention)
+            return ret
 
         if move_channel:
             try:
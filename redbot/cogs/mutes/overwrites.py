@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import discord
+
+log = logging.getLogger("red.cogs.mutes")
+
+
+class OverwriteEdit(NamedTuple):
+    channel: discord.abc.GuildChannel
+    target: Union[discord.Member, discord.Role]
+    #: The new overwrite, ``None`` removes the target's overwrite.
+    overwrite: Optional[discord.PermissionOverwrite]
+
+
+class OverwriteExecutor:
+    """
+    Applies permission overwrite edits with bounded concurrency.
+
+    Up to ``max_concurrency`` edits are made at once. Each time Discord rate limits
+    an edit or fails with a server error, the concurrency is halved and the edit is retried
+    after the time Discord asked for (or an exponential backoff), up to ``max_retries`` times.
+    The concurrency grows back by one after each streak of successful edits.
+
+    The executor is shared by all edits of the cog, so concurrent mutes and unmutes
+    back off together.
+    """
+
+    def __init__(
+        self, *, max_concurrency: int = 10, max_retries: int = 3, retry_delay: float = 1
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._limit = max_concurrency
+        self._active = 0
+        self._successes = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def concurrency(self) -> int:
+        """The current maximum number of edits made at once."""
+        return self._limit
+
+    async def _acquire(self) -> None:
+        while self._active >= self._limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                # pass the wakeup on in case this waiter got cancelled after being woken up
+                self._wake_up()
+                raise
+        self._active += 1
+
+    def _release(self, *, throttle: bool = False) -> None:
+        self._active -= 1
+        if throttle:
+            self._successes = 0
+            new_limit = max(1, self._limit // 2)
+            if new_limit != self._limit:
+                log.debug("Lowering the concurrency of overwrite edits to %s.", new_limit)
+            self._limit = new_limit
+        else:
+            self._successes += 1
+            if self._successes >= self._limit and self._limit < self.max_concurrency:
+                self._successes = 0
+                self._limit += 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        free = self._limit - self._active
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def edit(
+        self,
+        channel: discord.abc.GuildChannel,
+        target: Union[discord.Member, discord.Role],
+        overwrite: Optional[discord.PermissionOverwrite],
+        *,
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Set the target's overwrite in the channel.
+
+        Raises
+        ------
+        discord.HTTPException
+            The edit failed, or kept failing with server errors.
+        """
+        attempt = 0
+        while True:
+            await self._acquire()
+            try:
+                await channel.set_permissions(target, overwrite=overwrite, reason=reason)
+            except discord.RateLimited as e:
+                # discord.py doesn't wait out rate limits that are too long,
+                # this doesn't count as a failed attempt since Discord said when to retry
+                self._release(throttle=True)
+                await asyncio.sleep(e.retry_after)
+                continue
+            except discord.HTTPException as e:
+                transient = e.status == 429 or e.status >= 500
+                self._release(throttle=transient)
+                if not transient:
+                    raise
+                if attempt >= self.max_retries:
+                    raise
+            except BaseException:
+                self._release()
+                raise
+            else:
+                self._release()
+                return
+
+            await asyncio.sleep(self.retry_delay * 2**attempt)
+            attempt += 1
+
+    async def apply(
+        self, edits: Iterable[OverwriteEdit], *, reason: Optional[str] = None
+    ) -> List[Tuple[OverwriteEdit, discord.HTTPException]]:
+        """
+        Apply the edits, returning the errors of the edits that failed.
+
+        Edits of overwrites that are already set are skipped,
+        so applying the same edits again resumes a partially failed run.
+        """
+        edits = [edit for edit in edits if not self._is_applied(edit)]
+
+        async def apply_one(edit: OverwriteEdit) -> Optional[discord.HTTPException]:
+            try:
+                await self.edit(*edit, reason=reason)
+            except discord.HTTPException as e:
+                return e
+            return None
+
+        results = await asyncio.gather(*map(apply_one, edits))
+        return [(edit, error) for edit, error in zip(edits, results) if error is not None]
+
+    @staticmethod
+    def _is_applied(edit: OverwriteEdit) -> bool:
+        current = edit.channel.overwrites_for(edit.target)
+        if edit.overwrite is None:
+            return current.is_empty()
+        return current == edit.overwrite
@@ -4,7 +4,7 @@ import time
 import random
 from collections import Counter
 import discord
-from redbot.core import bank, errors
+from redbot.core import bank
 from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box, bold, humanize_list, humanize_number
 from redbot.core.utils.common_filters import normalize_smartquotes
@@ -324,12 +324,8 @@ class TriviaSession:
         payout = MAX_VALUE if payout > MAX_VALUE else payout
         if payout <= 0:
             return
-        for winner in winners:
-            LOG.debug("Paying trivia winner: %d credits --> %s", payout, winner)
-            try:
-                await bank.deposit_credits(winner, payout)
-            except errors.BalanceTooHigh as e:
-                await bank.set_balance(winner, e.max_balance)
+        LOG.debug("Paying trivia winners: %d credits --> %s", payout, winners)
+        await bank.bulk_deposit({winner: payout for winner in winners}, clamp_to_max=True)
         if len(winners) > 1:
             msg = _(
                 "Congratulations {users}! You have each received {num} {currency} for winning!"
@@ -1,8 +1,11 @@
+from bisect import bisect_right
 from copy import copy
 import asyncio
+from typing import List, Optional
+
 import discord
 
-from redbot.core import Config, commands
+from redbot.core import commands
 from redbot.core.commands.requires import PrivilegeLevel
 from redbot.core.i18n import Translator
 from redbot.core.utils.predicates import MessagePredicate
@@ -10,37 +13,47 @@ from redbot.core.utils.predicates import MessagePredicate
 _ = Translator("Warnings", __file__)
 
 
+class ActionThresholds:
+    """The guild's automated actions, sorted by their points thresholds."""
+
+    def __init__(self, actions: List[dict]):
+        # Config keeps the actions in decreasing order of points, with the actions
+        # with the same points in the order they were added. Reversing the list first
+        # makes the earliest added action the last one among the actions with the same points.
+        self._actions = sorted(reversed(actions), key=lambda a: a["points"])
+        self._points = [a["points"] for a in self._actions]
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def exceeded(self, points: int) -> Optional[dict]:
+        """Get the highest action with a threshold the points are at or above."""
+        idx = bisect_right(self._points, points)
+        return self._actions[idx - 1] if idx else None
+
+    def dropped(self, points: int) -> Optional[dict]:
+        """Get the action to reverse when points are removed from a user with the given points.
+
+        This is the lowest action, as long as the points are at or above all thresholds.
+        """
+        if self._points and points >= self._points[-1]:
+            return self._actions[0]
+        return None
+
+
 async def warning_points_add_check(
-    config: Config, ctx: commands.Context, user: discord.Member, points: int
+    actions: ActionThresholds, ctx: commands.Context, user: discord.Member, points: int
 ):
     """Handles any action that needs to be taken or not based on the points"""
-    guild = ctx.guild
-    guild_settings = config.guild(guild)
-    act = {}
-    async with guild_settings.actions() as registered_actions:
-        for a in registered_actions:
-            # Actions are sorted in decreasing order of points.
-            # The first action we find where the user is above the threshold will be the
-            # highest action we can take.
-            if points >= a["points"]:
-                act = a
-                break
+    act = actions.exceeded(points)
     if act and act["exceed_command"] is not None:  # some action needs to be taken
         await create_and_invoke_context(ctx, act["exceed_command"], user)
 
 
 async def warning_points_remove_check(
-    config: Config, ctx: commands.Context, user: discord.Member, points: int
+    actions: ActionThresholds, ctx: commands.Context, user: discord.Member, points: int
 ):
-    guild = ctx.guild
-    guild_settings = config.guild(guild)
-    act = {}
-    async with guild_settings.actions() as registered_actions:
-        for a in registered_actions:
-            if points >= a["points"]:
-                act = a
-            else:
-                break
+    act = actions.dropped(points)
     if act and act["drop_command"] is not None:  # some action needs to be taken
         await create_and_invoke_context(ctx, act["drop_command"], user)
 
@@ -1,13 +1,15 @@
-import asyncio
 import contextlib
-from datetime import timezone
-from collections import namedtuple
+import logging
+import math
+from datetime import datetime
+from collections import defaultdict, namedtuple
 from copy import copy
-from typing import Union, Literal
+from typing import Dict, List, Tuple, Union, Literal
 
 import discord
 
 from redbot.cogs.warnings.helpers import (
+    ActionThresholds,
     warning_points_add_check,
     get_command_for_exceeded_points,
     get_command_for_dropping_points,
@@ -23,6 +25,13 @@ from redbot.core.utils.menus import menu
 
 
 _ = Translator("Warnings", __file__)
+log = logging.getLogger("red.cogs.warnings")
+
+# Custom group of the warnings received and issued by each user, keyed by the user ID.
+# It's used to find the user's data without going through all members' data.
+_WARNING_INDEX = "WARNING_INDEX"
+#: Number of warnings shown on a single page of `[p]warnings` and `[p]mywarnings`.
+WARNINGS_PER_PAGE = 10
 
 
 @cog_i18n(_)
@@ -39,18 +48,101 @@ class Warnings(commands.Cog):
         "toggle_channel": False,
     }
 
-    default_member = {"total_points": 0, "status": "", "warnings": {}}
+    # warning_ids keeps the IDs of the warnings in the order they were issued
+    default_member = {"total_points": 0, "status": "", "warnings": {}, "warning_ids": []}
 
     def __init__(self, bot: Red):
         super().__init__()
         self.config = Config.get_conf(self, identifier=5757575755)
+        self.config.register_global(schema_version=0)
         self.config.register_guild(**self.default_guild)
         self.config.register_member(**self.default_member)
+        self.config.init_custom(_WARNING_INDEX, 1)
+        # warned_in: {guild ID: True}
+        # issued: {guild ID: {member ID: {warning ID: True}}}
+        self.config.register_custom(_WARNING_INDEX, warned_in={}, issued={})
         self.bot = bot
+        self._action_thresholds: Dict[int, ActionThresholds] = {}
 
     async def cog_load(self) -> None:
+        await self._maybe_update_config()
         await self.register_warningtype()
 
+    async def _maybe_update_config(self):
+        schema_version = await self.config.schema_version()
+
+        if schema_version == 0:
+            await self._schema_0_to_1()
+            schema_version += 1
+            await self.config.schema_version.set(schema_version)
+
+    async def _schema_0_to_1(self):
+        """
+        This builds the index of the warnings received and issued by each user
+        and the ordered list of each member's warning IDs.
+        """
+        all_members = await self.config.all_members()
+        if not all_members:
+            return
+
+        start = datetime.now()
+        log.info(
+            "Config conversion to schema_version 1 started. This may take a while to proceed..."
+        )
+        index = defaultdict(lambda: {"warned_in": {}, "issued": {}})
+        for guild_id, guild_data in all_members.items():
+            async for member_id, member_data in AsyncIter(guild_data.items(), steps=100):
+                index[member_id]["warned_in"][str(guild_id)] = True
+                warnings = member_data.get("warnings", {})
+                if warnings:
+                    await self.config.member_from_ids(guild_id, member_id).warning_ids.set(
+                        list(warnings)
+                    )
+                for warn_id, warning in warnings.items():
+                    if warning.get("mod", 0xDE1) == 0xDE1:
+                        continue
+                    issued = index[warning["mod"]]["issued"]
+                    issued.setdefault(str(guild_id), {}).setdefault(str(member_id), {})[
+                        warn_id
+                    ] = True
+        async for user_id, data in AsyncIter(index.items(), steps=100):
+            await self.config.custom(_WARNING_INDEX, user_id).set(data)
+
+        log.info(
+            "Config conversion to schema_version 1 done. It took %s to proceed.",
+            datetime.now() - start,
+        )
+
+    async def _get_action_thresholds(self, guild: discord.Guild) -> ActionThresholds:
+        thresholds = self._action_thresholds.get(guild.id)
+        if thresholds is None:
+            actions = await self.config.guild(guild).actions()
+            thresholds = self._action_thresholds[guild.id] = ActionThresholds(actions)
+        return thresholds
+
+    async def get_warnings_page(
+        self, guild_id: int, user_id: int, page: int = 0, *, per_page: int = WARNINGS_PER_PAGE
+    ) -> Tuple[List[Tuple[str, dict]], int]:
+        """Get a page of the member's warnings.
+
+        Returns the ``(warning ID, warning)`` pairs on the page, from the oldest warning,
+        and the number of pages. The pages past the last page return the last page.
+
+        Only the warnings on the page are read.
+        """
+        member_settings = self.config.member_from_ids(guild_id, user_id)
+        warning_ids = await member_settings.warning_ids()
+        page_count = max(1, math.ceil(len(warning_ids) / per_page))
+        start = min(page, page_count - 1) * per_page
+        entries = []
+        for warn_id in warning_ids[start : start + per_page]:
+            try:
+                warning = await member_settings.get_raw("warnings", warn_id)
+            except KeyError:
+                continue
+            entries.append((warn_id, warning))
+        return entries, page_count
+
     async def red_delete_data_for_user(
         self,
         *,
@@ -60,31 +152,32 @@ class Warnings(commands.Cog):
         if requester != "discord_deleted_user":
             return
 
-        all_members = await self.config.all_members()
-
-        c = 0
-
-        for guild_id, guild_data in all_members.items():
-            c += 1
-            if not c % 100:
-                await asyncio.sleep(0)
-
-            if user_id in guild_data:
-                await self.config.member_from_ids(guild_id, user_id).clear()
-
-            for remaining_user, user_warns in guild_data.items():
-                c += 1
-                if not c % 100:
-                    await asyncio.sleep(0)
+        index = self.config.custom(_WARNING_INDEX, user_id)
+        data = await index.all()
+
+        async for guild_id in AsyncIter(data["warned_in"], steps=100):
+            member_settings = self.config.member_from_ids(int(guild_id), user_id)
+            warnings = await member_settings.get_raw("warnings", default={})
+            # the user's ID is removed from the index of the moderators who warned them
+            for mod_id in {warning["mod"] for warning in warnings.values()}:
+                if mod_id != 0xDE1:
+                    await self.config.custom(_WARNING_INDEX, mod_id).clear_raw(
+                        "issued", guild_id, str(user_id)
+                    )
+            await member_settings.clear()
 
-                for warn_id, warning in user_warns.get("warnings", {}).items():
-                    c += 1
-                    if not c % 100:
-                        await asyncio.sleep(0)
+        for guild_id, members in data["issued"].items():
+            async for member_id, warn_ids in AsyncIter(members.items(), steps=100):
+                grp = self.config.member_from_ids(int(guild_id), int(member_id))
+                for warn_id in warn_ids:
+                    try:
+                        await grp.get_raw("warnings", warn_id)
+                    except KeyError:
+                        # the warning was removed since
+                        continue
+                    await grp.set_raw("warnings", warn_id, "mod", value=0xDE1)
 
-                    if warning.get("mod", 0) == user_id:
-                        grp = self.config.member_from_ids(guild_id, remaining_user)
-                        await grp.set_raw("warnings", warn_id, "mod", value=0xDE1)
+        await index.clear()
 
     # We're not utilising modlog yet - no need to register a casetype
     @staticmethod
@@ -240,6 +333,7 @@ class Warnings(commands.Cog):
                 # finding the highest possible action to take
                 registered_actions.sort(key=lambda a: a["points"], reverse=True)
                 await ctx.send(_("Action {name} has been added.").format(name=name))
+        self._action_thresholds.pop(guild.id, None)
 
     @warnaction.command(name="delete", aliases=["del", "remove"])
     @commands.guild_only()
@@ -258,6 +352,7 @@ class Warnings(commands.Cog):
                 await ctx.tick()
             else:
                 await ctx.send(_("No action named {name} exists!").format(name=action_name))
+        self._action_thresholds.pop(guild.id, None)
 
     @commands.group()
     @commands.guild_only()
@@ -340,28 +435,27 @@ class Warnings(commands.Cog):
         guild = ctx.guild
         guild_settings = self.config.guild(guild)
         msg_list = []
-        async with guild_settings.actions() as registered_actions:
-            for r in registered_actions:
-                if await ctx.embed_requested():
-                    em = discord.Embed(
-                        title=_("Action: {name}").format(name=r["action_name"]),
-                        color=await ctx.embed_colour(),
-                    )
-                    em.add_field(name=_("Points"), value="{}".format(r["points"]), inline=False)
-                    em.add_field(
-                        name=_("Exceed command"),
-                        value=r["exceed_command"],
-                        inline=False,
-                    )
-                    em.add_field(name=_("Drop command"), value=r["drop_command"], inline=False)
-                    msg_list.append(em)
-                else:
-                    msg_list.append(
-                        _(
-                            "Name: {action_name}\nPoints: {points}\n"
-                            "Exceed command: {exceed_command}\nDrop command: {drop_command}"
-                        ).format(**r)
-                    )
+        for r in await guild_settings.actions():
+            if await ctx.embed_requested():
+                em = discord.Embed(
+                    title=_("Action: {name}").format(name=r["action_name"]),
+                    color=await ctx.embed_colour(),
+                )
+                em.add_field(name=_("Points"), value="{}".format(r["points"]), inline=False)
+                em.add_field(
+                    name=_("Exceed command"),
+                    value=r["exceed_command"],
+                    inline=False,
+                )
+                em.add_field(name=_("Drop command"), value=r["drop_command"], inline=False)
+                msg_list.append(em)
+            else:
+                msg_list.append(
+                    _(
+                        "Name: {action_name}\nPoints: {points}\n"
+                        "Exceed command: {exceed_command}\nDrop command: {drop_command}"
+                    ).format(**r)
+                )
         if msg_list:
             await menu(ctx, msg_list)
         else:
@@ -466,11 +560,21 @@ class Warnings(commands.Cog):
                     " but I wasn't able to send them a warn message."
                 ).format(user=member.mention)
             )
-        async with member_settings.warnings() as user_warnings:
-            user_warnings.update(warning_to_add)
+        warn_id = str(ctx.message.id)
+        await member_settings.set_raw("warnings", warn_id, value=warning_to_add[warn_id])
+        async with member_settings.warning_ids() as warning_ids:
+            warning_ids.append(warn_id)
         current_point_count += reason_type["points"]
         await member_settings.total_points.set(current_point_count)
-        await warning_points_add_check(self.config, ctx, member, current_point_count)
+        await self.config.custom(_WARNING_INDEX, member.id).set_raw(
+            "warned_in", str(guild.id), value=True
+        )
+        await self.config.custom(_WARNING_INDEX, ctx.author.id).set_raw(
+            "issued", str(guild.id), str(member.id), warn_id, value=True
+        )
+        await warning_points_add_check(
+            await self._get_action_thresholds(guild), ctx, member, current_point_count
+        )
 
         toggle_channel = guild_settings["toggle_channel"]
         if toggle_channel:
@@ -523,81 +627,75 @@ class Warnings(commands.Cog):
             channel=None,
         )
 
+    async def _send_warnings_page(
+        self, ctx: commands.Context, member: Union[discord.Member, discord.Object], page: int
+    ) -> bool:
+        """Send a page of the member's warnings, returning whether the member has any."""
+        entries, page_count = await self.get_warnings_page(ctx.guild.id, member.id, page - 1)
+        # the last page is shown instead of the pages past it
+        page = min(page, page_count)
+        if not entries:
+            return False
+
+        msg = ""
+        for key, warning in entries:
+            mod_id = warning["mod"]
+            if mod_id == 0xDE1:
+                mod = _("Deleted Moderator")
+            else:
+                bot = ctx.bot
+                mod = bot.get_user(mod_id) or _("Unknown Moderator ({})").format(mod_id)
+            msg += _(
+                "{num_points} point warning {reason_name} issued by {user} for " "{description}\n"
+            ).format(
+                num_points=warning["points"],
+                reason_name=key,
+                user=mod,
+                description=warning["description"],
+            )
+        if page_count > 1:
+            msg += "\n" + _("Page {page}/{page_count}").format(page=page, page_count=page_count)
+        await ctx.send_interactive(
+            pagify(msg, shorten_by=58),
+            box_lang=_("Warnings for {user}").format(
+                user=member if isinstance(member, discord.Member) else member.id
+            ),
+        )
+        return True
+
     @commands.command()
     @commands.guild_only()
     @commands.admin()
-    async def warnings(self, ctx: commands.Context, member: Union[discord.Member, int]):
-        """List the warnings for the specified user."""
+    async def warnings(
+        self,
+        ctx: commands.Context,
+        member: Union[discord.Member, int],
+        page: commands.Range[int, 1, None] = 1,
+    ):
+        """List the warnings for the specified user.
+
+        `[page]` is the page of the warnings to show, 10 warnings are shown on each page.
+        """
 
         try:
             userid: int = member.id
         except AttributeError:
             userid: int = member
-            member = ctx.guild.get_member(userid)
-            member = member or namedtuple("Member", "id guild")(userid, ctx.guild)
+            member = ctx.guild.get_member(userid) or discord.Object(userid)
 
-        msg = ""
-        member_settings = self.config.member(member)
-        async with member_settings.warnings() as user_warnings:
-            if not user_warnings.keys():  # no warnings for the user
-                await ctx.send(_("That user has no warnings!"))
-            else:
-                for key in user_warnings.keys():
-                    mod_id = user_warnings[key]["mod"]
-                    if mod_id == 0xDE1:
-                        mod = _("Deleted Moderator")
-                    else:
-                        bot = ctx.bot
-                        mod = bot.get_user(mod_id) or _("Unknown Moderator ({})").format(mod_id)
-                    msg += _(
-                        "{num_points} point warning {reason_name} issued by {user} for "
-                        "{description}\n"
-                    ).format(
-                        num_points=user_warnings[key]["points"],
-                        reason_name=key,
-                        user=mod,
-                        description=user_warnings[key]["description"],
-                    )
-                await ctx.send_interactive(
-                    pagify(msg, shorten_by=58),
-                    box_lang=_("Warnings for {user}").format(
-                        user=member if isinstance(member, discord.Member) else member.id
-                    ),
-                )
+        if not await self._send_warnings_page(ctx, member, page):
+            await ctx.send(_("That user has no warnings!"))
 
     @commands.command()
     @commands.guild_only()
-    async def mywarnings(self, ctx: commands.Context):
-        """List warnings for yourself."""
+    async def mywarnings(self, ctx: commands.Context, page: commands.Range[int, 1, None] = 1):
+        """List warnings for yourself.
 
-        user = ctx.author
+        `[page]` is the page of the warnings to show, 10 warnings are shown on each page.
+        """
 
-        msg = ""
-        member_settings = self.config.member(user)
-        async with member_settings.warnings() as user_warnings:
-            if not user_warnings.keys():  # no warnings for the user
-                await ctx.send(_("You have no warnings!"))
-            else:
-                for key in user_warnings.keys():
-                    mod_id = user_warnings[key]["mod"]
-                    if mod_id == 0xDE1:
-                        mod = _("Deleted Moderator")
-                    else:
-                        bot = ctx.bot
-                        mod = bot.get_user(mod_id) or _("Unknown Moderator ({})").format(mod_id)
-                    msg += _(
-                        "{num_points} point warning {reason_name} issued by {user} for "
-                        "{description}\n"
-                    ).format(
-                        num_points=user_warnings[key]["points"],
-                        reason_name=key,
-                        user=mod,
-                        description=user_warnings[key]["description"],
-                    )
-                await ctx.send_interactive(
-                    pagify(msg, shorten_by=58),
-                    box_lang=_("Warnings for {user}").format(user=user),
-                )
+        if not await self._send_warnings_page(ctx, ctx.author, page):
+            await ctx.send(_("You have no warnings!"))
 
     @commands.command()
     @commands.guild_only()
@@ -627,14 +725,25 @@ class Warnings(commands.Cog):
 
         member_settings = self.config.member(member)
         current_point_count = await member_settings.total_points()
-        await warning_points_remove_check(self.config, ctx, member, current_point_count)
-        async with member_settings.warnings() as user_warnings:
-            if warn_id not in user_warnings.keys():
-                return await ctx.send(_("That warning doesn't exist!"))
-            else:
-                current_point_count -= user_warnings[warn_id]["points"]
-                await member_settings.total_points.set(current_point_count)
-                user_warnings.pop(warn_id)
+        await warning_points_remove_check(
+            await self._get_action_thresholds(guild), ctx, member, current_point_count
+        )
+        try:
+            warning = await member_settings.get_raw("warnings", warn_id)
+        except KeyError:
+            return await ctx.send(_("That warning doesn't exist!"))
+        current_point_count -= warning["points"]
+        await member_settings.total_points.set(current_point_count)
+        await member_settings.clear_raw("warnings", warn_id)
+        async with member_settings.warning_ids() as warning_ids:
+            with contextlib.suppress(ValueError):
+                warning_ids.remove(warn_id)
+            has_warnings = bool(warning_ids)
+        await self.config.custom(_WARNING_INDEX, warning["mod"]).clear_raw(
+            "issued", str(guild.id), str(user_id), warn_id
+        )
+        if not has_warnings:
+            await self.config.custom(_WARNING_INDEX, user_id).clear_raw("warned_in", str(guild.id))
         await modlog.create_case(
             self.bot,
             ctx.guild,
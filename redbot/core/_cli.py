@@ -129,6 +129,15 @@ def message_cache_size_int(arg: str) -> int:
     return x
 
 
+def loop_lag_threshold_int(arg: str) -> int:
+    x = non_negative_int(arg)
+    if x < 10:
+        raise argparse.ArgumentTypeError(
+            "Event loop lag threshold has to be greater than or equal to 10 milliseconds."
+        )
+    return x
+
+
 def parse_cli_flags(args):
     parser = argparse.ArgumentParser(
         description="Red - Discord Bot", usage="redbot <instance_name> [arguments]"
@@ -298,6 +307,20 @@ def parse_cli_flags(args):
         " to see what each intent does.\n"
         "This flag can be used multiple times to specify multiple intents.",
     )
+    parser.add_argument(
+        "--monitor-loop-lag",
+        action="store_true",
+        help="Enables the event loop lag monitor which logs and aggregates the code"
+        " that blocks the event loop for longer than the threshold set with"
+        " the --loop-lag-threshold flag.",
+    )
+    parser.add_argument(
+        "--loop-lag-threshold",
+        type=loop_lag_threshold_int,
+        default=250,
+        help="Set the event loop lag (in milliseconds) after which the event loop"
+        " is considered blocked by the event loop lag monitor. Defaults to 250.",
+    )
     parser.add_argument(
         "--force-rich-logging",
         action="store_true",
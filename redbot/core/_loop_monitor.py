@@ -0,0 +1,262 @@
+"""Event loop lag monitor that samples the stack of the blocked loop thread."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import sysconfig
+import threading
+import time
+import traceback
+from collections import deque
+from types import FrameType
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from ._timings import TimingHistogram
+
+__all__ = ("LoopLagMonitor",)
+
+log = logging.getLogger("red.loop_monitor")
+
+#: Maximum number of distinct culprits kept in the aggregated summary.
+MAX_CULPRITS = 100
+#: Number of the most recent stalls kept in the summary.
+MAX_RECENT_STALLS = 20
+#: Number of the innermost frames kept from a sampled stack.
+STACK_DEPTH = 15
+
+_LIBRARY_PATHS = tuple(
+    {
+        path
+        for name, path in sysconfig.get_paths().items()
+        if name in ("stdlib", "platstdlib", "purelib", "platlib")
+    }
+)
+
+
+class _Culprit(NamedTuple):
+    owner: str
+    location: str
+
+
+class _CulpritStats:
+    __slots__ = ("count", "total", "max", "stack")
+
+    def __init__(self, stack: List[str]) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.stack = stack
+
+
+def _get_owner(module_name: str) -> str:
+    if module_name.startswith("redbot.cogs."):
+        return module_name.split(".", 3)[2]
+    if module_name == "redbot" or module_name.startswith("redbot."):
+        return "core"
+    return module_name.partition(".")[0]
+
+
+def _find_culprit(frame: FrameType) -> Tuple[_Culprit, List[str]]:
+    """
+    Find the frame responsible for blocking and format the stack of the given frame.
+
+    The responsible frame is the innermost frame that belongs either to Red
+    or to code that isn't part of the standard library or an installed package
+    (i.e. 3rd-party cogs). If there's no such frame, the innermost frame is used.
+    """
+    culprit = None
+    innermost = None
+    for stack_frame, lineno in traceback.walk_stack(frame):
+        code = stack_frame.f_code
+        module_name = stack_frame.f_globals.get("__name__", "")
+        location = f"{code.co_filename}:{lineno} ({code.co_name})"
+        if innermost is None:
+            innermost = _Culprit(_get_owner(module_name), location)
+        if module_name.startswith("redbot.") or not code.co_filename.startswith(_LIBRARY_PATHS):
+            culprit = _Culprit(_get_owner(module_name), location)
+            break
+
+    stack = traceback.format_stack(frame, limit=STACK_DEPTH)
+    return culprit or innermost or _Culprit("unknown", "unknown"), stack
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop runs a periodic callback.
+
+    When the lag goes over the threshold, a watchdog thread samples the stack
+    of the thread running the event loop so that the blocking code can be found.
+
+    Parameters
+    ----------
+    threshold : float
+        The lag (in seconds) after which the loop is considered blocked.
+    interval : float, optional
+        How often (in seconds) the lag is measured.
+        Defaults to half of the threshold, but no more than one second.
+    """
+
+    def __init__(self, threshold: float, interval: Optional[float] = None) -> None:
+        self.threshold = threshold
+        self.interval = interval if interval is not None else min(threshold / 2, 1.0)
+        self.lag_histogram = TimingHistogram()
+        self.stall_count = 0
+        self.started_at: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._culprits: Dict[_Culprit, _CulpritStats] = {}
+        self._recent_stalls: Deque[Tuple[float, float, _Culprit]] = deque(maxlen=MAX_RECENT_STALLS)
+        self._loop_thread_id: Optional[int] = None
+        # time at which the next beat of the loop is expected
+        self._expected_beat = 0.0
+        # the expected beat for which a stack was sampled and the result of that sampling
+        self._sampled_beat: Optional[float] = None
+        self._sample: Optional[Tuple[_Culprit, List[str]]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the monitor. This needs to be called from the thread running the event loop."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._expected_beat = time.perf_counter() + self.interval
+        self._stopped.clear()
+        self.started_at = time.time()
+        self._task = asyncio.create_task(self._beat_loop())
+        self._watchdog = threading.Thread(
+            target=self._watchdog_loop, name="red-loop-lag-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        log.debug(
+            "Started event loop lag monitor (threshold: %.3fs, interval: %.3fs).",
+            self.threshold,
+            self.interval,
+        )
+
+    def stop(self) -> None:
+        """Stop the monitor."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._watchdog = None
+
+    def reset(self) -> None:
+        """Clear the collected data."""
+        with self._lock:
+            self.lag_histogram.reset()
+            self.stall_count = 0
+            self._culprits.clear()
+            self._recent_stalls.clear()
+
+    async def _beat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            lag = max(now - self._expected_beat, 0.0)
+            expected_beat = self._expected_beat
+            self._expected_beat = now + self.interval
+            self.lag_histogram.record(lag)
+            if lag >= self.threshold:
+                self._record_stall(expected_beat, lag)
+
+    def _watchdog_loop(self) -> None:
+        check_interval = max(self.threshold / 4, 0.005)
+        while not self._stopped.wait(check_interval):
+            expected_beat = self._expected_beat
+            if expected_beat == self._sampled_beat:
+                continue
+            if time.perf_counter() - expected_beat < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            try:
+                sample = _find_culprit(frame)
+            finally:
+                del frame
+            with self._lock:
+                self._sampled_beat = expected_beat
+                self._sample = sample
+
+    def _record_stall(self, expected_beat: float, lag: float) -> None:
+        with self._lock:
+            if self._sampled_beat == expected_beat and self._sample is not None:
+                culprit, stack = self._sample
+            else:
+                # the watchdog didn't manage to sample the stack in time
+                culprit, stack = _Culprit("unknown", "unknown"), []
+            self._sample = None
+
+            self.stall_count += 1
+            self._recent_stalls.append((time.time(), lag, culprit))
+            stats = self._culprits.get(culprit)
+            if stats is None:
+                if len(self._culprits) >= MAX_CULPRITS:
+                    least_common = min(self._culprits, key=lambda c: self._culprits[c].count)
+                    del self._culprits[least_common]
+                stats = self._culprits[culprit] = _CulpritStats(stack)
+            stats.count += 1
+            stats.total += lag
+            if lag > stats.max:
+                stats.max = lag
+            if stack:
+                stats.stack = stack
+
+        log.warning(
+            "The event loop was blocked for %.3fs, most likely by %s in %s.",
+            lag,
+            culprit.owner,
+            culprit.location,
+        )
+        if stack:
+            log.debug("Stack of the blocked event loop:\n%s", "".join(stack))
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Get a summary of the collected data.
+
+        Returns
+        -------
+        Dict[str, Any]
+            JSON serializable summary with the measured ``lag`` statistics,
+            the ``stall_count``, the ``culprits`` sorted by the total time
+            they blocked the loop for and the ``recent_stalls``.
+        """
+        with self._lock:
+            culprits = sorted(self._culprits.items(), key=lambda i: i[1].total, reverse=True)
+            return {
+                "running": self.running,
+                "started_at": self.started_at,
+                "threshold": self.threshold,
+                "interval": self.interval,
+                "lag": self.lag_histogram.to_dict(),
+                "stall_count": self.stall_count,
+                "culprits": [
+                    {
+                        "owner": culprit.owner,
+                        "location": culprit.location,
+                        "count": stats.count,
+                        "total": stats.total,
+                        "max": stats.max,
+                        "stack": stats.stack,
+                    }
+                    for culprit, stats in culprits
+                ],
+                "recent_stalls": [
+                    {
+                        "timestamp": timestamp,
+                        "duration": lag,
+                        "owner": culprit.owner,
+                        "location": culprit.location,
+                    }
+                    for timestamp, lag, culprit in self._recent_stalls
+                ],
+            }
@@ -0,0 +1,332 @@
+"""Low-overhead timing histograms used for Red's performance instrumentation."""
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .commands import Command
+
+__all__ = (
+    "BUCKET_BOUNDS",
+    "PHASES",
+    "PHASE_GLOBAL_CHECKS",
+    "PHASE_CHECKS",
+    "PHASE_REQUIRES",
+    "PHASE_CONVERSION",
+    "PHASE_CALLBACK",
+    "PHASE_SEND",
+    "PHASE_TOTAL",
+    "TimingHistogram",
+    "CommandTimingStats",
+    "CommandTimingsManager",
+    "ListenerTimingStats",
+    "ListenerTimingsManager",
+)
+
+#: Upper bounds (in seconds) of the histogram buckets.
+#: Anything slower than the last bound ends up in the overflow bucket.
+BUCKET_BOUNDS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Phases are indices into the preallocated histogram tuple of `CommandTimingStats`.
+# - global_checks: the bot's call-once checks, done before subcommands are resolved
+# - checks: the bot's, cog's and command's discord.py checks
+# - requires: `Requires.verify()` of the command (and its cog, for top-level commands)
+# - conversion: argument parsing and conversion
+# - callback: the command's callback, this includes the time spent in ``send``
+# - send: `Context.send()` calls done with the command's context
+# - total: the whole invocation, as seen by `Red.invoke()`
+PHASE_GLOBAL_CHECKS = 0
+PHASE_CHECKS = 1
+PHASE_REQUIRES = 2
+PHASE_CONVERSION = 3
+PHASE_CALLBACK = 4
+PHASE_SEND = 5
+PHASE_TOTAL = 6
+
+#: Names of the recorded phases, in the order of their indices.
+PHASES: Tuple[str, ...] = (
+    "global_checks",
+    "checks",
+    "requires",
+    "conversion",
+    "callback",
+    "send",
+    "total",
+)
+
+
+class TimingHistogram:
+    """A fixed-size histogram of durations.
+
+    All storage is allocated upfront so that recording a sample
+    doesn't create any new objects apart from the float sums.
+    """
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.buckets: List[int] = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.buckets[bisect_left(BUCKET_BOUNDS, elapsed)] += 1
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def reset(self) -> None:
+        buckets = self.buckets
+        for idx in range(len(buckets)):
+            buckets[idx] = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the given quantile (between 0 and 1) of the recorded durations.
+
+        The estimate is the upper bound of the bucket the quantile falls into,
+        capped at the maximum recorded duration.
+        """
+        if not self.count:
+            return 0.0
+        threshold = q * self.count
+        seen = 0
+        for idx, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= threshold:
+                if idx < len(BUCKET_BOUNDS):
+                    return min(BUCKET_BOUNDS[idx], self.max)
+                break
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+            "buckets": list(self.buckets),
+        }
+
+
+class CommandTimingStats:
+    """Per-phase timing histograms of a single command."""
+
+    __slots__ = ("histograms",)
+
+    def __init__(self) -> None:
+        self.histograms: Tuple[TimingHistogram, ...] = tuple(TimingHistogram() for _ in PHASES)
+
+    def reset(self) -> None:
+        for histogram in self.histograms:
+            histogram.reset()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            phase: histogram.to_dict()
+            for phase, histogram in zip(PHASES, self.histograms)
+            if histogram.count
+        }
+
+
+class CommandTimingsManager:
+    """Keeps per-command timing histograms, keyed by qualified command name."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled: bool = enabled
+        self._stats: Dict[str, CommandTimingStats] = {}
+
+    def record(self, command: Union[Command, str], phase: int, elapsed: float) -> None:
+        if not self.enabled:
+            return
+        name = command if isinstance(command, str) else command.qualified_name
+        try:
+            stats = self._stats[name]
+        except KeyError:
+            stats = self._stats[name] = CommandTimingStats()
+        stats.histograms[phase].record(elapsed)
+
+    def get_stats(self, command_name: str) -> Optional[CommandTimingStats]:
+        return self._stats.get(command_name)
+
+    def reset(self, command_name: Optional[str] = None) -> None:
+        if command_name is None:
+            self._stats.clear()
+        else:
+            self._stats.pop(command_name, None)
+
+    def to_dict(self, command_name: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if command_name is not None:
+            stats = self._stats.get(command_name)
+            return {command_name: stats.to_dict()} if stats is not None else {}
+        return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+
+class ListenerTimingStats:
+    """
+    Timing statistics of a single event listener.
+
+    ``wall`` is the time between the start and the end of each listener call
+    and ``busy`` is the part of it that was actually spent running the listener's code
+    on the event loop, i.e. without the time spent waiting on I/O or other tasks.
+    """
+
+    __slots__ = ("wall", "busy", "exceptions")
+
+    def __init__(self) -> None:
+        self.wall = TimingHistogram()
+        self.busy = TimingHistogram()
+        self.exceptions = 0
+
+
+class _TimedCoroutine:
+    """Awaitable that drives the wrapped coroutine while measuring the time of each step."""
+
+    __slots__ = ("_coro", "busy")
+
+    def __init__(self, coro: Coroutine[Any, Any, Any]) -> None:
+        self._coro = coro
+        self.busy = 0.0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        coro = self._coro
+        send_value = None
+        exc_to_throw: Optional[BaseException] = None
+        while True:
+            start = time.perf_counter()
+            try:
+                if exc_to_throw is None:
+                    yielded = coro.send(send_value)
+                else:
+                    yielded = coro.throw(exc_to_throw)
+            except StopIteration as exc:
+                self.busy += time.perf_counter() - start
+                return exc.value
+            except BaseException:
+                self.busy += time.perf_counter() - start
+                raise
+            self.busy += time.perf_counter() - start
+
+            try:
+                send_value = yield yielded
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as exc:
+                send_value = None
+                exc_to_throw = exc
+            else:
+                exc_to_throw = None
+
+
+def _get_listener_owner(listener: Callable[..., Any]) -> str:
+    # circular import avoidance
+    from .commands import Cog
+
+    instance = getattr(listener, "__self__", None)
+    if isinstance(instance, Cog):
+        return instance.qualified_name
+    if instance is not None:
+        return type(instance).__name__
+    module_name = getattr(listener, "__module__", None) or "unknown"
+    if module_name.startswith("redbot.core"):
+        return "Red"
+    return module_name
+
+
+class ListenerTimingsManager:
+    """Keeps timings of event listeners, keyed by (event name, owner name, listener name)."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled: bool = enabled
+        self._stats: Dict[Tuple[str, str, str], ListenerTimingStats] = {}
+
+    def wrap(
+        self, listener: Callable[..., Coroutine[Any, Any, Any]], event_name: str
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        """Wrap the listener so that its calls are recorded."""
+        key = (
+            event_name,
+            _get_listener_owner(listener),
+            getattr(listener, "__name__", "unknown"),
+        )
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = ListenerTimingStats()
+
+        async def timed_listener(*args: Any, **kwargs: Any) -> Any:
+            timed = _TimedCoroutine(listener(*args, **kwargs))
+            start = time.perf_counter()
+            try:
+                return await timed
+            except Exception:
+                stats.exceptions += 1
+                raise
+            finally:
+                stats.wall.record(time.perf_counter() - start)
+                stats.busy.record(timed.busy)
+
+        return timed_listener
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """
+        Get the recorded statistics, sorted by the total time
+        the listeners spent running on the event loop.
+        """
+        items = sorted(self._stats.items(), key=lambda item: item[1].busy.total, reverse=True)
+        return [
+            {
+                "event": event_name,
+                "owner": owner,
+                "listener": listener_name,
+                "calls": stats.wall.count,
+                "exceptions": stats.exceptions,
+                "wall": stats.wall.to_dict(),
+                "busy": stats.busy.to_dict(),
+            }
+            for (event_name, owner, listener_name), stats in items
+        ]
@@ -1,16 +1,38 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import itertools
+import json
 import logging
-from datetime import datetime, timezone
-from typing import Union, List, Optional, TYPE_CHECKING, Literal
+import os
+import threading
+import time
+from collections import deque
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Union,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Literal,
+)
 from functools import wraps
 
 import discord
 
 from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import humanize_number
-from . import Config, errors, commands
+from . import Config, data_manager, errors, commands
 from .i18n import Translator
 
 from .errors import BankPruneError
@@ -29,6 +51,12 @@ __all__ = (
     "withdraw_credits",
     "deposit_credits",
     "transfer_credits",
+    "BalanceChange",
+    "Transaction",
+    "get_history",
+    "bulk_set_balance",
+    "bulk_withdraw",
+    "bulk_deposit",
     "wipe_bank",
     "bank_prune",
     "get_leaderboard",
@@ -59,6 +87,9 @@ _DEFAULT_GLOBAL = {
     "currency": "credits",
     "default_balance": 100,
     "max_balance": _MAX_BALANCE,
+    "ledger_enabled": False,
+    "ledger_retention_days": 30,
+    "ledger_snapshot_txid": 0,
 }
 
 _DEFAULT_GUILD = {
@@ -73,6 +104,7 @@ _DEFAULT_MEMBER = {"name": "", "balance": 0, "created_at": 0}
 _DEFAULT_USER = _DEFAULT_MEMBER
 
 _config: Config = None
+_bot_ref: Optional[Red] = None
 
 log = logging.getLogger("red.core.bank")
 
@@ -81,15 +113,441 @@ _data_deletion_lock = asyncio.Lock()
 _cache_is_global = None
 _cache = {"bank_name": None, "currency": None, "default_balance": None, "max_balance": None}
 
+# Leaderboards of the bank scopes (`None` for the global bank, guild ID for local banks).
+# They're built lazily and kept up to date by the functions in this module that write balances.
+_leaderboards: Dict[Optional[int], _Leaderboard] = {}
+# Number of changes made to the accounts of each scope and to all scopes,
+# used to detect changes made while a leaderboard was being built.
+_leaderboard_changes: Dict[Optional[int], int] = {}
+_leaderboard_epoch = 0
+
+# how often (in seconds) the balances recorded in the ledger are saved to Config
+_LEDGER_SNAPSHOT_INTERVAL = 60
+_ledger: Optional[_Ledger] = None
+_ledger_task: Optional[asyncio.Task] = None
+
+
+class _Leaderboard:
+    """The accounts of a bank scope, ordered by their balance."""
+
+    __slots__ = ("accounts", "_order")
+
+    def __init__(self, accounts: Dict[int, dict]) -> None:
+        self.accounts = accounts
+        # ascending order of (-balance, user_id) is the leaderboard order
+        self._order: List[Tuple[int, int]] = sorted(
+            (-account["balance"], user_id) for user_id, account in accounts.items()
+        )
+
+    def __iter__(self) -> Iterator[Tuple[int, dict]]:
+        accounts = self.accounts
+        for _neg_balance, user_id in self._order:
+            yield user_id, accounts[user_id]
+
+    def set(self, user_id: int, account: dict) -> None:
+        self.remove(user_id)
+        self.accounts[user_id] = account
+        insort(self._order, (-account["balance"], user_id))
+
+    def remove(self, user_id: int) -> None:
+        account = self.accounts.pop(user_id, None)
+        if account is not None:
+            del self._order[bisect_left(self._order, (-account["balance"], user_id))]
+
+    def get_position(self, user_id: int) -> Optional[int]:
+        account = self.accounts.get(user_id)
+        if account is None:
+            return None
+        return bisect_left(self._order, (-account["balance"], user_id)) + 1
+
+
+async def _get_leaderboard(scope: Optional[int]) -> _Leaderboard:
+    while (leaderboard := _leaderboards.get(scope)) is None:
+        epoch = _leaderboard_epoch
+        changes = _leaderboard_changes.get(scope, 0)
+        if scope is None:
+            accounts = await _config.all_users()
+        else:
+            accounts = await _config.all_members(discord.Object(scope))
+        if _ledger is not None:
+            accounts.update(_ledger.get_accounts(scope))
+        # the data is outdated if any account was changed while it was being read
+        if epoch == _leaderboard_epoch and changes == _leaderboard_changes.get(scope, 0):
+            _leaderboards[scope] = _Leaderboard(accounts)
+    return leaderboard
+
+
+def _get_scope(member: Union[discord.Member, discord.User], global_bank: bool) -> Optional[int]:
+    return None if global_bank else member.guild.id
+
+
+def _get_scope_group(scope: Optional[int]):
+    if scope is None:
+        return _config._get_base_group(_config.USER)
+    return _config._get_base_group(_config.MEMBER, str(scope))
+
+
+async def _get_raw_account(scope: Optional[int], user_id: int) -> Optional[dict]:
+    """Get the raw data of an account or `None` if the user doesn't have an account."""
+    account = _ledger.get_account(scope, user_id) if _ledger is not None else None
+    if account is None:
+        try:
+            account = await _get_scope_group(scope).get_raw(str(user_id))
+        except KeyError:
+            return None
+    return {**_DEFAULT_MEMBER, **account}
+
+
+def _update_leaderboard(scope: Optional[int], user_id: int, account: Optional[dict]) -> None:
+    _leaderboard_changes[scope] = _leaderboard_changes.get(scope, 0) + 1
+    leaderboard = _leaderboards.get(scope)
+    if leaderboard is None:
+        return
+    if account is None:
+        leaderboard.remove(user_id)
+    else:
+        leaderboard.set(user_id, account)
+
+
+def _invalidate_leaderboards(scope: Optional[int] = ..., *, local_only: bool = False) -> None:
+    """Drop the leaderboard of the given scope, or of all scopes if it isn't passed."""
+    global _leaderboard_epoch
+
+    if scope is not ...:
+        _leaderboard_changes[scope] = _leaderboard_changes.get(scope, 0) + 1
+        _leaderboards.pop(scope, None)
+        return
+    _leaderboard_epoch += 1
+    if local_only:
+        global_leaderboard = _leaderboards.get(None)
+        _leaderboards.clear()
+        if global_leaderboard is not None:
+            _leaderboards[None] = global_leaderboard
+    else:
+        _leaderboards.clear()
 
-async def _init():
+
+class Transaction(NamedTuple):
+    """A change of an account's balance recorded in the bank's ledger."""
+
+    id: int
+    created_at: datetime
+    change: int
+    balance: int
+
+
+class _Ledger:
+    """
+    Append-only log of all balance changes, stored as one JSON lines file per (UTC) day.
+
+    In ledger mode, balances are written to the ledger instead of Config
+    and the accounts changed since the last snapshot are kept in memory.
+    Snapshots save those accounts to Config and record the ID of the last
+    transaction they include, so that only the newer transactions need
+    to be replayed after a crash.
+
+    Transactions are written by a thread, in batches of the transactions
+    recorded while the previous batch was being written.
+    """
+
+    def __init__(self, path: Path, retention_days: Optional[int]) -> None:
+        self.path = path
+        self.retention_days = retention_days
+        self.next_txid = 1
+        # accounts changed since the last snapshot, by scope and user ID
+        self.pending: Dict[Optional[int], Dict[int, dict]] = {}
+        # accounts that are currently being saved by a snapshot
+        self._snapshotting: Dict[Optional[int], Dict[int, dict]] = {}
+        self._snapshot_lock = asyncio.Lock()
+        # transactions waiting to be written to the current segment
+        self._buffer: Deque[dict] = deque()
+        self._write_task: Optional[asyncio.Task] = None
+        # held by the threads that write or rewrite the segments
+        self._file_lock = threading.Lock()
+        self._file = None
+        self._file_date: Optional[str] = None
+
+    def _segment_paths(self) -> List[Path]:
+        return sorted(self.path.glob("*.jsonl"))
+
+    @staticmethod
+    def _read_segment(path: Path) -> Iterator[dict]:
+        with path.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # the last line may be incomplete if the bot was killed while writing it
+                    pass
+
+    def _replay(self, snapshot_txid: int) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        for path in self._segment_paths():
+            for entry in self._read_segment(path):
+                self.next_txid = max(self.next_txid, entry["id"] + 1)
+                if entry["id"] > snapshot_txid:
+                    self.pending.setdefault(entry["scope"], {})[entry["user"]] = {
+                        "name": entry["name"],
+                        "balance": entry["balance"],
+                        "created_at": entry["created_at"],
+                    }
+
+    async def load(self, snapshot_txid: int) -> None:
+        """Load the transactions that are newer than the last snapshot."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._replay, snapshot_txid)
+        self.next_txid = max(self.next_txid, snapshot_txid + 1)
+
+    def get_account(self, scope: Optional[int], user_id: int) -> Optional[dict]:
+        for accounts in (self.pending, self._snapshotting):
+            account = accounts.get(scope, {}).get(user_id)
+            if account is not None:
+                return account
+        return None
+
+    def get_accounts(self, scope: Optional[int]) -> Dict[int, dict]:
+        return {**self._snapshotting.get(scope, {}), **self.pending.get(scope, {})}
+
+    def append(self, scope: Optional[int], user_id: int, old_balance: int, account: dict) -> int:
+        """
+        Record the new state of an account and return the ID of the transaction.
+
+        The transactions are written to the current segment in batches, in a thread.
+        """
+        txid = self.next_txid
+        self.next_txid += 1
+        self._buffer.append(
+            {
+                "id": txid,
+                "time": time.time(),
+                "scope": scope,
+                "user": user_id,
+                "change": account["balance"] - old_balance,
+                **account,
+            }
+        )
+        self.pending.setdefault(scope, {})[user_id] = account
+        if self._write_task is None or self._write_task.done():
+            self._write_task = asyncio.create_task(self._write_loop())
+        return txid
+
+    async def _write_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._buffer:
+            await loop.run_in_executor(None, self._write_buffered)
+
+    def _write_buffered(self) -> None:
+        with self._file_lock:
+            while self._buffer:
+                entry = self._buffer.popleft()
+                date = datetime.fromtimestamp(entry["time"], timezone.utc).strftime("%Y-%m-%d")
+                if date != self._file_date:
+                    self._close_file()
+                    self.path.mkdir(parents=True, exist_ok=True)
+                    self._file = (self.path / f"{date}.jsonl").open("a", encoding="utf-8")
+                    self._file_date = date
+                self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            if self._file is not None:
+                self._file.flush()
+
+    async def flush(self) -> None:
+        """Wait until the recorded transactions are written to the ledger."""
+        while self._write_task is not None and not self._write_task.done():
+            await asyncio.shield(self._write_task)
+
+    async def snapshot(self) -> None:
+        """Save the accounts changed since the last snapshot to Config."""
+        async with self._snapshot_lock:
+            if self.pending:
+                await self._snapshot()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._remove_expired_segments)
+
+    async def _snapshot(self) -> None:
+        last_txid = self.next_txid - 1
+        self._snapshotting, self.pending = self.pending, {}
+        try:
+            for scope, accounts in self._snapshotting.items():
+                group = _get_scope_group(scope)
+                async with group.get_lock():
+                    # only the changed accounts are written
+                    for user_id, account in accounts.items():
+                        await group.set_raw(str(user_id), value=account)
+            await _config.ledger_snapshot_txid.set(last_txid)
+        except BaseException:
+            # the accounts changed since the snapshot started are newer
+            for scope, accounts in self._snapshotting.items():
+                self.pending[scope] = {**accounts, **self.pending.get(scope, {})}
+            raise
+        finally:
+            self._snapshotting = {}
+
+    def _remove_expired_segments(self) -> None:
+        if self.retention_days is None:
+            return
+        # all segments except for the current one were fully included in the last snapshot
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+        cutoff_name = f"{cutoff:%Y-%m-%d}.jsonl"
+        with self._file_lock:
+            for path in self._segment_paths():
+                if path.name < cutoff_name and path.name != f"{self._file_date}.jsonl":
+                    path.unlink()
+
+    def _read_history(
+        self, scope: Optional[int], user_id: int, limit: Optional[int]
+    ) -> List[Transaction]:
+        history = []
+        for path in reversed(self._segment_paths()):
+            entries = [
+                entry
+                for entry in self._read_segment(path)
+                if entry["user"] == user_id and entry["scope"] == scope
+            ]
+            for entry in reversed(entries):
+                history.append(
+                    Transaction(
+                        id=entry["id"],
+                        created_at=datetime.fromtimestamp(entry["time"], timezone.utc),
+                        change=entry["change"],
+                        balance=entry["balance"],
+                    )
+                )
+                if len(history) == limit:
+                    return history
+        return history
+
+    async def get_history(
+        self, scope: Optional[int], user_id: int, limit: Optional[int]
+    ) -> List[Transaction]:
+        await self.flush()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read_history, scope, user_id, limit)
+
+    def _delete_user(self, user_id: int) -> None:
+        with self._file_lock:
+            # the current segment is reopened by the next write, after it's rewritten
+            self._close_file()
+            for path in self._segment_paths():
+                lines = []
+                changed = False
+                with path.open("r", encoding="utf-8") as fp:
+                    for line in fp:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            entry = None
+                        if entry is not None and entry["user"] == user_id:
+                            changed = True
+                        else:
+                            lines.append(line)
+                if changed:
+                    tmp_path = path.with_name(f"{path.name}.tmp")
+                    tmp_path.write_text("".join(lines), encoding="utf-8")
+                    os.replace(tmp_path, path)
+
+    async def delete_user(self, user_id: int) -> None:
+        """Remove all transactions of the given user from the ledger."""
+        await self.flush()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._delete_user, user_id)
+        for accounts in self.pending.values():
+            accounts.pop(user_id, None)
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_date = None
+
+    def close(self) -> None:
+        """Write the remaining transactions and close the current segment."""
+        self._write_buffered()
+        with self._file_lock:
+            self._close_file()
+
+
+async def _ledger_loop() -> None:
+    while True:
+        await asyncio.sleep(_LEDGER_SNAPSHOT_INTERVAL)
+        try:
+            await _ledger.snapshot()
+        except Exception:
+            log.exception("Failed to save a snapshot of the bank ledger.")
+
+
+async def _start_ledger() -> None:
+    global _ledger
+    global _ledger_task
+
+    ledger = _Ledger(
+        data_manager.core_data_path() / "bank_ledger", await _config.ledger_retention_days()
+    )
+    await ledger.load(await _config.ledger_snapshot_txid())
+    _ledger = ledger
+    # the replayed transactions are saved right away
+    await ledger.snapshot()
+    _ledger_task = asyncio.create_task(_ledger_loop())
+
+
+async def _stop_ledger() -> None:
+    global _ledger
+    global _ledger_task
+
+    if _ledger_task is not None:
+        _ledger_task.cancel()
+        _ledger_task = None
+    if _ledger is not None:
+        ledger, _ledger = _ledger, None
+        try:
+            await ledger.snapshot()
+        finally:
+            ledger.close()
+
+
+async def _flush_ledger() -> None:
+    """Save all balances recorded in the ledger to Config."""
+    if _ledger is not None:
+        await _ledger.snapshot()
+
+
+async def _set_ledger_enabled(enabled: bool) -> None:
+    await _config.ledger_enabled.set(enabled)
+    if enabled and _ledger is None:
+        await _start_ledger()
+    elif not enabled:
+        await _stop_ledger()
+
+
+async def _set_ledger_retention(days: Optional[int]) -> None:
+    """Set for how many days the transactions are kept in the ledger. `None` keeps them forever."""
+    await _config.ledger_retention_days.set(days)
+    if _ledger is not None:
+        _ledger.retention_days = days
+
+
+async def _shutdown() -> None:
+    await _stop_ledger()
+
+
+async def _init(bot: Optional[Red] = None):
     global _config
+    global _bot_ref
+    global _ledger
+    _bot_ref = bot
     _config = Config.get_conf(None, 384734293238749, cog_name="Bank", force_registration=True)
     _config.register_global(**_DEFAULT_GLOBAL)
     _config.register_guild(**_DEFAULT_GUILD)
     _config.register_member(**_DEFAULT_MEMBER)
     _config.register_user(**_DEFAULT_USER)
+    _invalidate_leaderboards()
+    if _ledger is not None:
+        # `_init()` is only called again by tests, the old data is gone
+        _ledger_task.cancel()
+        _ledger.close()
+        _ledger = None
     await _migrate_config()
+    if await _config.ledger_enabled():
+        await _start_ledger()
 
 
 async def _migrate_config():
@@ -143,11 +601,15 @@ async def _process_data_deletion(
         )
 
     async with _data_deletion_lock:
+        await _flush_ledger()
+        if _ledger is not None:
+            await _ledger.delete_user(user_id)
         await _config.user_from_id(user_id).clear()
         all_members = await _config.all_members()
         async for guild_id, member_dict in AsyncIter(all_members.items(), steps=100):
             if user_id in member_dict:
                 await _config.member_from_ids(guild_id, user_id).clear()
+        _invalidate_leaderboards()
 
 
 def is_owner_if_bank_global():
@@ -325,6 +787,15 @@ async def set_balance(member: Union[discord.Member, discord.User], amount: int)
         raise TypeError("Amount must be of type int, not {}.".format(type(amount)))
     if amount < 0:
         raise ValueError("Not allowed to have negative balance.")
+    global_bank = await is_global()
+    async with _get_scope_group(_get_scope(member, global_bank)).get_lock():
+        return await _set_balance(member, amount, global_bank)
+
+
+async def _set_balance(
+    member: Union[discord.Member, discord.User], amount: int, global_bank: bool
+) -> int:
+    # the caller holds the lock of the account's bank scope
     guild = getattr(member, "guild", None)
     max_bal = await get_max_balance(guild)
     if amount > max_bal:
@@ -332,19 +803,44 @@ async def set_balance(member: Union[discord.Member, discord.User], amount: int)
         raise errors.BalanceTooHigh(
             user=member.display_name, max_balance=max_bal, currency_name=currency
         )
-    if await is_global():
+    if _ledger is not None:
+        scope = _get_scope(member, global_bank)
+        account = await _get_raw_account(scope, member.id)
+        if account is None:
+            old_balance = await get_default_balance(guild)
+            account = _DEFAULT_MEMBER
+        else:
+            old_balance = account["balance"]
+        account = {
+            "name": account["name"] or member.display_name,
+            "balance": amount,
+            "created_at": account["created_at"] or _encoded_current_time(),
+        }
+        _ledger.append(scope, member.id, old_balance, account)
+        _update_leaderboard(scope, member.id, account)
+        return amount
+
+    if global_bank:
         group = _config.user(member)
     else:
         group = _config.member(member)
     await group.balance.set(amount)
 
-    if await group.created_at() == 0:
-        time = _encoded_current_time()
-        await group.created_at.set(time)
-
-    if await group.name() == "":
-        await group.name.set(member.display_name)
-
+    created_at = await group.created_at()
+    if created_at == 0:
+        created_at = _encoded_current_time()
+        await group.created_at.set(created_at)
+
+    name = await group.name()
+    if name == "":
+        name = member.display_name
+        await group.name.set(name)
+
+    _update_leaderboard(
+        _get_scope(member, global_bank),
+        member.id,
+        {"name": name, "balance": amount, "created_at": created_at},
+    )
     return amount
 
 
@@ -385,16 +881,18 @@ async def withdraw_credits(member: discord.Member, amount: int) -> int:
             )
         )
 
-    bal = await get_balance(member)
-    if amount > bal:
-        raise ValueError(
-            "Insufficient funds {} > {}".format(
-                humanize_number(amount, override_locale="en_US"),
-                humanize_number(bal, override_locale="en_US"),
+    global_bank = await is_global()
+    async with _get_scope_group(_get_scope(member, global_bank)).get_lock():
+        bal = await get_balance(member)
+        if amount > bal:
+            raise ValueError(
+                "Insufficient funds {} > {}".format(
+                    humanize_number(amount, override_locale="en_US"),
+                    humanize_number(bal, override_locale="en_US"),
+                )
             )
-        )
 
-    return await set_balance(member, bal - amount)
+        return await _set_balance(member, bal - amount, global_bank)
 
 
 async def deposit_credits(member: discord.Member, amount: int) -> int:
@@ -429,8 +927,10 @@ async def deposit_credits(member: discord.Member, amount: int) -> int:
             )
         )
 
-    bal = await get_balance(member)
-    return await set_balance(member, amount + bal)
+    global_bank = await is_global()
+    async with _get_scope_group(_get_scope(member, global_bank)).get_lock():
+        bal = await get_balance(member)
+        return await _set_balance(member, amount + bal, global_bank)
 
 
 async def transfer_credits(
@@ -487,6 +987,230 @@ async def transfer_credits(
     return await deposit_credits(to, amount)
 
 
+class BalanceChange(NamedTuple):
+    """A change of an account's balance made by a bulk operation."""
+
+    member: Union[discord.Member, discord.User]
+    old_balance: int
+    new_balance: int
+
+
+def _check_bulk_amounts(amounts: Mapping[Union[discord.Member, discord.User], int], kind: str):
+    for amount in amounts.values():
+        if not isinstance(amount, int):
+            raise TypeError(
+                "{} amount must be of type int, not {}.".format(kind.capitalize(), type(amount))
+            )
+        if _invalid_amount(amount):
+            raise ValueError(
+                "Invalid {} amount {} < 0".format(
+                    kind, humanize_number(amount, override_locale="en_US")
+                )
+            )
+
+
+async def _bulk_update(
+    amounts: Mapping[Union[discord.Member, discord.User], int],
+    get_new_balance: Callable[[int, int], int],
+    *,
+    clamp_to_max: bool = False,
+) -> List[BalanceChange]:
+    global_bank = await is_global()
+    scopes: Dict[Optional[int], List[Tuple[Union[discord.Member, discord.User], int]]] = {}
+    for member, amount in amounts.items():
+        scopes.setdefault(_get_scope(member, global_bank), []).append((member, amount))
+    if not scopes:
+        return []
+
+    changes: Dict[int, BalanceChange] = {}
+    scope_accounts = {}
+    async with contextlib.AsyncExitStack() as stack:
+        # all changes are validated before anything is written
+        for scope, scope_amounts in sorted(scopes.items(), key=lambda x: x[0] or 0):
+            guild = getattr(scope_amounts[0][0], "guild", None)
+            max_bal = await get_max_balance(guild)
+            default_bal = await get_default_balance(guild)
+            group = _get_scope_group(scope)
+            # the single account operations take the same lock
+            await stack.enter_async_context(group.get_lock())
+            if _ledger is None:
+                # the scope is written once, with the changed accounts merged into it
+                stored = await group.get_raw(default={})
+            else:
+                stored = None
+            accounts = {}
+            for member, _amount in scope_amounts:
+                if stored is None:
+                    account = await _get_raw_account(scope, member.id)
+                else:
+                    account = stored.get(str(member.id))
+                if account is not None:
+                    accounts[str(member.id)] = {**_DEFAULT_MEMBER, **account}
+            for member, amount in scope_amounts:
+                account = accounts.get(str(member.id))
+                if account is None:
+                    account = accounts[str(member.id)] = {
+                        **_DEFAULT_MEMBER,
+                        "balance": default_bal,
+                    }
+                old_balance = account.get("balance", _DEFAULT_MEMBER["balance"])
+                new_balance = get_new_balance(old_balance, amount)
+                if new_balance > max_bal:
+                    if not clamp_to_max:
+                        currency = await get_currency_name(guild)
+                        raise errors.BalanceTooHigh(
+                            user=member.display_name, max_balance=max_bal, currency_name=currency
+                        )
+                    new_balance = max_bal
+                account["balance"] = new_balance
+                if not account.get("created_at"):
+                    account["created_at"] = _encoded_current_time()
+                if not account.get("name"):
+                    account["name"] = member.display_name
+                changes[id(member)] = BalanceChange(member, old_balance, new_balance)
+            scope_accounts[scope] = (group, stored, accounts, scope_amounts)
+
+        for scope, (group, stored, accounts, scope_amounts) in scope_accounts.items():
+            if stored is not None:
+                stored.update(accounts)
+                await group.set_raw(value=stored)
+            for member, _amount in scope_amounts:
+                account = accounts[str(member.id)]
+                if _ledger is not None:
+                    _ledger.append(scope, member.id, changes[id(member)].old_balance, account)
+                _update_leaderboard(scope, member.id, account)
+
+    results = [changes[id(member)] for member in amounts]
+    if _bot_ref is not None:
+        _bot_ref.dispatch("bank_bulk_update", results)
+    return results
+
+
+async def bulk_set_balance(
+    balances: Mapping[Union[discord.Member, discord.User], int]
+) -> List[BalanceChange]:
+    """Set the balances of multiple accounts at once.
+
+    The balances are validated before any of them is set and are then
+    saved with a single write per bank, which is much faster than calling
+    `set_balance()` for each of the accounts.
+
+    Once the balances are set, a ``bank_bulk_update`` event is dispatched
+    with the list of the changes.
+
+    Parameters
+    ----------
+    balances : Mapping[Union[discord.Member, discord.User], int]
+        The mapping of members to the amounts to set their balances to.
+
+    Returns
+    -------
+    List[BalanceChange]
+        The changes of the balances, in the order of ``balances``.
+
+    Raises
+    ------
+    ValueError
+        If attempting to set a balance to a negative number.
+    BalanceTooHigh
+        If attempting to set a balance to a value greater than
+        the maximum balance.
+    TypeError
+        If any of the amounts is not an `int`.
+
+    """
+    _check_bulk_amounts(balances, "balance")
+    return await _bulk_update(balances, lambda balance, amount: amount)
+
+
+async def bulk_withdraw(
+    amounts: Mapping[Union[discord.Member, discord.User], int]
+) -> List[BalanceChange]:
+    """Remove credits from multiple accounts at once.
+
+    The withdrawals are validated before any of them is made and the balances
+    are then saved with a single write per bank, which is much faster than
+    calling `withdraw_credits()` for each of the accounts.
+
+    Once the balances are set, a ``bank_bulk_update`` event is dispatched
+    with the list of the changes.
+
+    Parameters
+    ----------
+    amounts : Mapping[Union[discord.Member, discord.User], int]
+        The mapping of members to the amounts to withdraw from their accounts.
+
+    Returns
+    -------
+    List[BalanceChange]
+        The changes of the balances, in the order of ``amounts``.
+
+    Raises
+    ------
+    ValueError
+        If any of the withdrawal amounts is invalid or if any of the accounts
+        has insufficient funds.
+    TypeError
+        If any of the withdrawal amounts is not an `int`.
+
+    """
+
+    def withdraw(balance: int, amount: int) -> int:
+        if amount > balance:
+            raise ValueError(
+                "Insufficient funds {} > {}".format(
+                    humanize_number(amount, override_locale="en_US"),
+                    humanize_number(balance, override_locale="en_US"),
+                )
+            )
+        return balance - amount
+
+    _check_bulk_amounts(amounts, "withdrawal")
+    return await _bulk_update(amounts, withdraw)
+
+
+async def bulk_deposit(
+    amounts: Mapping[Union[discord.Member, discord.User], int], *, clamp_to_max: bool = False
+) -> List[BalanceChange]:
+    """Add credits to multiple accounts at once.
+
+    The deposits are validated before any of them is made and the balances
+    are then saved with a single write per bank, which is much faster than
+    calling `deposit_credits()` for each of the accounts.
+
+    Once the balances are set, a ``bank_bulk_update`` event is dispatched
+    with the list of the changes.
+
+    Parameters
+    ----------
+    amounts : Mapping[Union[discord.Member, discord.User], int]
+        The mapping of members to the amounts to deposit to their accounts.
+    clamp_to_max : bool
+        If :code:`True`, the balances that would become greater than
+        the maximum balance are set to the maximum balance instead.
+
+    Returns
+    -------
+    List[BalanceChange]
+        The changes of the balances, in the order of ``amounts``.
+
+    Raises
+    ------
+    ValueError
+        If any of the deposit amounts is invalid.
+    TypeError
+        If any of the deposit amounts is not an `int`.
+    BalanceTooHigh
+        If any of the balances would become greater than the maximum balance
+        and ``clamp_to_max`` is :code:`False`.
+
+    """
+    _check_bulk_amounts(amounts, "deposit")
+    return await _bulk_update(
+        amounts, lambda balance, amount: balance + amount, clamp_to_max=clamp_to_max
+    )
+
+
 async def wipe_bank(guild: Optional[discord.Guild] = None) -> None:
     """Delete all accounts from the bank.
 
@@ -497,10 +1221,16 @@ async def wipe_bank(guild: Optional[discord.Guild] = None) -> None:
         per-server, all accounts in every guild will be wiped.
 
     """
+    await _flush_ledger()
     if await is_global():
         await _config.clear_all_users()
+        _invalidate_leaderboards(None)
     else:
         await _config.clear_all_members(guild)
+        if guild is None:
+            _invalidate_leaderboards(local_only=True)
+        else:
+            _invalidate_leaderboards(guild.id)
 
 
 async def bank_prune(bot: Red, guild: discord.Guild = None, user_id: int = None) -> None:
@@ -525,6 +1255,7 @@ async def bank_prune(bot: Red, guild: discord.Guild = None, user_id: int = None)
     """
 
     global_bank = await is_global()
+    await _flush_ledger()
 
     if global_bank:
         _guilds = set()
@@ -563,6 +1294,12 @@ async def bank_prune(bot: Red, guild: discord.Guild = None, user_id: int = None)
             if user_id in bank_data:
                 del bank_data[user_id]
 
+    scope = None if global_bank else guild.id
+    if user_id is None:
+        _invalidate_leaderboards(scope)
+    else:
+        _update_leaderboard(scope, int(user_id), None)
+
 
 async def get_leaderboard(positions: int = None, guild: discord.Guild = None) -> List[tuple]:
     """
@@ -579,7 +1316,8 @@ async def get_leaderboard(positions: int = None, guild: discord.Guild = None) ->
     Returns
     -------
     `list` of `tuple`
-        The sorted leaderboard in the form of :code:`(user_id, raw_account)`
+        The sorted leaderboard in the form of :code:`(user_id, raw_account)`.
+        Accounts with equal balances are ordered by the user ID.
 
     Raises
     ------
@@ -588,21 +1326,18 @@ async def get_leaderboard(positions: int = None, guild: discord.Guild = None) ->
 
     """
     if await is_global():
-        raw_accounts = await _config.all_users()
+        accounts = iter(await _get_leaderboard(None))
         if guild is not None:
-            tmp = raw_accounts.copy()
-            for acc in tmp:
-                if not guild.get_member(acc):
-                    del raw_accounts[acc]
+            accounts = (
+                (user_id, account) for user_id, account in accounts if guild.get_member(user_id)
+            )
     else:
         if guild is None:
             raise TypeError("Expected a guild, got NoneType object instead!")
-        raw_accounts = await _config.all_members(guild)
-    sorted_acc = sorted(raw_accounts.items(), key=lambda x: x[1]["balance"], reverse=True)
-    if positions is None:
-        return sorted_acc
-    else:
-        return sorted_acc[:positions]
+        accounts = iter(await _get_leaderboard(guild.id))
+    return [
+        (user_id, account.copy()) for user_id, account in itertools.islice(accounts, positions)
+    ]
 
 
 async def get_leaderboard_position(
@@ -628,19 +1363,14 @@ async def get_leaderboard_position(
 
     """
     if await is_global():
-        guild = None
+        scope = None
     else:
         guild = member.guild if hasattr(member, "guild") else None
-    try:
-        leaderboard = await get_leaderboard(None, guild)
-    except TypeError:
-        raise
-    else:
-        pos = discord.utils.find(lambda x: x[1][0] == member.id, enumerate(leaderboard, 1))
-        if pos is None:
-            return None
-        else:
-            return pos[0]
+        if guild is None:
+            raise TypeError("Expected a guild, got NoneType object instead!")
+        scope = guild.id
+    leaderboard = await _get_leaderboard(scope)
+    return leaderboard.get_position(member.id)
 
 
 async def get_account(member: Union[discord.Member, discord.User]) -> Account:
@@ -659,24 +1389,45 @@ async def get_account(member: Union[discord.Member, discord.User]) -> Account:
         The user's account.
 
     """
-    if await is_global():
-        all_accounts = await _config.all_users()
-    else:
-        all_accounts = await _config.all_members(member.guild)
-
-    if member.id not in all_accounts:
+    acc_data = await _get_raw_account(_get_scope(member, await is_global()), member.id)
+    if acc_data is None:
         acc_data = {"name": member.display_name, "created_at": _DEFAULT_MEMBER["created_at"]}
         try:
             acc_data["balance"] = await get_default_balance(member.guild)
         except AttributeError:
             acc_data["balance"] = await get_default_balance()
-    else:
-        acc_data = all_accounts[member.id]
 
     acc_data["created_at"] = _decode_time(acc_data["created_at"])
     return Account(**acc_data)
 
 
+async def get_history(
+    member: Union[discord.Member, discord.User], limit: Optional[int] = None
+) -> List[Transaction]:
+    """Get the recent changes of the given user's or member's balance.
+
+    The history is only recorded when the bank's ledger is enabled
+    and it only goes back as far as the ledger's retention period.
+
+    Parameters
+    ----------
+    member : `discord.User` or `discord.Member`
+        The user whose history to get.
+    limit : `int`, optional
+        The maximum number of transactions to get.
+
+    Returns
+    -------
+    `list` of `Transaction`
+        The transactions, newest first. The list is empty if the ledger is disabled.
+
+    """
+    if _ledger is None:
+        return []
+    scope = _get_scope(member, await is_global())
+    return await _ledger.get_history(scope, member.id, limit)
+
+
 async def is_global() -> bool:
     """Determine if the bank is currently global.
 
@@ -722,6 +1473,7 @@ async def set_global(global_: bool) -> bool:
 
     global _cache_is_global
 
+    await _flush_ledger()
     if await is_global():
         await _config.clear_all_users()
     else:
@@ -729,6 +1481,7 @@ async def set_global(global_: bool) -> bool:
 
     await _config.is_global.set(global_)
     _cache_is_global = global_
+    _invalidate_leaderboards()
     return global_
 
 
@@ -7,6 +7,7 @@ import platform
 import shutil
 import sys
 import contextlib
+import time
 import weakref
 import functools
 from collections import namedtuple, OrderedDict
@@ -37,7 +38,7 @@ import discord
 from discord.ext import commands as dpy_commands
 from discord.ext.commands import when_mentioned_or
 
-from . import Config, i18n, app_commands, commands, errors, _drivers, modlog, bank
+from . import Config, i18n, app_commands, commands, errors, _drivers, modlog, bank, scheduler
 from ._cli import ExitCodes
 from ._cog_manager import CogManager, CogManagerUI
 from .core_commands import Core
@@ -54,6 +55,13 @@ from ._settings_caches import (
 )
 from .utils.predicates import MessagePredicate
 from ._rpc import RPCMixin
+from ._loop_monitor import LoopLagMonitor
+from ._timings import (
+    CommandTimingsManager,
+    ListenerTimingsManager,
+    PHASE_GLOBAL_CHECKS,
+    PHASE_TOTAL,
+)
 from .tree import RedTree
 from .utils import can_user_send_messages_in, common_filters, AsyncIter
 from .utils.chat_formatting import box, text_to_file
@@ -192,6 +200,10 @@ class Red(
         self._ignored_cache = IgnoreManager(self._config)
         self._whiteblacklist_cache = WhitelistBlacklistManager(self._config)
         self._i18n_cache = I18nManager(self._config)
+        self._command_timings = CommandTimingsManager()
+        self._listener_timings = ListenerTimingsManager()
+        # set by `redbot.__main__` when the monitor is enabled with the CLI flag
+        self._loop_monitor: Optional[LoopLagMonitor] = None
         self._bypass_cooldowns = False
 
         async def prefix_manager(bot, message) -> List[str]:
@@ -1154,7 +1166,8 @@ class Red(
             await self.add_cog(Dev())
 
         await modlog._init(self)
-        await bank._init()
+        await bank._init(self)
+        await scheduler._init(self)
 
         packages = OrderedDict()
 
@@ -1653,6 +1666,112 @@ class Red(
         if ctx is None or ctx.valid is False:
             self.dispatch("message_without_command", message)
 
+    async def invoke(self, ctx: commands.Context, /) -> None:
+        """
+        Same as base method, but records how long the whole invocation took.
+        """
+        command = ctx.command
+        if command is None:
+            return await super().invoke(ctx)
+
+        start = time.perf_counter()
+        try:
+            await super().invoke(ctx)
+        finally:
+            # ctx.command points at the invoked subcommand at this point, if there was one
+            self._command_timings.record(
+                ctx.command or command, PHASE_TOTAL, time.perf_counter() - start
+            )
+
+    async def can_run(self, ctx: commands.Context, /, *, call_once: bool = False) -> bool:
+        if not call_once or ctx.command is None:
+            return await super().can_run(ctx, call_once=call_once)
+
+        start = time.perf_counter()
+        try:
+            return await super().can_run(ctx, call_once=True)
+        finally:
+            # call-once checks are done before subcommands are resolved
+            # so they're recorded for the top-level command
+            self._command_timings.record(
+                ctx.command, PHASE_GLOBAL_CHECKS, time.perf_counter() - start
+            )
+
+    async def _run_event(
+        self,
+        coro: Callable[..., Awaitable[Any]],
+        event_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        # DEP-WARN: this overrides a private method of discord.py's Client
+        # in order to time event listeners, when enabled
+        if self._listener_timings.enabled:
+            coro = self._listener_timings.wrap(coro, event_name)
+        await super()._run_event(coro, event_name, *args, **kwargs)
+
+    def get_command_timings(
+        self, command_name: Optional[str] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get the timings recorded for commands invoked since the bot started
+        or since the timings were last reset.
+
+        .. warning::
+            This method is `provisional <developer-guarantees-exclusions>`.
+
+        Timings are split into phases of the invocation:
+
+        - ``global_checks`` - the bot's call-once checks, done before subcommands are resolved,
+          and as such, recorded for the top-level command
+        - ``checks`` - the bot's, cog's and command's checks
+        - ``requires`` - the permission checks done by `Requires.verify()`
+        - ``conversion`` - argument parsing and conversion
+        - ``callback`` - the command's callback, this includes the time spent in ``send``
+        - ``send`` - the `Context.send()` calls made with the command's context
+        - ``total`` - the whole invocation
+
+        Example
+        -------
+
+        .. code-block:: python
+
+            timings = bot.get_command_timings("ping")
+            print(timings["ping"]["total"]["p99"])
+
+        Parameters
+        ----------
+        command_name : Optional[str]
+            The qualified name of the command to get timings for.
+            If this is ``None``, timings for all commands will be returned.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Dict[str, Any]]]
+            A mapping of qualified command names to mappings of phase names
+            to the phase's statistics. Phases with no recorded timings are omitted.
+            Statistics of each phase include the ``count`` of calls,
+            the ``total``, ``mean``, ``p50``, ``p99`` and ``max`` durations in seconds
+            and the counts of calls in each of the ``buckets``.
+            The returned data is JSON serializable.
+        """
+        return self._command_timings.to_dict(command_name)
+
+    def reset_command_timings(self, command_name: Optional[str] = None) -> None:
+        """
+        Reset the timings recorded for commands.
+
+        .. warning::
+            This method is `provisional <developer-guarantees-exclusions>`.
+
+        Parameters
+        ----------
+        command_name : Optional[str]
+            The qualified name of the command to reset timings for.
+            If this is ``None``, timings of all commands will be reset.
+        """
+        self._command_timings.reset(command_name)
+
     @staticmethod
     def list_packages():
         """Lists packages present in the cogs folder"""
@@ -2172,6 +2291,9 @@ class Red(
     async def close(self):
         """Logs out of Discord and closes all connections."""
         await super().close()
+        await modlog._shutdown()
+        await bank._shutdown()
+        await scheduler._shutdown()
         await _drivers.get_driver_class().teardown()
         try:
             if self.rpc_enabled:
@@ -9,6 +9,7 @@ import inspect
 import io
 import re
 import functools
+import time
 import weakref
 from typing import (
     Any,
@@ -45,6 +46,7 @@ from discord.ext.commands import (
 
 from .requires import PermState, PrivilegeLevel, Requires, PermStateAllowedStates
 from .. import app_commands
+from .._timings import PHASE_CALLBACK, PHASE_CHECKS, PHASE_CONVERSION, PHASE_REQUIRES
 from ..i18n import Translator
 
 _T = TypeVar("_T")
@@ -426,7 +428,14 @@ class Command(CogCommandMixin, DPYCommand):
             a result of this call. For most cases this should be
             ``False``. Defaults to ``False``.
         """
+        # Timings are only recorded for the checks done while preparing the invocation,
+        # other callers (e.g. help) would otherwise skew the results.
+        record_timings = ctx._record_check_timings
+        ctx._record_check_timings = False
+        start = time.perf_counter()
         ret = await super().can_run(ctx)
+        if record_timings:
+            ctx.bot._command_timings.record(self, PHASE_CHECKS, time.perf_counter() - start)
         if ret is False:
             return False
 
@@ -448,15 +457,18 @@ class Command(CogCommandMixin, DPYCommand):
                 if result is False:
                     return False
 
-        if self.parent is None and self.cog is not None:
-            # For top-level commands, we need to check the cog's requires too
-            ret = await self.cog.requires.verify(ctx)
-            if ret is False:
-                return False
-
+        start = time.perf_counter()
         try:
+            if self.parent is None and self.cog is not None:
+                # For top-level commands, we need to check the cog's requires too
+                ret = await self.cog.requires.verify(ctx)
+                if ret is False:
+                    return False
+
             return await self.requires.verify(ctx)
         finally:
+            if record_timings:
+                ctx.bot._command_timings.record(self, PHASE_REQUIRES, time.perf_counter() - start)
             ctx.command = original_command
             if not change_permission_state:
                 ctx.permission_state = original_state
@@ -498,7 +510,12 @@ class Command(CogCommandMixin, DPYCommand):
         if not cmd_enabled:
             raise DisabledCommand(f"{self.name} command is disabled")
 
-        if not await self.can_run(ctx, change_permission_state=True):
+        ctx._record_check_timings = True
+        try:
+            can_run = await self.can_run(ctx, change_permission_state=True)
+        finally:
+            ctx._record_check_timings = False
+        if not can_run:
             raise CheckFailure(f"The check functions for command {self.qualified_name} failed.")
 
         if self._max_concurrency is not None:
@@ -506,11 +523,11 @@ class Command(CogCommandMixin, DPYCommand):
 
         try:
             if self.cooldown_after_parsing:
-                await self._parse_arguments(ctx)
+                await self._timed_parse_arguments(ctx)
                 self._prepare_cooldowns(ctx)
             else:
                 self._prepare_cooldowns(ctx)
-                await self._parse_arguments(ctx)
+                await self._timed_parse_arguments(ctx)
 
             await self.call_before_hooks(ctx)
         except:
@@ -518,6 +535,23 @@ class Command(CogCommandMixin, DPYCommand):
                 await self._max_concurrency.release(ctx)
             raise
 
+        ctx._callback_started_at = time.perf_counter()
+
+    async def _timed_parse_arguments(self, ctx: "Context", /) -> None:
+        start = time.perf_counter()
+        try:
+            await self._parse_arguments(ctx)
+        finally:
+            ctx.bot._command_timings.record(self, PHASE_CONVERSION, time.perf_counter() - start)
+
+    async def call_after_hooks(self, ctx: "Context", /) -> None:
+        # This is called by discord.py right after the callback finishes (or fails).
+        started_at = ctx._callback_started_at
+        if started_at is not None:
+            ctx._callback_started_at = None
+            ctx.bot._command_timings.record(self, PHASE_CALLBACK, time.perf_counter() - started_at)
+        await super().call_after_hooks(ctx)
+
     async def can_see(self, ctx: "Context"):
         """Check if this command is visible in the given context.
 
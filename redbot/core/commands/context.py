@@ -4,11 +4,13 @@ import asyncio
 import contextlib
 import os
 import re
+import time
 from typing import Iterable, List, Union, Optional, TYPE_CHECKING
 import discord
 from discord.ext.commands import Context as DPYContext
 
 from .requires import PermState
+from .._timings import PHASE_SEND
 from ..utils import can_user_react_in
 
 if TYPE_CHECKING:
@@ -53,6 +55,9 @@ class Context(DPYContext):
         self.assume_yes = attrs.pop("assume_yes", False)
         super().__init__(**attrs)
         self.permission_state: PermState = PermState.NORMAL
+        # Used by the command timings instrumentation, see `redbot.core._timings`
+        self._record_check_timings: bool = False
+        self._callback_started_at: Optional[float] = None
 
     async def send(self, content=None, **kwargs):
         """Sends a message to the destination with the content given.
@@ -88,7 +93,15 @@ class Context(DPYContext):
         if _filter and content:
             content = _filter(str(content))
 
-        return await super().send(content=content, **kwargs)
+        command = self.command
+        if command is None:
+            return await super().send(content=content, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return await super().send(content=content, **kwargs)
+        finally:
+            self.bot._command_timings.record(command, PHASE_SEND, time.perf_counter() - start)
 
     async def send_help(self, command=None):
         """Send the command help message."""
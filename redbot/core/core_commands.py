@@ -25,6 +25,7 @@ from redbot.core.commands import GuildConverter, RawUserIdConverter
 from string import ascii_letters, digits
 from typing import (
     TYPE_CHECKING,
+    Any,
     Union,
     Tuple,
     List,
@@ -130,6 +131,7 @@ class CoreLogic:
         self.bot.register_rpc_handler(self._prefixes)
         self.bot.register_rpc_handler(self._version_info)
         self.bot.register_rpc_handler(self._invite_url)
+        self.bot.register_rpc_handler(self._command_timings)
 
     async def _load(self, pkg_names: Iterable[str]) -> Dict[str, Union[List[str], Dict[str, str]]]:
         """
@@ -379,6 +381,25 @@ class CoreLogic:
         """
         return await self.bot.get_invite_url()
 
+    async def _command_timings(
+        self, command_name: Optional[str] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Gets the timings recorded for commands.
+
+        Parameters
+        ----------
+        command_name : str
+            If passed, only the timings of the command with this qualified name are returned.
+
+        Returns
+        -------
+        dict
+            Mapping of qualified command names to their timings,
+            as returned by `Red.get_command_timings()`.
+        """
+        return self.bot.get_command_timings(command_name)
+
     @staticmethod
     async def _can_get_invite_url(ctx):
         is_owner = await ctx.bot.is_owner(ctx.author)
@@ -2485,6 +2506,50 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             await bank.set_global(not cur_setting)
             await ctx.send(_("The bank is now {banktype}.").format(banktype=word))
 
+    @bankset.command(name="ledger")
+    @commands.is_owner()
+    async def bankset_ledger(self, ctx: commands.Context, enabled: bool):
+        """Enable or disable the bank's transaction ledger.
+
+        With the ledger enabled, every balance change is appended to a log
+        and the balances are saved to the bot's config periodically.
+        This reduces the number of writes on busy bots and keeps the history of the transactions.
+
+        Example:
+        - `[p]bankset ledger yes`
+
+        **Arguments**
+
+        - `<enabled>` Whether the ledger should be enabled.
+        """
+        await bank._set_ledger_enabled(enabled)
+        if enabled:
+            await ctx.send(_("The bank's ledger is now enabled."))
+        else:
+            await ctx.send(_("The bank's ledger is now disabled."))
+
+    @bankset.command(name="ledgerretention")
+    @commands.is_owner()
+    async def bankset_ledgerretention(self, ctx: commands.Context, days: commands.positive_int):
+        """Set for how many days the transactions are kept in the bank's ledger.
+
+        Set to 0 to keep the transactions forever.
+
+        Example:
+        - `[p]bankset ledgerretention 90`
+
+        **Arguments**
+
+        - `<days>` The number of days the transactions are kept for.
+        """
+        await bank._set_ledger_retention(days or None)
+        if days:
+            await ctx.send(
+                _("Transactions will be kept in the ledger for {days} days.").format(days=days)
+            )
+        else:
+            await ctx.send(_("Transactions will be kept in the ledger forever."))
+
     @bank.is_owner_if_bank_global()
     @commands.guildowner_or_permissions(administrator=True)
     @bankset.command(name="bankname")
@@ -2801,6 +2866,58 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         else:
             await ctx.send(_("No changes have been made."))
 
+    @commands.is_owner()
+    @modlogset.group(name="archive")
+    async def modlogset_archive(self, ctx: commands.Context):
+        """
+        Manage moving old modlog cases to the archive.
+
+        Archived cases are stored in compressed files outside of the bot's config
+        but can still be viewed and edited like any other case.
+        """
+
+    @modlogset_archive.command(name="age")
+    async def modlogset_archive_age(self, ctx: commands.Context, days: commands.positive_int):
+        """
+        Archive cases older than the given number of days.
+
+        Set to 0 to not archive cases based on their age.
+
+        **Example:**
+        - `[p]modlogset archive age 365`
+
+        **Arguments:**
+        - `<days>` - The age in days after which cases are archived.
+        """
+        await modlog._set_archive_settings(max_age=days or None)
+        if days:
+            await ctx.send(_("Cases older than {days} days will be archived.").format(days=days))
+        else:
+            await ctx.send(_("Cases will no longer be archived based on their age."))
+
+    @modlogset_archive.command(name="keep")
+    async def modlogset_archive_keep(self, ctx: commands.Context, cases: commands.positive_int):
+        """
+        Archive all cases except for the given number of the newest cases in each server.
+
+        Set to 0 to not archive cases based on their count.
+
+        **Example:**
+        - `[p]modlogset archive keep 10000`
+
+        **Arguments:**
+        - `<cases>` - The number of the newest cases that are kept out of the archive.
+        """
+        await modlog._set_archive_settings(keep_latest=cases or None)
+        if cases:
+            await ctx.send(
+                _("All but the newest {cases} cases in each server will be archived.").format(
+                    cases=cases
+                )
+            )
+        else:
+            await ctx.send(_("Cases will no longer be archived based on their count."))
+
     @commands.group(name="set")
     async def _set(self, ctx: commands.Context):
         """Commands for changing [botname]'s settings."""
@@ -4738,6 +4855,261 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
 
         await ctx.send(await DebugInfo(self.bot).get_command_text())
 
+    @commands.group(hidden=True)
+    @commands.is_owner()
+    async def timings(self, ctx: commands.Context):
+        """Shows performance timings recorded by [botname]."""
+
+    @timings.command(name="commands")
+    async def timings_commands(self, ctx: commands.Context, *, command_name: str = None):
+        """
+        Shows how long command invocations took, split by phase.
+
+        Without a command, the slowest commands (by total time spent in them) are shown.
+        All durations are in milliseconds.
+
+        **Examples:**
+        - `[p]timings commands`
+        - `[p]timings commands set bot name`
+
+        **Arguments:**
+        - `[command_name]` - The qualified name of the command to show timings for.
+        """
+        from redbot.core._timings import PHASES
+
+        timings = ctx.bot.get_command_timings(command_name)
+        if not timings:
+            await ctx.send(_("No command timings have been recorded yet."))
+            return
+
+        header = "{:<22} {:>8} {:>9} {:>9} {:>9}".format(
+            _("Phase") if command_name else _("Command"), _("Calls"), _("Mean"), _("p99"), _("Max")
+        )
+        row = "{:<22} {:>8} {:>9.2f} {:>9.2f} {:>9.2f}"
+        lines = [header]
+        if command_name is not None:
+            stats = timings[command_name]
+            for phase in PHASES:
+                if phase in stats:
+                    phase_stats = stats[phase]
+                    lines.append(
+                        row.format(
+                            phase,
+                            phase_stats["count"],
+                            phase_stats["mean"] * 1000,
+                            phase_stats["p99"] * 1000,
+                            phase_stats["max"] * 1000,
+                        )
+                    )
+        else:
+            totals = sorted(
+                ((name, stats["total"]) for name, stats in timings.items() if "total" in stats),
+                key=lambda item: item[1]["total"],
+                reverse=True,
+            )
+            for name, phase_stats in totals[:25]:
+                lines.append(
+                    row.format(
+                        name[:22],
+                        phase_stats["count"],
+                        phase_stats["mean"] * 1000,
+                        phase_stats["p99"] * 1000,
+                        phase_stats["max"] * 1000,
+                    )
+                )
+        for page in pagify("\n".join(lines), shorten_by=10):
+            await ctx.send(box(page))
+
+    @timings.command(name="resetcommands")
+    async def timings_resetcommands(self, ctx: commands.Context, *, command_name: str = None):
+        """
+        Resets the recorded command timings.
+
+        **Examples:**
+        - `[p]timings resetcommands`
+        - `[p]timings resetcommands ping`
+
+        **Arguments:**
+        - `[command_name]` - The qualified name of the command to reset timings for.
+        """
+        ctx.bot.reset_command_timings(command_name)
+        if command_name is None:
+            await ctx.send(_("Command timings have been reset."))
+        else:
+            await ctx.send(
+                _("Timings of the command {command} have been reset.").format(
+                    command=inline(command_name)
+                )
+            )
+
+    @timings.command(name="loop")
+    async def timings_loop(self, ctx: commands.Context):
+        """
+        Shows how much the event loop lags and what blocked it.
+
+        This requires Red to be started with the `--monitor-loop-lag` flag.
+        All durations are in milliseconds.
+
+        **Example:**
+        - `[p]timings loop`
+        """
+        monitor = ctx.bot._loop_monitor
+        if monitor is None:
+            await ctx.send(
+                _(
+                    "The event loop lag monitor is not enabled."
+                    " Start the bot with the `--monitor-loop-lag` flag to enable it."
+                )
+            )
+            return
+
+        summary = monitor.get_summary()
+        lag = summary["lag"]
+        lines = [
+            _("Threshold: {threshold:.0f}").format(threshold=summary["threshold"] * 1000),
+            _("Samples: {count}").format(count=lag["count"]),
+            _("Lag (mean / p99 / max): {mean:.2f} / {p99:.2f} / {max:.2f}").format(
+                mean=lag["mean"] * 1000, p99=lag["p99"] * 1000, max=lag["max"] * 1000
+            ),
+            _("Stalls: {count}").format(count=summary["stall_count"]),
+        ]
+        if summary["culprits"]:
+            lines.append("")
+            lines.append(_("Blocked by (count, total, max):"))
+            for culprit in summary["culprits"][:10]:
+                lines.append(
+                    "[{owner}] {location}\n    {count}x, {total:.0f}, {max:.0f}".format(
+                        owner=culprit["owner"],
+                        location=culprit["location"],
+                        count=culprit["count"],
+                        total=culprit["total"] * 1000,
+                        max=culprit["max"] * 1000,
+                    )
+                )
+        if summary["recent_stalls"]:
+            lines.append("")
+            lines.append(_("Recent stalls:"))
+            for stall in reversed(summary["recent_stalls"][-5:]):
+                timestamp = datetime.datetime.fromtimestamp(
+                    stall["timestamp"], datetime.timezone.utc
+                )
+                lines.append(
+                    "{timestamp:%Y-%m-%d %H:%M:%S} {duration:.0f} [{owner}] {location}".format(
+                        timestamp=timestamp,
+                        duration=stall["duration"] * 1000,
+                        owner=stall["owner"],
+                        location=stall["location"],
+                    )
+                )
+        for page in pagify("\n".join(lines), shorten_by=10):
+            await ctx.send(box(page))
+
+    @timings.command(name="listeners")
+    async def timings_listeners(self, ctx: commands.Context, *, event_name: str = None):
+        """
+        Shows how long event listeners took to run.
+
+        Listeners are sorted by the total time they spent running on the event loop,
+        which doesn't include the time spent waiting on I/O or other tasks.
+        All durations are in milliseconds.
+
+        Recording of listener timings needs to be enabled with `[p]timings recordlisteners`.
+
+        **Examples:**
+        - `[p]timings listeners`
+        - `[p]timings listeners on_message`
+
+        **Arguments:**
+        - `[event_name]` - The event to show the listeners of, e.g. `on_message`.
+        """
+        timings = ctx.bot._listener_timings.to_list()
+        if event_name is not None:
+            timings = [stats for stats in timings if stats["event"] == event_name]
+        if not timings:
+            if ctx.bot._listener_timings.enabled:
+                await ctx.send(_("No listener timings have been recorded yet."))
+            else:
+                await ctx.send(
+                    _(
+                        "No listener timings have been recorded."
+                        " You can enable recording with `{command}`."
+                    ).format(command=f"{ctx.clean_prefix}timings recordlisteners true")
+                )
+            return
+
+        lines = []
+        for stats in timings[:25]:
+            busy = stats["busy"]
+            wall = stats["wall"]
+            lines.append(
+                _(
+                    "{event} - {owner}.{listener}\n"
+                    "    Calls: {calls}, exceptions: {exceptions}\n"
+                    "    Busy (total / mean / p99): {busy_total:.0f} / {busy_mean:.2f} / {busy_p99:.2f}\n"
+                    "    Wall (mean / p99): {wall_mean:.2f} / {wall_p99:.2f}"
+                ).format(
+                    event=stats["event"],
+                    owner=stats["owner"],
+                    listener=stats["listener"],
+                    calls=stats["calls"],
+                    exceptions=stats["exceptions"],
+                    busy_total=busy["total"] * 1000,
+                    busy_mean=busy["mean"] * 1000,
+                    busy_p99=busy["p99"] * 1000,
+                    wall_mean=wall["mean"] * 1000,
+                    wall_p99=wall["p99"] * 1000,
+                )
+            )
+        for page in pagify("\n".join(lines), shorten_by=10):
+            await ctx.send(box(page))
+
+    @timings.command(name="recordlisteners")
+    async def timings_recordlisteners(self, ctx: commands.Context, enabled: bool):
+        """
+        Enables or disables recording of event listener timings.
+
+        Recording adds a small overhead to every event listener call.
+        Recorded timings are kept until they're reset or the bot is restarted.
+
+        **Examples:**
+        - `[p]timings recordlisteners true`
+        - `[p]timings recordlisteners false`
+
+        **Arguments:**
+        - `<enabled>` - Whether listener timings should be recorded.
+        """
+        ctx.bot._listener_timings.enabled = enabled
+        if enabled:
+            await ctx.send(_("Listener timings will now be recorded."))
+        else:
+            await ctx.send(_("Listener timings will no longer be recorded."))
+
+    @timings.command(name="resetlisteners")
+    async def timings_resetlisteners(self, ctx: commands.Context):
+        """
+        Resets the recorded event listener timings.
+
+        **Example:**
+        - `[p]timings resetlisteners`
+        """
+        ctx.bot._listener_timings.reset()
+        await ctx.send(_("Listener timings have been reset."))
+
+    @timings.command(name="resetloop")
+    async def timings_resetloop(self, ctx: commands.Context):
+        """
+        Resets the data collected by the event loop lag monitor.
+
+        **Example:**
+        - `[p]timings resetloop`
+        """
+        monitor = ctx.bot._loop_monitor
+        if monitor is None:
+            await ctx.send(_("The event loop lag monitor is not enabled."))
+            return
+        monitor.reset()
+        await ctx.send(_("The event loop lag data has been reset."))
+
     # You may ask why this command is owner-only,
     # cause after all it could be quite useful to guild owners!
     # Truth to be told, that would require us to make some part of this
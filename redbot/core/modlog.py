@@ -1,13 +1,36 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import gzip
+import json
 import logging
+import os
+import shutil
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import List, Literal, Union, Optional, cast, TYPE_CHECKING
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Union,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+    TYPE_CHECKING,
+)
 
 import discord
 
-from redbot.core import Config
+from redbot.core import Config, data_manager
 from .utils import AsyncIter
 from .utils.common_filters import (
     filter_invites,
@@ -32,7 +55,11 @@ __all__ = (
     "get_latest_case",
     "get_all_cases",
     "get_cases_for_member",
+    "iter_cases",
+    "CasePage",
+    "get_case_page",
     "create_case",
+    "create_cases",
     "get_casetype",
     "get_all_casetypes",
     "register_casetype",
@@ -47,10 +74,38 @@ _bot_ref: Optional[Red] = None
 
 _CASETYPES = "CASETYPES"
 _CASES = "CASES"
-_SCHEMA_VERSION = 4
+_CASE_INDEX = "CASE_INDEX"
+_SCHEMA_VERSION = 5
+
+# case data keys that have a per-guild index of case numbers in _CASE_INDEX,
+# stored as {index name: {key: {case number: True}}} so that each case is a separate entry
+_INDEXED_KEYS = ("user", "moderator", "action_type")
 
 _data_deletion_lock = asyncio.Lock()
 
+# In-memory copies of the settings used by `create_case()`.
+# Modlog is the only writer of this data so the caches are updated on write.
+_casetypes_cache: Optional[Dict[str, dict]] = None
+_casetype_settings_cache: Dict[int, Dict[str, bool]] = {}
+_modlog_channel_ids: Dict[int, Optional[int]] = {}
+_case_queues: Dict[int, _CaseQueue] = {}
+
+# Cases can be moved from Config to the archive - gzipped JSON files with fixed ranges
+# of case numbers (segments). Only a prefix of each guild's cases is ever archived,
+# so any case with a number up to the guild's `archived_through` is in the archive.
+_ARCHIVE_SEGMENT_SIZE = 1000
+# maximum number of cases moved to the archive in a single step
+_ARCHIVE_BATCH_SIZE = 10 * _ARCHIVE_SEGMENT_SIZE
+# how often (in seconds) the archival task checks for cases to archive
+_ARCHIVE_INTERVAL = 3600
+# number of decompressed segments kept in memory
+_SEGMENT_CACHE_SIZE = 16
+_archived_through: Dict[int, int] = {}
+_archive_locks: Dict[int, asyncio.Lock] = {}
+_segment_cache: OrderedDict[Tuple[int, int], Dict[str, dict]] = OrderedDict()
+_archive_task: Optional[asyncio.Task] = None
+_archive_wakeup: Optional[asyncio.Event] = None
+
 _ = Translator("ModLog", __file__)
 
 
@@ -64,6 +119,7 @@ async def _process_data_deletion(
 
     key_paths = []
 
+    await _commit_pending_cases()
     async with _data_deletion_lock:
         all_cases = await _config.custom(_CASES).all()
         async for guild_id_str, guild_cases in AsyncIter(all_cases.items(), steps=100):
@@ -72,32 +128,80 @@ async def _process_data_deletion(
                     if (case.get(keyname, 0) or 0) == user_id:  # this could be None...
                         key_paths.append((guild_id_str, case_num_str))
 
+        index_changes: Dict[int, List[Tuple[int, dict, dict]]] = {}
         async with _config.custom(_CASES).all() as all_cases:
             for guild_id_str, case_num_str in key_paths:
                 case = all_cases[guild_id_str][case_num_str]
-                if (case.get("user", 0) or 0) == user_id:
-                    case["user"] = 0xDE1
-                    case.pop("last_known_username", None)
-                if (case.get("moderator", 0) or 0) == user_id:
-                    case["moderator"] = 0xDE1
-                if (case.get("amended_by", 0) or 0) == user_id:
-                    case["amended_by"] = 0xDE1
+                old_case = case.copy()
+                _anonymize_case(case, user_id)
+                index_changes.setdefault(int(guild_id_str), []).append(
+                    (int(case_num_str), old_case, case)
+                )
+
+        for guild_id, segment_start in await _list_archive_segments():
+            async with _get_archive_lock(guild_id):
+                segment = await _load_segment(guild_id, segment_start, cache=False)
+                changed = False
+                for case_num_str, case in segment.items():
+                    old_case = case.copy()
+                    if _anonymize_case(case, user_id):
+                        changed = True
+                        index_changes.setdefault(guild_id, []).append(
+                            (int(case_num_str), old_case, case)
+                        )
+                if changed:
+                    await _write_segment(guild_id, segment_start, segment)
+
+        for guild_id, changes in index_changes.items():
+            await _update_case_index(guild_id, changes)
+
+
+def _anonymize_case(case: dict, user_id: int) -> bool:
+    changed = False
+    if (case.get("user", 0) or 0) == user_id:
+        case["user"] = 0xDE1
+        case.pop("last_known_username", None)
+        changed = True
+    if (case.get("moderator", 0) or 0) == user_id:
+        case["moderator"] = 0xDE1
+        changed = True
+    if (case.get("amended_by", 0) or 0) == user_id:
+        case["amended_by"] = 0xDE1
+        changed = True
+    return changed
 
 
 async def _init(bot: Red):
     global _config
     global _bot_ref
+    global _casetypes_cache
+    global _archive_task
+    global _archive_wakeup
     _bot_ref = bot
+    _casetypes_cache = None
+    _casetype_settings_cache.clear()
+    _modlog_channel_ids.clear()
+    _case_queues.clear()
+    _archived_through.clear()
+    _archive_locks.clear()
+    _segment_cache.clear()
     _config = Config.get_conf(None, 1354799444, cog_name="ModLog")
-    _config.register_global(schema_version=1)
-    _config.register_guild(mod_log=None, casetypes={}, latest_case_number=0)
+    _config.register_global(schema_version=1, archive_max_age=None, archive_keep_latest=None)
+    _config.register_guild(mod_log=None, casetypes={}, latest_case_number=0, archived_through=0)
     _config.init_custom(_CASETYPES, 1)
     _config.init_custom(_CASES, 2)
+    _config.init_custom(_CASE_INDEX, 2)
     _config.register_custom(_CASETYPES)
     _config.register_custom(_CASES)
+    _config.register_custom(_CASE_INDEX)
     await _migrate_config(from_version=await _config.schema_version(), to_version=_SCHEMA_VERSION)
     await register_casetypes(all_generics)
 
+    if _archive_task is not None:
+        _archive_task.cancel()
+    _archive_wakeup = asyncio.Event()
+    _archive_task = asyncio.create_task(_archive_loop())
+
     async def on_audit_log_entry_create(entry: discord.AuditLogEntry):
         guild = entry.guild
         if guild.unavailable:
@@ -121,6 +225,8 @@ async def _init(bot: Red):
 
 
 async def handle_auditype_key():
+    global _casetypes_cache
+    _casetypes_cache = None
     all_casetypes = {
         casetype_name: {
             inner_key: inner_value
@@ -175,6 +281,60 @@ async def _migrate_config(from_version: int, to_version: int):
 
         await _config.schema_version.set(4)
 
+    if from_version < 5 <= to_version:
+        # build the indexes of case numbers
+        all_cases = await _config.custom(_CASES).all()
+        await _config.custom(_CASE_INDEX).set(
+            {guild_id: _build_case_index(cases) for guild_id, cases in all_cases.items() if cases}
+        )
+        await _config.schema_version.set(5)
+
+
+def _iter_index_entries(case_data: dict) -> Iterator[Tuple[str, str]]:
+    for index_name in _INDEXED_KEYS:
+        value = case_data.get(index_name)
+        if value is not None:
+            yield index_name, str(value)
+
+
+def _build_case_index(cases: Dict[str, dict]) -> Dict[str, Dict[str, Dict[str, bool]]]:
+    index: Dict[str, Dict[str, Dict[str, bool]]] = {index_name: {} for index_name in _INDEXED_KEYS}
+    for case_number, case_data in cases.items():
+        for index_name, key in _iter_index_entries(case_data):
+            index[index_name].setdefault(key, {})[case_number] = True
+    return index
+
+
+async def _update_case_index(
+    guild_id: int, changes: Iterable[Tuple[int, Optional[dict], Optional[dict]]]
+) -> None:
+    """
+    Update the case number indexes of the guild after the data of cases changed.
+
+    ``changes`` is an iterable of ``(case_number, old_data, new_data)`` tuples,
+    where `None` means that the case didn't/doesn't exist.
+    Only the index entries of the changed cases are written.
+    """
+    for case_number, old_data, new_data in changes:
+        old_entries = set(_iter_index_entries(old_data)) if old_data else set()
+        new_entries = set(_iter_index_entries(new_data)) if new_data else set()
+        for index_name, key in old_entries - new_entries:
+            await _config.custom(_CASE_INDEX, str(guild_id), index_name).clear_raw(
+                key, str(case_number)
+            )
+        for index_name, key in new_entries - old_entries:
+            await _config.custom(_CASE_INDEX, str(guild_id), index_name).set_raw(
+                key, str(case_number), value=True
+            )
+
+
+async def _get_indexed_case_numbers(guild_id: int, index_name: str, key: object) -> List[int]:
+    """Get the sorted case numbers of the guild's cases with the given value of the indexed key."""
+    case_numbers = await _config.custom(_CASE_INDEX, str(guild_id), index_name).get_raw(
+        str(key), default={}
+    )
+    return sorted(map(int, case_numbers))
+
 
 class Case:
     """
@@ -237,12 +397,14 @@ class Case:
         `None` if the case was never edited.
     message: Optional[Union[discord.PartialMessage, discord.Message]]
         The message created by Modlog for this case.
-        Instance of `discord.Message` *if* the Case object was returned from
-        `modlog.create_case()`, otherwise `discord.PartialMessage`.
+        The message can also contain the embeds of other cases that were created at the same time.
 
         `None` if we know that the message no longer exists
         (note: it might not exist regardless of whether this attribute is `None`)
-        or if it has never been created.
+        or if it hasn't been created yet. The message is sent in the background
+        after the case is saved, so this is always `None` for the Case object returned
+        from `modlog.create_case()`. It's set on the objects returned
+        by `modlog.get_case()` once the message has been sent.
     last_known_username: Optional[str]
         The last known user handle (``username`` / ``username#1234``) of the user.
         `None` if the handle of the user was never saved
@@ -272,23 +434,67 @@ class Case:
         self.created_at = created_at
         self.action_type = action_type
         self.user = user
-        if isinstance(user, discord.Object):
-            self.user = user.id
         self.last_known_username = last_known_username
         self.moderator = moderator
-        if isinstance(moderator, discord.Object):
-            self.moderator = moderator.id
         self.reason = reason
         self.until = until
         self.channel = channel
         self.parent_channel_id = parent_channel_id
         self.amended_by = amended_by
-        if isinstance(amended_by, discord.Object):
-            self.amended_by = amended_by.id
         self.modified_at = modified_at
         self.case_number = case_number
         self.message = message
 
+    # Users and the message are only resolved when they are accessed,
+    # as most of the fetched cases are never displayed in full.
+
+    def _resolve_user(
+        self, user: Optional[Union[discord.abc.User, int]]
+    ) -> Optional[Union[discord.abc.User, int]]:
+        if isinstance(user, int):
+            return self.bot.get_user(user) or user
+        return user
+
+    @property
+    def user(self) -> Union[discord.abc.User, int]:
+        self._user = self._resolve_user(self._user)
+        return self._user
+
+    @user.setter
+    def user(self, value: Union[discord.Object, discord.abc.User, int]) -> None:
+        self._user = value.id if isinstance(value, discord.Object) else value
+
+    @property
+    def moderator(self) -> Optional[Union[discord.abc.User, int]]:
+        self._moderator = self._resolve_user(self._moderator)
+        return self._moderator
+
+    @moderator.setter
+    def moderator(self, value: Optional[Union[discord.Object, discord.abc.User, int]]) -> None:
+        self._moderator = value.id if isinstance(value, discord.Object) else value
+
+    @property
+    def amended_by(self) -> Optional[Union[discord.abc.User, int]]:
+        self._amended_by = self._resolve_user(self._amended_by)
+        return self._amended_by
+
+    @amended_by.setter
+    def amended_by(self, value: Optional[Union[discord.Object, discord.abc.User, int]]) -> None:
+        self._amended_by = value.id if isinstance(value, discord.Object) else value
+
+    @property
+    def message(self) -> Optional[Union[discord.PartialMessage, discord.Message]]:
+        if self._message is None and self._message_channel is not None:
+            self._message = self._message_channel.get_partial_message(self._message_id)
+            self._message_channel = None
+        return self._message
+
+    @message.setter
+    def message(self, value: Optional[Union[discord.PartialMessage, discord.Message]]) -> None:
+        self._message = value
+        self._message_id = value.id if value is not None else None
+        self._message_channel = None
+
     @property
     def parent_channel(self) -> Optional[Union[discord.TextChannel, discord.ForumChannel]]:
         """
@@ -306,7 +512,7 @@ class Case:
         # in order to avoid making an API request to "edit" the message with changes.
         # In all other cases, edit() is correct method.
         self.message = message
-        await _config.custom(_CASES, str(self.guild.id), str(self.case_number)).set(self.to_json())
+        await _save_case_data(self.guild.id, self.case_number, self.to_json())
 
     async def edit(self, data: dict):
         """
@@ -320,6 +526,7 @@ class Case:
         """
         # We don't want case_number to be changed
         data.pop("case_number", None)
+        old_data = self.to_json()
         # last username is set based on passed user object
         data.pop("last_known_username", None)
         for item, value in data.items():
@@ -332,13 +539,17 @@ class Case:
                 setattr(self, item, value)
 
         # update last known user handle
-        if not isinstance(self.user, int):
-            self.last_known_username = str(self.user)
+        if not isinstance(self._user, int):
+            self.last_known_username = str(self._user)
 
         if isinstance(self.channel, discord.Thread):
             self.parent_channel_id = self.channel.parent_id
 
-        await _config.custom(_CASES, str(self.guild.id), str(self.case_number)).set(self.to_json())
+        new_data = self.to_json()
+        # the case could still be waiting to be written by the case queue
+        await _get_case_queue(self.guild.id).commit()
+        await _save_case_data(self.guild.id, self.case_number, new_data)
+        await _update_case_index(self.guild.id, [(self.case_number, old_data, new_data)])
         self.bot.dispatch("modlog_case_edit", self)
         if not self.message:
             return
@@ -346,7 +557,27 @@ class Case:
             use_embed = await self.bot.embed_requested(self.message.channel)
             case_content = await self.message_content(use_embed)
             if use_embed:
-                await self.message.edit(embed=case_content)
+                message = self.message
+                if not isinstance(message, discord.Message) or len(message.embeds) > 1:
+                    # the message could be shared with other cases that could have been edited
+                    message = await message.fetch()
+                embeds = message.embeds
+                if len(embeds) > 1:
+                    # only this case's embed is replaced, the title doesn't change on edit
+                    for index, embed in enumerate(embeds):
+                        if embed.title == case_content.title:
+                            embeds[index] = case_content
+                            await message.edit(embeds=embeds)
+                            break
+                    else:
+                        log.info(
+                            "Modlog failed to find the embed of the case #%s from guild"
+                            " with ID %s in its Discord message.",
+                            self.case_number,
+                            self.guild.id,
+                        )
+                else:
+                    await message.edit(embed=case_content)
             else:
                 await self.message.edit(content=case_content)
         except discord.Forbidden:
@@ -564,18 +795,18 @@ class Case:
             The case in the form of a dict
 
         """
-        if self.moderator is None or isinstance(self.moderator, int):
-            mod = self.moderator
+        if self._moderator is None or isinstance(self._moderator, int):
+            mod = self._moderator
         else:
-            mod = self.moderator.id
-        if self.amended_by is None or isinstance(self.amended_by, int):
-            amended_by = self.amended_by
+            mod = self._moderator.id
+        if self._amended_by is None or isinstance(self._amended_by, int):
+            amended_by = self._amended_by
         else:
-            amended_by = self.amended_by.id
-        if isinstance(self.user, int):
-            user_id = self.user
+            amended_by = self._amended_by.id
+        if isinstance(self._user, int):
+            user_id = self._user
         else:
-            user_id = self.user.id
+            user_id = self._user.id
         data = {
             "case_number": self.case_number,
             "action_type": self.action_type,
@@ -590,7 +821,7 @@ class Case:
             "parent_channel": self.parent_channel_id,
             "amended_by": amended_by,
             "modified_at": self.modified_at,
-            "message": self.message.id if hasattr(self.message, "id") else None,
+            "message": self._message_id,
         }
         return data
 
@@ -636,23 +867,11 @@ class Case:
         """
         guild = kwargs.get("guild") or mod_channel.guild
 
-        message = kwargs.get("message")
-        if message is None:
-            message_id = data.get("message")
-            if message_id is not None:
-                if mod_channel is not None:
-                    message = mod_channel.get_partial_message(message_id)
-
-        user_objects = {"user": None, "moderator": None, "amended_by": None}
-        for user_key in tuple(user_objects):
-            user_object = kwargs.get(user_key)
-            if user_object is None:
-                user_id = data.get(user_key)
-                if user_id is None:
-                    user_object = None
-                else:
-                    user_object = bot.get_user(user_id) or user_id
-            user_objects[user_key] = user_object
+        # users are resolved lazily by the Case, see `Case.user`
+        user_objects = {
+            user_key: kwargs.get(user_key) or data.get(user_key)
+            for user_key in ("user", "moderator", "amended_by")
+        }
 
         channel = (
             kwargs.get("channel")
@@ -660,7 +879,7 @@ class Case:
             or data["channel"]
         )
         case_guild = kwargs.get("guild") or bot.get_guild(data["guild"])
-        return cls(
+        case = cls(
             bot=bot,
             guild=case_guild,
             created_at=data["created_at"],
@@ -671,10 +890,16 @@ class Case:
             channel=channel,
             parent_channel_id=data.get("parent_channel_id"),
             modified_at=data["modified_at"],
-            message=message,
+            message=kwargs.get("message"),
             last_known_username=data.get("last_known_username"),
             **user_objects,
         )
+        if case.message is None:
+            # the partial message is created lazily by the Case, see `Case.message`
+            case._message_id = data.get("message")
+            if case._message_id is not None:
+                case._message_channel = mod_channel
+        return case
 
 
 class CaseType:
@@ -729,6 +954,8 @@ class CaseType:
             "case_str": self.case_str,
         }
         await _config.custom(_CASETYPES, self.name).set(data)
+        if _casetypes_cache is not None:
+            _casetypes_cache[self.name] = data
 
     async def is_enabled(self) -> bool:
         """
@@ -745,9 +972,11 @@ class CaseType:
         """
         if not self.guild:
             return False
-        return await _config.guild(self.guild).casetypes.get_raw(
-            self.name, default=self.default_setting
-        )
+        settings = _casetype_settings_cache.get(self.guild.id)
+        if settings is None:
+            settings = await _config.guild(self.guild).casetypes()
+            _casetype_settings_cache[self.guild.id] = settings
+        return settings.get(self.name, self.default_setting)
 
     async def set_enabled(self, enabled: bool):
         """
@@ -760,6 +989,9 @@ class CaseType:
         if not self.guild:
             return
         await _config.guild(self.guild).casetypes.set_raw(self.name, value=enabled)
+        settings = _casetype_settings_cache.get(self.guild.id)
+        if settings is not None:
+            settings[self.name] = enabled
 
     @classmethod
     def from_json(cls, name: str, data: dict, **kwargs):
@@ -784,6 +1016,416 @@ class CaseType:
         return cls(name=name, **data_copy, **kwargs)
 
 
+async def _get_casetypes_data() -> Dict[str, dict]:
+    global _casetypes_cache
+    if _casetypes_cache is None:
+        _casetypes_cache = await _config.custom(_CASETYPES).all()
+    return _casetypes_cache
+
+
+class _CaseQueue:
+    """
+    Write-behind queue of the new cases of a single guild.
+
+    Case numbers are allocated from an in-memory counter, so creating a case doesn't wait
+    for Config. A background task writes the queued cases in batches, updating the latest
+    case number and the indexes once per batch. It then sends the cases' modlog messages.
+    When more embeds are waiting to be sent than a single case's (e.g. during a raid,
+    or while discord.py waits out a rate limit), they are combined into fewer messages
+    and each case's message is set to the message with its embed.
+    """
+
+    def __init__(self, guild_id: int) -> None:
+        self.guild_id = guild_id
+        #: Held while allocating a case number.
+        self.lock = asyncio.Lock()
+        self.latest_case_number: Optional[int] = None
+        #: Cases that weren't written to Config yet, by case number.
+        self.pending: Dict[int, Case] = {}
+        #: Written cases whose modlog message wasn't sent yet.
+        self.unsent: List[Case] = []
+        # incremented when the guild's cases are reset
+        self._generation = 0
+        self._commit_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def allocate_case_number(self) -> int:
+        """Allocate the next case number. This needs to be called with `lock` held."""
+        if self.latest_case_number is None:
+            self.latest_case_number = await _config.guild_from_id(
+                self.guild_id
+            ).latest_case_number()
+        self.latest_case_number += 1
+        return self.latest_case_number
+
+    def add(self, case: Case) -> None:
+        self.pending[case.case_number] = case
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def reset(self) -> None:
+        self.latest_case_number = None
+        self.unsent.clear()
+        self._generation += 1
+
+    async def commit(self) -> None:
+        """Write all pending cases to Config."""
+        async with self._commit_lock:
+            if not self.pending:
+                return
+            cases = [self.pending[case_number] for case_number in sorted(self.pending)]
+            changes = []
+            for case in cases:
+                case_data = case.to_json()
+                await _config.custom(_CASES, str(self.guild_id), str(case.case_number)).set(
+                    case_data
+                )
+                changes.append((case.case_number, None, case_data))
+            await _config.guild_from_id(self.guild_id).latest_case_number.set(
+                cases[-1].case_number
+            )
+            await _update_case_index(self.guild_id, changes)
+            for case in cases:
+                del self.pending[case.case_number]
+            self.unsent.extend(cases)
+
+    async def _run(self) -> None:
+        # Cases created while a batch is being written or sent end up in the next batch.
+        while self.pending or self.unsent:
+            try:
+                await self.commit()
+                cases, self.unsent = self.unsent, []
+                await self._send_messages(cases)
+            except Exception:
+                log.exception(
+                    "Modlog failed to process new cases from guild with ID %s.", self.guild_id
+                )
+                return
+
+    async def _send_messages(self, cases: List[Case]) -> None:
+        if not cases:
+            return
+        generation = self._generation
+        guild = cases[0].guild
+        try:
+            mod_channel = await get_modlog_channel(guild)
+        except RuntimeError:  # modlog channel isn't set
+            return
+        try:
+            use_embeds = await cases[0].bot.embed_requested(mod_channel)
+            if use_embeds:
+                items = [(case, await case.message_content(True)) for case in cases]
+                for batch in _batch_embeds(items):
+                    msg = await mod_channel.send(embeds=[embed for _case, embed in batch])
+                    if generation == self._generation:
+                        for case, _embed in batch:
+                            await case._set_message(msg)
+            else:
+                # a case's text needs a message of its own to be editable
+                for case in cases:
+                    msg = await mod_channel.send(await case.message_content(False))
+                    if generation == self._generation:
+                        await case._set_message(msg)
+        except discord.Forbidden:
+            log.info(
+                "Modlog failed to send the Discord message for"
+                " the case #%s from guild with ID %s due to missing permissions.",
+                cases[0].case_number,
+                self.guild_id,
+            )
+        except Exception:
+            log.exception(
+                "Modlog failed to send the Discord message for"
+                " the case #%s from guild with ID %s due to unexpected error.",
+                cases[0].case_number,
+                self.guild_id,
+            )
+
+
+def _batch_embeds(
+    items: List[Tuple[Case, discord.Embed]]
+) -> Iterator[List[Tuple[Case, discord.Embed]]]:
+    # a message can have up to 10 embeds, with up to 6000 characters in total
+    batch: List[Tuple[Case, discord.Embed]] = []
+    batch_length = 0
+    for case, embed in items:
+        if batch and (len(batch) == 10 or batch_length + len(embed) > 6000):
+            yield batch
+            batch = []
+            batch_length = 0
+        batch.append((case, embed))
+        batch_length += len(embed)
+    if batch:
+        yield batch
+
+
+def _get_case_queue(guild_id: int) -> _CaseQueue:
+    try:
+        return _case_queues[guild_id]
+    except KeyError:
+        queue = _case_queues[guild_id] = _CaseQueue(guild_id)
+        return queue
+
+
+async def _commit_pending_cases() -> None:
+    """Write the cases that are waiting in the case queues of all guilds to Config."""
+    if _config is None:
+        return
+    for queue in tuple(_case_queues.values()):
+        await queue.commit()
+
+
+async def _shutdown() -> None:
+    """Stop the archival task and write the pending cases of all guilds."""
+    if _archive_task is not None:
+        _archive_task.cancel()
+    await _commit_pending_cases()
+
+
+def _get_pending_case(guild_id: int, case_number: int) -> Optional[Case]:
+    queue = _case_queues.get(guild_id)
+    if queue is None:
+        return None
+    return queue.pending.get(case_number)
+
+
+def _get_archive_path(guild_id: Optional[int] = None) -> Path:
+    path = data_manager.core_data_path() / "modlog_archive"
+    if guild_id is not None:
+        path /= str(guild_id)
+    return path
+
+
+def _get_segment_start(case_number: int) -> int:
+    return (case_number - 1) // _ARCHIVE_SEGMENT_SIZE * _ARCHIVE_SEGMENT_SIZE + 1
+
+
+def _get_segment_path(guild_id: int, segment_start: int) -> Path:
+    segment_end = segment_start + _ARCHIVE_SEGMENT_SIZE - 1
+    return _get_archive_path(guild_id) / f"{segment_start}-{segment_end}.json.gz"
+
+
+def _read_segment_file(path: Path) -> Dict[str, dict]:
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fp:
+            return json.load(fp)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_segment_file(path: Path, data: Dict[str, dict]) -> None:
+    # the cases are removed from Config after this, so the write needs to be durable
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as fp:
+        with gzip.GzipFile(fileobj=fp, mode="wb") as gz_fp:
+            gz_fp.write(json.dumps(data).encode("utf-8"))
+        fp.flush()
+        os.fsync(fp.fileno())
+    os.replace(tmp_path, path)
+
+
+def _list_archive_segment_files() -> List[Tuple[int, int]]:
+    segments = []
+    try:
+        guild_dirs = list(_get_archive_path().iterdir())
+    except FileNotFoundError:
+        return segments
+    for guild_dir in guild_dirs:
+        for path in guild_dir.glob("*.json.gz"):
+            segments.append((int(guild_dir.name), int(path.name.partition("-")[0])))
+    return segments
+
+
+async def _list_archive_segments() -> List[Tuple[int, int]]:
+    """Get the ``(guild_id, segment_start)`` tuples of all archive segments."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _list_archive_segment_files)
+
+
+async def _load_segment(
+    guild_id: int, segment_start: int, *, cache: bool = True
+) -> Dict[str, dict]:
+    key = (guild_id, segment_start)
+    segment = _segment_cache.get(key)
+    if segment is not None:
+        _segment_cache.move_to_end(key)
+        return segment
+    loop = asyncio.get_running_loop()
+    segment = await loop.run_in_executor(
+        None, _read_segment_file, _get_segment_path(guild_id, segment_start)
+    )
+    if cache:
+        _segment_cache[key] = segment
+        if len(_segment_cache) > _SEGMENT_CACHE_SIZE:
+            _segment_cache.popitem(last=False)
+    return segment
+
+
+async def _write_segment(guild_id: int, segment_start: int, segment: Dict[str, dict]) -> None:
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        None, _write_segment_file, _get_segment_path(guild_id, segment_start), segment
+    )
+    key = (guild_id, segment_start)
+    if key in _segment_cache:
+        _segment_cache[key] = segment
+
+
+def _get_archive_lock(guild_id: int) -> asyncio.Lock:
+    try:
+        return _archive_locks[guild_id]
+    except KeyError:
+        lock = _archive_locks[guild_id] = asyncio.Lock()
+        return lock
+
+
+async def _get_archived_through(guild_id: int) -> int:
+    try:
+        return _archived_through[guild_id]
+    except KeyError:
+        archived_through = await _config.guild_from_id(guild_id).archived_through()
+        _archived_through[guild_id] = archived_through
+        return archived_through
+
+
+async def _get_case_data(guild_id: int, case_number: int) -> Optional[dict]:
+    """Get the data of a written case from the tier it's stored in."""
+    if case_number <= await _get_archived_through(guild_id):
+        segment = await _load_segment(guild_id, _get_segment_start(case_number))
+        return segment.get(str(case_number))
+    return await _config.custom(_CASES, str(guild_id), str(case_number)).all() or None
+
+
+async def _save_case_data(guild_id: int, case_number: int, data: dict) -> None:
+    """Save the data of a written case to the tier it's stored in."""
+    async with _get_archive_lock(guild_id):
+        if case_number <= await _get_archived_through(guild_id):
+            segment_start = _get_segment_start(case_number)
+            segment = dict(await _load_segment(guild_id, segment_start))
+            segment[str(case_number)] = data
+            await _write_segment(guild_id, segment_start, segment)
+        else:
+            await _config.custom(_CASES, str(guild_id), str(case_number)).set(data)
+
+
+async def _get_archive_settings() -> Tuple[Optional[int], Optional[int]]:
+    """Get the maximum age (in days) and the number of the newest cases kept out of the archive."""
+    return await _config.archive_max_age(), await _config.archive_keep_latest()
+
+
+async def _set_archive_settings(
+    *, max_age: Optional[int] = ..., keep_latest: Optional[int] = ...
+) -> None:
+    """
+    Set the maximum age (in days) of cases and/or the number of the newest cases
+    in each guild that are kept out of the archive. `None` disables the criterion.
+    """
+    if max_age is not ...:
+        await _config.archive_max_age.set(max_age)
+    if keep_latest is not ...:
+        await _config.archive_keep_latest.set(keep_latest)
+    if _archive_wakeup is not None:
+        _archive_wakeup.set()
+
+
+async def _archive_loop() -> None:
+    while True:
+        try:
+            await _archive_cases()
+        except Exception:
+            log.exception("Modlog failed to archive old cases.")
+        try:
+            await asyncio.wait_for(_archive_wakeup.wait(), timeout=_ARCHIVE_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        _archive_wakeup.clear()
+
+
+async def _archive_cases() -> None:
+    """Move all cases that match the archive settings to the archive."""
+    max_age, keep_latest = await _get_archive_settings()
+    if not (max_age or keep_latest):
+        return
+    for guild_id, guild_data in (await _config.all_guilds()).items():
+        if guild_data["latest_case_number"] <= guild_data["archived_through"]:
+            continue
+        # each step only moves a limited number of cases, so that other work can happen
+        while await _archive_guild_cases(guild_id, max_age=max_age, keep_latest=keep_latest):
+            await asyncio.sleep(0)
+
+
+async def _archive_guild_cases(
+    guild_id: int, *, max_age: Optional[int], keep_latest: Optional[int]
+) -> int:
+    """
+    Move the next batch of cases of the given guild to the archive.
+
+    A case is moved when it's older than ``max_age`` days
+    or when it isn't one of the newest ``keep_latest`` cases.
+
+    Returns
+    -------
+    int
+        The number of case numbers that were archived.
+    """
+    queue = _get_case_queue(guild_id)
+    # nothing else may write the guild's cases in Config while they're rewritten here
+    async with queue._commit_lock, _get_archive_lock(guild_id):
+        guild_settings = _config.guild_from_id(guild_id)
+        latest_case_number = await guild_settings.latest_case_number()
+        archived_through = await _get_archived_through(guild_id)
+        if latest_case_number <= archived_through:
+            return 0
+
+        hot_cases = await _config.custom(_CASES, str(guild_id)).all()
+        min_created_at = time.time() - max_age * 86400 if max_age else None
+        last_case_number = min(latest_case_number, archived_through + _ARCHIVE_BATCH_SIZE)
+        to_archive: Dict[int, Dict[str, dict]] = {}
+        case_number = archived_through
+        while case_number < last_case_number:
+            case_data = hot_cases.get(str(case_number + 1))
+            if case_data is not None:
+                beyond_kept = keep_latest and case_number + 1 <= latest_case_number - keep_latest
+                too_old = min_created_at is not None and case_data["created_at"] < min_created_at
+                if not (beyond_kept or too_old):
+                    break
+                to_archive.setdefault(_get_segment_start(case_number + 1), {})[
+                    str(case_number + 1)
+                ] = case_data
+            case_number += 1
+        if case_number == archived_through:
+            return 0
+
+        for segment_start, cases in to_archive.items():
+            segment = dict(await _load_segment(guild_id, segment_start, cache=False))
+            segment.update(cases)
+            await _write_segment(guild_id, segment_start, segment)
+        await guild_settings.archived_through.set(case_number)
+        _archived_through[guild_id] = case_number
+        # this also removes cases left over by an interrupted archival
+        await _config.custom(_CASES, str(guild_id)).set(
+            {
+                case_num_str: case_data
+                for case_num_str, case_data in hot_cases.items()
+                if int(case_num_str) > case_number
+            }
+        )
+        return case_number - archived_through
+
+
+async def _clear_archive(guild_id: int) -> None:
+    async with _get_archive_lock(guild_id):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(shutil.rmtree, _get_archive_path(guild_id), ignore_errors=True)
+        )
+        for key in [key for key in _segment_cache if key[0] == guild_id]:
+            del _segment_cache[key]
+        await _config.guild_from_id(guild_id).archived_through.clear()
+        _archived_through[guild_id] = 0
+
+
 async def get_case(case_number: int, guild: discord.Guild, bot: Red) -> Case:
     """
     Gets the case with the associated case number
@@ -808,8 +1450,9 @@ async def get_case(case_number: int, guild: discord.Guild, bot: Red) -> Case:
         If there is no case for the specified number
 
     """
-
-    case = await _config.custom(_CASES, str(guild.id), str(case_number)).all()
+    if (pending_case := _get_pending_case(guild.id, case_number)) is not None:
+        return pending_case
+    case = await _get_case_data(guild.id, case_number)
     if not case:
         raise RuntimeError("That case does not exist for guild {}".format(guild.name))
     try:
@@ -835,7 +1478,9 @@ async def get_latest_case(guild: discord.Guild, bot: Red) -> Optional[Case]:
         The latest case object. `None` if it the guild has no cases.
 
     """
-    case_number = await _config.guild(guild).latest_case_number()
+    case_number = _get_case_queue(guild.id).latest_case_number
+    if case_number is None:
+        case_number = await _config.guild(guild).latest_case_number()
     if case_number:
         return await get_case(case_number, guild, bot)
 
@@ -857,7 +1502,19 @@ async def get_all_cases(guild: discord.Guild, bot: Red) -> List[Case]:
         A list of all cases for the guild
 
     """
-    cases = await _config.custom(_CASES, str(guild.id)).all()
+    await _get_case_queue(guild.id).commit()
+    cases = {}
+    async with _get_archive_lock(guild.id):
+        archived_through = await _get_archived_through(guild.id)
+        if archived_through:
+            for segment_start in range(1, archived_through + 1, _ARCHIVE_SEGMENT_SIZE):
+                cases.update(await _load_segment(guild.id, segment_start, cache=False))
+        hot_cases = await _config.custom(_CASES, str(guild.id)).all()
+    cases.update(
+        (case_number, case_data)
+        for case_number, case_data in hot_cases.items()
+        if int(case_number) > archived_through
+    )
     try:
         mod_channel = await get_modlog_channel(guild)
     except RuntimeError:
@@ -900,14 +1557,17 @@ async def get_cases_for_member(
         Fetching the user failed.
     """
 
-    cases = await _config.custom(_CASES, str(guild.id)).all()
-
     if not (member_id or member):
         raise ValueError("Expected a member or a member id to be provided.") from None
 
     if not member_id:
         member_id = member.id
 
+    await _get_case_queue(guild.id).commit()
+    case_numbers = await _get_indexed_case_numbers(guild.id, "user", member_id)
+    if not case_numbers:
+        return []
+
     if not member:
         member = bot.get_user(member_id) or member_id
 
@@ -916,15 +1576,158 @@ async def get_cases_for_member(
     except RuntimeError:
         modlog_channel = None
 
-    cases = [
-        await Case.from_json(modlog_channel, bot, case_number, case_data, user=member, guild=guild)
-        for case_number, case_data in cases.items()
-        if case_data["user"] == member_id
-    ]
+    cases = []
+    for case_number in case_numbers:
+        case_data = await _get_case_data(guild.id, case_number)
+        if not case_data:
+            continue
+        cases.append(
+            await Case.from_json(
+                modlog_channel, bot, case_number, case_data, user=member, guild=guild
+            )
+        )
 
     return cases
 
 
+async def _get_case_numbers(guild_id: int, member_id: Optional[int]) -> Sequence[int]:
+    await _get_case_queue(guild_id).commit()
+    if member_id is not None:
+        return await _get_indexed_case_numbers(guild_id, "user", member_id)
+    latest_case_number = await _config.guild_from_id(guild_id).latest_case_number()
+    return range(1, latest_case_number + 1)
+
+
+async def _iter_cases_by_numbers(
+    guild: discord.Guild, bot: Red, case_numbers: Sequence[int]
+) -> AsyncIterator[Case]:
+    try:
+        mod_channel = await get_modlog_channel(guild)
+    except RuntimeError:
+        mod_channel = None
+    for case_number in case_numbers:
+        case_data = await _get_case_data(guild.id, case_number)
+        if not case_data:
+            continue
+        yield await Case.from_json(mod_channel, bot, case_number, case_data, guild=guild)
+
+
+async def iter_cases(
+    guild: discord.Guild,
+    *,
+    newest_first: bool = True,
+    start: Optional[int] = None,
+    limit: Optional[int] = None,
+    member_id: Optional[int] = None,
+) -> AsyncIterator[Case]:
+    """
+    Iterate over the cases of the specified guild.
+
+    Only the cases that are iterated over are fetched.
+
+    Example
+    -------
+    Get the 5 latest cases::
+
+        cases = [case async for case in modlog.iter_cases(guild, limit=5)]
+
+    Parameters
+    ----------
+    guild: `discord.Guild`
+        The guild to get the cases from.
+    newest_first: bool
+        Whether the cases should be iterated over from the newest one.
+        Defaults to `True`.
+    start: Optional[int]
+        The case number to start the iteration at (inclusive).
+        If the case doesn't exist, the iteration starts at the nearest following case.
+    limit: Optional[int]
+        The maximum number of cases to iterate over.
+    member_id: Optional[int]
+        The ID of the user that the iterated cases should be for.
+
+    Yields
+    ------
+    Case
+        The guild's cases.
+    """
+    case_numbers = await _get_case_numbers(guild.id, member_id)
+    if newest_first:
+        if start is not None:
+            case_numbers = case_numbers[: bisect_right(case_numbers, start)]
+        case_numbers = case_numbers[::-1]
+    elif start is not None:
+        case_numbers = case_numbers[bisect_left(case_numbers, start) :]
+
+    if limit is not None and limit <= 0:
+        return
+    count = 0
+    async for case in _iter_cases_by_numbers(guild, _bot_ref, case_numbers):
+        yield case
+        count += 1
+        if count == limit:
+            return
+
+
+class CasePage(NamedTuple):
+    """A page of cases returned by `get_case_page()`."""
+
+    #: The cases on the page.
+    cases: List[Case]
+    #: The (0-based) number of the page.
+    page_number: int
+    #: The total number of pages.
+    page_count: int
+
+
+async def get_case_page(
+    guild: discord.Guild,
+    page_number: int,
+    *,
+    per_page: int = 10,
+    newest_first: bool = True,
+    member_id: Optional[int] = None,
+) -> CasePage:
+    """
+    Get a single page of the cases of the specified guild.
+
+    Only the cases on the requested page are fetched.
+
+    Parameters
+    ----------
+    guild: `discord.Guild`
+        The guild to get the cases from.
+    page_number: int
+        The (0-based) number of the page to get.
+    per_page: int
+        The number of case numbers on each page. Defaults to 10.
+
+        .. note::
+            The page may have fewer cases if some of the cases on it no longer exist.
+    newest_first: bool
+        Whether the pages should be ordered from the newest case.
+        Defaults to `True`.
+    member_id: Optional[int]
+        The ID of the user that the cases should be for.
+
+    Returns
+    -------
+    CasePage
+        The requested page. Its list of cases is empty if the page doesn't exist.
+    """
+    if per_page < 1:
+        raise ValueError("per_page needs to be a positive integer.")
+    case_numbers = await _get_case_numbers(guild.id, member_id)
+    if newest_first:
+        case_numbers = case_numbers[::-1]
+    page_count = -(-len(case_numbers) // per_page)
+    cases = []
+    if 0 <= page_number < page_count:
+        page_case_numbers = case_numbers[page_number * per_page : (page_number + 1) * per_page]
+        cases = [case async for case in _iter_cases_by_numbers(guild, _bot_ref, page_case_numbers)]
+    return CasePage(cases, page_number, page_count)
+
+
 async def create_case(
     bot: Red,
     guild: discord.Guild,
@@ -942,6 +1745,11 @@ async def create_case(
 
     This fires an event :code:`on_modlog_case_create`
 
+    The case is saved and its modlog message is sent in the background,
+    together with other cases created in the meantime, so `Case.message`
+    of the returned case is always ``None``.
+    When many cases are created at once, their modlog embeds are combined into fewer messages.
+
     Parameters
     ----------
     bot: Red
@@ -996,11 +1804,10 @@ async def create_case(
 
     parent_channel_id = channel.parent_id if isinstance(channel, discord.Thread) else None
 
-    async with _config.guild(guild).latest_case_number.get_lock():
-        # We're getting the case number from config, incrementing it, awaiting something, then
-        # setting it again. This warrants acquiring the lock.
-        next_case_number = await _config.guild(guild).latest_case_number() + 1
-
+    await set_contextual_locales_from_guild(bot, guild)
+    queue = _get_case_queue(guild.id)
+    async with queue.lock:
+        next_case_number = await queue.allocate_case_number()
         case = Case(
             bot,
             guild,
@@ -1018,35 +1825,114 @@ async def create_case(
             message=None,
             last_known_username=last_known_username,
         )
-        await _config.custom(_CASES, str(guild.id), str(next_case_number)).set(case.to_json())
-        await _config.guild(guild).latest_case_number.set(next_case_number)
+        # The case is written and its modlog message is sent by the guild's case queue.
+        # Events are dispatched here (while holding the lock) to keep them in case order.
+        queue.add(case)
+        bot.dispatch("modlog_case_create", case)
+    return case
+
+
+async def create_cases(
+    bot: Red,
+    guild: discord.Guild,
+    created_at: datetime,
+    action_type: str,
+    users: Iterable[Union[discord.Object, discord.abc.User, int]],
+    moderator: Optional[Union[discord.Object, discord.abc.User, int]] = None,
+    reason: Optional[str] = None,
+    until: Optional[datetime] = None,
+    channel: Optional[Union[discord.abc.GuildChannel, discord.Thread]] = None,
+) -> List[Case]:
+    """
+    Creates a case of the same action for each of the given users.
+
+    This is equivalent to calling `create_case()` for each user
+    but the case numbers are allocated at once, so the cases have consecutive numbers.
+
+    This fires an event :code:`on_modlog_case_create` for each case.
+
+    Parameters
+    ----------
+    bot: Red
+        The bot object
+    guild: discord.Guild
+        The guild the action was taken in
+    created_at: datetime
+        The time the action occurred at.
+        If naive `datetime` object is passed, it's treated as a local time
+        (similarly to how Python treats naive `datetime` objects).
+    action_type: str
+        The type of action that was taken
+    users: Iterable[Union[discord.Object, discord.abc.User, int]]
+        The users targeted by the action
+    moderator: Optional[Union[discord.Object, discord.abc.User, int]]
+        The moderator who took the action
+    reason: Optional[str]
+        The reason the action was taken
+    until: Optional[datetime]
+        The time the action is in effect until.
+        If naive `datetime` object is passed, it's treated as a local time
+        (similarly to how Python treats naive `datetime` objects).
+    channel: Optional[Union[discord.abc.GuildChannel, discord.Thread]]
+        The channel the action was taken in
+
+    Returns
+    -------
+    List[Case]
+        The created cases. The list is empty if the case type is disabled.
+
+    Raises
+    ------
+    ValueError
+        If the action type is not a valid action type.
+    RuntimeError
+        If any of the users is the bot itself.
+    TypeError
+        If ``channel`` is of type `discord.PartialMessageable`.
+    """
+    case_type = await get_casetype(action_type, guild)
+    if case_type is None:
+        raise ValueError(f"{action_type} is not a valid action type.")
+
+    if not await case_type.is_enabled():
+        return []
+
+    users = list(users)
+    for user in users:
+        user_id = user if isinstance(user, int) else user.id
+        if user_id == bot.user.id:
+            raise RuntimeError("The bot itself can not be the target of a modlog entry.")
+
+    if isinstance(channel, discord.PartialMessageable):
+        raise TypeError("Can't use PartialMessageable as the channel for a modlog case.")
+
+    parent_channel_id = channel.parent_id if isinstance(channel, discord.Thread) else None
 
     await set_contextual_locales_from_guild(bot, guild)
-    bot.dispatch("modlog_case_create", case)
-    try:
-        mod_channel = await get_modlog_channel(case.guild)
-        use_embeds = await case.bot.embed_requested(mod_channel)
-        case_content = await case.message_content(use_embeds)
-        if use_embeds:
-            msg = await mod_channel.send(embed=case_content)
-        else:
-            msg = await mod_channel.send(case_content)
-        await case._set_message(msg)
-    except RuntimeError:  # modlog channel isn't set
-        pass
-    except discord.Forbidden:
-        log.info(
-            "Modlog failed to edit the Discord message for"
-            " the case #%s from guild with ID due to missing permissions."
-        )
-    except Exception:
-        log.exception(
-            "Modlog failed to send the Discord message for"
-            " the case #%s from guild with ID %s due to unexpected error.",
-            case.case_number,
-            case.guild.id,
-        )
-    return case
+    queue = _get_case_queue(guild.id)
+    cases = []
+    async with queue.lock:
+        for user in users:
+            case = Case(
+                bot,
+                guild,
+                int(created_at.timestamp()),
+                action_type,
+                user,
+                moderator,
+                await queue.allocate_case_number(),
+                reason,
+                int(until.timestamp()) if until else None,
+                channel,
+                parent_channel_id,
+                amended_by=None,
+                modified_at=None,
+                message=None,
+            )
+            queue.add(case)
+            bot.dispatch("modlog_case_create", case)
+            cases.append(case)
+    return cases
 
 
 async def get_casetype(name: str, guild: Optional[discord.Guild] = None) -> Optional[CaseType]:
@@ -1065,7 +1951,7 @@ async def get_casetype(name: str, guild: Optional[discord.Guild] = None) -> Opti
     Optional[CaseType]
         Case type with provided name. If such case type doesn't exist this will be `None`.
     """
-    data = await _config.custom(_CASETYPES, name).all()
+    data = (await _get_casetypes_data()).get(name)
     if not data:
         return
     casetype = CaseType.from_json(name, data)
@@ -1085,7 +1971,7 @@ async def get_all_casetypes(guild: discord.Guild = None) -> List[CaseType]:
     """
     return [
         CaseType.from_json(name, data, guild=guild)
-        for name, data in (await _config.custom(_CASETYPES).all()).items()
+        for name, data in (await _get_casetypes_data()).items()
     ]
 
 
@@ -1220,11 +2106,15 @@ async def get_modlog_channel(
         If the modlog channel is not found.
 
     """
+    try:
+        channel_id = _modlog_channel_ids[guild.id]
+    except KeyError:
+        channel_id = _modlog_channel_ids[guild.id] = await _config.guild(guild).mod_log()
     if hasattr(guild, "get_channel"):
-        channel = guild.get_channel(await _config.guild(guild).mod_log())
+        channel = guild.get_channel(channel_id)
     else:
         # For unit tests only
-        channel = await _config.guild(guild).mod_log()
+        channel = channel_id
     if channel is None:
         raise RuntimeError("Failed to get the mod log channel!")
     return channel
@@ -1250,7 +2140,9 @@ async def set_modlog_channel(
         `True` if successful
 
     """
-    await _config.guild(guild).mod_log.set(channel.id if hasattr(channel, "id") else None)
+    channel_id = channel.id if hasattr(channel, "id") else None
+    await _config.guild(guild).mod_log.set(channel_id)
+    _modlog_channel_ids[guild.id] = channel_id
     return True
 
 
@@ -1264,8 +2156,15 @@ async def reset_cases(guild: discord.Guild) -> None:
         The guild to reset cases for
 
     """
-    await _config.custom(_CASES, str(guild.id)).clear()
-    await _config.guild(guild).latest_case_number.clear()
+    queue = _get_case_queue(guild.id)
+    async with queue.lock:
+        await queue.commit()
+        async with queue._commit_lock:
+            await _config.custom(_CASES, str(guild.id)).clear()
+            await _clear_archive(guild.id)
+        await _config.custom(_CASE_INDEX, str(guild.id)).clear()
+        await _config.guild(guild).latest_case_number.clear()
+        queue.reset()
 
 
 def _strfdelta(delta):
@@ -0,0 +1,328 @@
+"""
+Persistent scheduler of jobs that should run at a given time.
+
+Jobs are stored in Config, so they survive restarts. A job that became due while
+the bot was offline is handled as soon as the bot is ready again.
+
+A single task sleeps until the next job is due, so the scheduler doesn't use any
+resources between jobs, no matter how many of them are scheduled.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from redbot.core import Config
+
+if TYPE_CHECKING:
+    from redbot.core.bot import Red
+
+log = logging.getLogger("red.core.scheduler")
+
+__all__ = (
+    "Job",
+    "register_handler",
+    "unregister_handler",
+    "schedule",
+    "cancel",
+    "get_job",
+    "get_jobs",
+)
+
+_JOBS = "JOBS"
+# maximum time (in seconds) the scheduler sleeps for, so that changes of the system clock
+# don't delay the jobs for too long
+_MAX_SLEEP = 300
+# the heap is rebuilt when it has at least this many cancelled entries
+# and they make up more than a half of it
+_COMPACT_THRESHOLD = 1000
+
+_config: Optional[Config] = None
+_bot_ref: Optional[Red] = None
+
+
+class Job(NamedTuple):
+    """A scheduled job.
+
+    Attributes
+    ----------
+    owner : str
+        The name of the job's owner, usually the cog's name.
+    id : str
+        The job's ID, unique among the owner's jobs.
+    due : datetime.datetime
+        When the job is due.
+    payload : dict
+        JSON-serializable data passed to the handler.
+    """
+
+    owner: str
+    id: str
+    due: datetime
+    payload: dict
+
+
+# (due timestamp, sequence number, owner, job ID)
+_Entry = Tuple[float, int, str, str]
+JobHandler = Callable[[Job], Awaitable[Any]]
+
+_jobs: Dict[Tuple[str, str], Job] = {}
+# the heap entry of each job, any other entry in the heap was cancelled or replaced
+_entries: Dict[Tuple[str, str], _Entry] = {}
+_heap: List[_Entry] = []
+_sequence = itertools.count()
+_handlers: Dict[str, JobHandler] = {}
+# entries of the due jobs of owners without a registered handler, by owner and job ID
+_waiting: Dict[str, Dict[str, _Entry]] = {}
+_running: Dict[Tuple[str, str], asyncio.Task] = {}
+_write_lock = asyncio.Lock()
+_wakeup: Optional[asyncio.Event] = None
+_scheduler_task: Optional[asyncio.Task] = None
+
+
+async def _init(bot: Red) -> None:
+    global _config
+    global _bot_ref
+    global _wakeup
+    global _scheduler_task
+    _bot_ref = bot
+    _jobs.clear()
+    _entries.clear()
+    _heap.clear()
+    _handlers.clear()
+    _waiting.clear()
+    _running.clear()
+    _config = Config.get_conf(None, 2105186532, cog_name="Scheduler")
+    _config.init_custom(_JOBS, 2)
+    _config.register_custom(_JOBS)
+
+    all_jobs = await _config.custom(_JOBS).all()
+    for owner, jobs in all_jobs.items():
+        for job_id, data in jobs.items():
+            _add_job(
+                Job(
+                    owner,
+                    job_id,
+                    datetime.fromtimestamp(data["due"], timezone.utc),
+                    data["payload"],
+                )
+            )
+    if _jobs:
+        log.debug("Loaded %s scheduled jobs.", len(_jobs))
+
+    if _scheduler_task is not None:
+        _scheduler_task.cancel()
+    _wakeup = asyncio.Event()
+    _scheduler_task = asyncio.create_task(_scheduler_loop())
+
+
+async def _shutdown() -> None:
+    """Stop the scheduler. Jobs that are being handled run again on the next start."""
+    if _scheduler_task is not None:
+        _scheduler_task.cancel()
+    for task in _running.values():
+        task.cancel()
+
+
+def _add_job(job: Job) -> None:
+    key = (job.owner, job.id)
+    entry = (job.due.timestamp(), next(_sequence), job.owner, job.id)
+    _remove_job(key)
+    _jobs[key] = job
+    _entries[key] = entry
+    heapq.heappush(_heap, entry)
+    if _wakeup is not None and _heap[0] is entry:
+        _wakeup.set()
+
+
+def _remove_job(key: Tuple[str, str]) -> Optional[Job]:
+    if _entries.pop(key, None) is not None:
+        _maybe_compact()
+    elif _waiting.get(key[0], {}).pop(key[1], None) is None:
+        return None
+    return _jobs.pop(key)
+
+
+def _maybe_compact() -> None:
+    global _heap
+    stale = len(_heap) - len(_entries)
+    if stale >= _COMPACT_THRESHOLD and stale * 2 > len(_heap):
+        _heap = list(_entries.values())
+        heapq.heapify(_heap)
+
+
+async def _scheduler_loop() -> None:
+    await _bot_ref.wait_until_red_ready()
+    while True:
+        _wakeup.clear()
+        now = time.time()
+        while _heap and _heap[0][0] <= now:
+            entry = heapq.heappop(_heap)
+            owner, job_id = entry[2:]
+            if _entries.get((owner, job_id)) is not entry:
+                continue
+            if owner in _handlers:
+                _dispatch(entry)
+            else:
+                del _entries[owner, job_id]
+                _waiting.setdefault(owner, {})[job_id] = entry
+
+        timeout = _MAX_SLEEP
+        if _heap:
+            timeout = min(max(_heap[0][0] - time.time(), 0), _MAX_SLEEP)
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+def _dispatch(entry: _Entry) -> None:
+    key = (entry[2], entry[3])
+    job = _remove_job(key)
+    # the job isn't removed from Config until it's handled,
+    # so that it runs again after a restart during handling
+    _running[key] = asyncio.create_task(_run_job(_handlers[job.owner], job))
+
+
+async def _run_job(handler: JobHandler, job: Job) -> None:
+    key = (job.owner, job.id)
+    try:
+        await handler(job)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        log.exception("Handler of %s's job %r raised an exception.", job.owner, job.id)
+    finally:
+        _running.pop(key, None)
+
+    async with _write_lock:
+        # the handler may have scheduled the job again
+        if key not in _jobs:
+            await _config.custom(_JOBS, job.owner, job.id).clear()
+
+
+def register_handler(owner: str, handler: JobHandler) -> None:
+    """Register the handler of the owner's jobs.
+
+    The handler is called with the `Job` when it's due. Jobs that became due while the owner
+    had no handler (e.g. while its cog was unloaded) are handled right away.
+
+    Jobs are removed from Config only after they have been handled, so a handler
+    may be called again with the same job if the bot is stopped during its handling.
+
+    Parameters
+    ----------
+    owner : str
+        The name of the jobs' owner, usually the cog's name.
+    handler : Callable[[Job], Awaitable[Any]]
+        The coroutine function to call with each due job.
+    """
+    _handlers[owner] = handler
+    waiting = _waiting.pop(owner, {})
+    for job_id, entry in waiting.items():
+        _entries[owner, job_id] = entry
+        heapq.heappush(_heap, entry)
+    if waiting and _wakeup is not None:
+        _wakeup.set()
+
+
+def unregister_handler(owner: str) -> None:
+    """Unregister the handler of the owner's jobs.
+
+    The owner's jobs stay scheduled and are handled once a handler is registered again.
+
+    Parameters
+    ----------
+    owner : str
+        The name of the jobs' owner.
+    """
+    _handlers.pop(owner, None)
+
+
+async def schedule(owner: str, job_id: str, due: datetime, payload: Optional[dict] = None) -> Job:
+    """Schedule a job, replacing the owner's job with the same ID if there is one.
+
+    Parameters
+    ----------
+    owner : str
+        The name of the job's owner, usually the cog's name.
+    job_id : str
+        The job's ID, unique among the owner's jobs.
+    due : datetime.datetime
+        When the job should be handled. A job that's already due is handled right away.
+    payload : Optional[dict]
+        JSON-serializable data to pass to the handler.
+
+    Returns
+    -------
+    Job
+        The scheduled job.
+    """
+    job = Job(owner, job_id, due, payload if payload is not None else {})
+    async with _write_lock:
+        _add_job(job)
+        await _config.custom(_JOBS, owner, job_id).set(
+            {"due": due.timestamp(), "payload": job.payload}
+        )
+    return job
+
+
+async def cancel(owner: str, job_id: str) -> bool:
+    """Cancel the owner's job.
+
+    Parameters
+    ----------
+    owner : str
+        The name of the job's owner.
+    job_id : str
+        The job's ID.
+
+    Returns
+    -------
+    bool
+        Whether the job was scheduled.
+    """
+    async with _write_lock:
+        if _remove_job((owner, job_id)) is None:
+            return False
+        await _config.custom(_JOBS, owner, job_id).clear()
+    return True
+
+
+def get_job(owner: str, job_id: str) -> Optional[Job]:
+    """Get the owner's scheduled job.
+
+    Parameters
+    ----------
+    owner : str
+        The name of the job's owner.
+    job_id : str
+        The job's ID.
+
+    Returns
+    -------
+    Optional[Job]
+        The job or ``None`` if it isn't scheduled.
+    """
+    return _jobs.get((owner, job_id))
+
+
+def get_jobs(owner: str) -> List[Job]:
+    """Get all of the owner's scheduled jobs, ordered by their due time.
+
+    Parameters
+    ----------
+    owner : str
+        The name of the jobs' owner.
+
+    Returns
+    -------
+    List[Job]
+        The owner's jobs.
+    """
+    return sorted((job for job in _jobs.values() if job.owner == owner), key=lambda j: j.due)
@@ -1,6 +1,19 @@
 import asyncio
 from datetime import timedelta
-from typing import List, Iterable, Union, TYPE_CHECKING, Dict, Optional
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Iterable,
+    NamedTuple,
+    Union,
+    TYPE_CHECKING,
+    Dict,
+    Optional,
+)
 
 import discord
 
@@ -10,6 +23,8 @@ if TYPE_CHECKING:
 
 __all__ = (
     "mass_purge",
+    "mass_ban",
+    "MassBanProgress",
     "slow_deletion",
     "get_audit_reason",
     "is_mod_or_superior",
@@ -18,19 +33,60 @@ __all__ = (
     "check_permissions",
 )
 
+# maximum number of chunks of messages fetched ahead of the deletions by `mass_purge()`
+_PURGE_QUEUE_SIZE = 2
 
-async def mass_purge(
+
+async def _iterate(
+    messages: Union[Iterable[discord.Message], AsyncIterable[discord.Message]]
+) -> AsyncIterator[discord.Message]:
+    if isinstance(messages, AsyncIterable):
+        async for message in messages:
+            yield message
+    else:
+        for message in messages:
+            yield message
+
+
+async def _delete_chunk(
+    channel: Union[
+        discord.TextChannel, discord.VoiceChannel, discord.StageChannel, discord.Thread
+    ],
     messages: List[discord.Message],
+    reason: Optional[str],
+) -> None:
+    while True:
+        # discord.NotFound can be raised when `len(messages) == 1` and the message does not exist.
+        # As a result of this obscure behavior, this error needs to be caught just in case.
+        try:
+            await channel.delete_messages(messages, reason=reason)
+        except discord.RateLimited as e:
+            # discord.py didn't wait out the rate limit as it's too long
+            await asyncio.sleep(e.retry_after)
+        except discord.errors.HTTPException:
+            return
+        else:
+            return
+
+
+async def mass_purge(
+    messages: Union[Iterable[discord.Message], AsyncIterable[discord.Message]],
     channel: Union[
         discord.TextChannel, discord.VoiceChannel, discord.StageChannel, discord.Thread
     ],
     *,
     reason: Optional[str] = None,
-):
+    progress: Optional[Callable[[int], Awaitable[Any]]] = None,
+) -> int:
     """Bulk delete messages from a channel.
 
-    If more than 100 messages are supplied, the bot will delete 100 messages at
-    a time, sleeping between each action.
+    The messages are deleted 100 at a time. When an async iterable is passed, the messages
+    are deleted while it's still being iterated over (e.g. while the channel's history
+    is still being fetched), with at most a few hundred messages kept in memory at once.
+    If the iteration fails, the messages iterated over before the error
+    are still deleted and the error is then raised.
+
+    The deletions are paced by discord.py, according to the rate limits Discord reports.
 
     Note
     ----
@@ -39,12 +95,20 @@ async def mass_purge(
 
     Parameters
     ----------
-    messages : `list` of `discord.Message`
+    messages : `iterable` or `async iterable` of `discord.Message`
         The messages to bulk delete.
     channel : `discord.TextChannel`, `discord.VoiceChannel`, `discord.StageChannel`, or `discord.Thread`
         The channel to delete messages from.
     reason : `str`, optional
         The reason for bulk deletion, which will appear in the audit log.
+    progress : `callable`, optional
+        The coroutine function called with the number of messages processed so far
+        after each bulk deletion.
+
+    Returns
+    -------
+    int
+        The number of messages processed.
 
     Raises
     ------
@@ -55,15 +119,163 @@ async def mass_purge(
         Deleting the messages failed.
 
     """
-    while messages:
-        # discord.NotFound can be raised when `len(messages) == 1` and the message does not exist.
-        # As a result of this obscure behavior, this error needs to be caught just in case.
+    queue: asyncio.Queue[List[discord.Message]] = asyncio.Queue(maxsize=_PURGE_QUEUE_SIZE)
+
+    async def produce() -> None:
+        chunk = []
         try:
-            await channel.delete_messages(messages[:100], reason=reason)
-        except discord.errors.HTTPException:
-            pass
-        messages = messages[100:]
-        await asyncio.sleep(1.5)
+            async for message in _iterate(messages):
+                chunk.append(message)
+                if len(chunk) == 100:
+                    await queue.put(chunk)
+                    chunk = []
+        except Exception:
+            # the messages iterated over before the error are still deleted
+            if chunk:
+                await queue.put(chunk)
+            raise
+        if chunk:
+            await queue.put(chunk)
+
+    producer = asyncio.create_task(produce())
+    processed = 0
+    try:
+        while True:
+            if not queue.empty():
+                chunk = queue.get_nowait()
+            elif producer.done():
+                # all messages were processed or the producer failed
+                break
+            else:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait((getter, producer), return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    continue
+                chunk = getter.result()
+            await _delete_chunk(channel, chunk, reason)
+            processed += len(chunk)
+            if progress is not None:
+                await progress(processed)
+    finally:
+        producer.cancel()
+    # raise the producer's exception, if there was one
+    await producer
+    return processed
+
+
+# maximum number of users that can be banned with a single bulk ban request
+_BULK_BAN_LIMIT = 200
+
+
+class MassBanProgress(NamedTuple):
+    """Users banned by a single step of `mass_ban()`.
+
+    Attributes
+    ----------
+    banned : List[int]
+        IDs of the banned users.
+    failed : Dict[int, Optional[discord.HTTPException]]
+        IDs of the users that couldn't be banned, mapped to the error.
+        The error is ``None`` when the user was a part of a bulk ban that didn't ban them.
+    """
+
+    banned: List[int]
+    failed: Dict[int, Optional[discord.HTTPException]]
+
+
+async def _ban_one(
+    guild: discord.Guild, user_id: int, *, reason: Optional[str], delete_message_seconds: int
+) -> Optional[discord.HTTPException]:
+    while True:
+        try:
+            await guild.ban(
+                discord.Object(id=user_id),
+                reason=reason,
+                delete_message_seconds=delete_message_seconds,
+            )
+        except discord.RateLimited as e:
+            # discord.py didn't wait out the rate limit as it's too long
+            await asyncio.sleep(e.retry_after)
+        except discord.HTTPException as e:
+            return e
+        else:
+            return None
+
+
+async def mass_ban(
+    guild: discord.Guild,
+    user_ids: Iterable[int],
+    *,
+    reason: Optional[str] = None,
+    delete_message_seconds: int = 0,
+    concurrency: int = 5,
+) -> AsyncIterator[MassBanProgress]:
+    """Ban many users from a guild, yielding the progress after each step.
+
+    When the bot has the Manage Server permission and the installed discord.py
+    supports it, users are banned with bulk bans of up to 200 users each.
+    Otherwise (or if a bulk ban fails), the remaining users are banned one by one,
+    with up to ``concurrency`` requests made at once. discord.py paces the requests
+    according to the rate limits of the ban endpoint.
+
+    Note
+    ----
+    This doesn't do any hierarchy checks, they need to be done beforehand.
+
+    Parameters
+    ----------
+    guild : discord.Guild
+        The guild to ban the users from.
+    user_ids : Iterable[int]
+        IDs of the users to ban.
+    reason : Optional[str]
+        The reason for the bans, which will appear in the audit log.
+    delete_message_seconds : int
+        The number of seconds worth of messages to delete from the banned users.
+    concurrency : int
+        The maximum number of single ban requests made at once.
+
+    Yields
+    ------
+    MassBanProgress
+        The users banned by each step.
+    """
+    user_ids = list(user_ids)
+    bulk_ban = getattr(guild, "bulk_ban", None)
+    if bulk_ban is not None and guild.me.guild_permissions.manage_guild:
+        while user_ids:
+            chunk = user_ids[:_BULK_BAN_LIMIT]
+            try:
+                result = await bulk_ban(
+                    [discord.Object(id=user_id) for user_id in chunk],
+                    reason=reason,
+                    delete_message_seconds=delete_message_seconds,
+                )
+            except discord.HTTPException:
+                break
+            user_ids = user_ids[_BULK_BAN_LIMIT:]
+            yield MassBanProgress(
+                [user.id for user in result.banned], {user.id: None for user in result.failed}
+            )
+
+    for idx in range(0, len(user_ids), concurrency):
+        chunk = user_ids[idx : idx + concurrency]
+        errors = await asyncio.gather(
+            *(
+                _ban_one(
+                    guild, user_id, reason=reason, delete_message_seconds=delete_message_seconds
+                )
+                for user_id in chunk
+            )
+        )
+        progress = MassBanProgress([], {})
+        for user_id, error in zip(chunk, errors):
+            if error is None:
+                progress.banned.append(user_id)
+            else:
+                progress.failed[user_id] = error
+        yield progress
 
 
 async def slow_deletion(messages: Iterable[discord.Message]):
@@ -81,6 +81,13 @@ class SimpleMenu(discord.ui.View):
         The pages of the menu.
         if the page is a `dict` its keys must be valid messageable args.
         e,g. "content", "embed", etc.
+
+        A page source (``redbot.vendored.discord.ext.menus.PageSource``) can be passed instead,
+        to only get and format the displayed pages.
+
+        .. warning::
+
+            Passing a page source is `provisional <developer-guarantees-exclusions>`.
     page_start: int
         The page to start the menu at.
     timeout: float
@@ -125,7 +132,7 @@ class SimpleMenu(discord.ui.View):
 
     def __init__(
         self,
-        pages: List[_ACCEPTABLE_PAGE_TYPES],
+        pages: Union[List[_ACCEPTABLE_PAGE_TYPES], menus.PageSource],
         timeout: float = 180.0,
         page_start: int = 0,
         delete_after_timeout: bool = False,
@@ -139,7 +146,10 @@ class SimpleMenu(discord.ui.View):
         self._fallback_author_to_ctx = True
         self.author: Optional[discord.abc.User] = None
         self.message: Optional[discord.Message] = None
-        self._source = _SimplePageSource(items=pages)
+        if isinstance(pages, menus.PageSource):
+            self._source = pages
+        else:
+            self._source = _SimplePageSource(items=pages)
         self.ctx: Optional[Context] = None
         self.current_page = page_start
         self.delete_after_timeout = delete_after_timeout
@@ -169,7 +179,7 @@ class SimpleMenu(discord.ui.View):
         )
         self.select_options = [
             discord.SelectOption(label=_("Page {num}").format(num=num + 1), value=num)
-            for num, x in enumerate(pages)
+            for num in range(self.source.get_max_pages())
         ]
         self.stop_button = _StopButton(
             discord.ButtonStyle.red, "\N{HEAVY MULTIPLICATION X}\N{VARIATION SELECTOR-16}"
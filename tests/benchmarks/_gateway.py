@@ -0,0 +1,187 @@
+"""
+Helpers for replaying synthetic gateway traffic through Red without a connection to Discord.
+
+Guilds, channels, members and messages are real discord.py objects created from
+gateway-like payloads, so that the code paths are the same as with real traffic.
+The HTTP client is replaced with `FakeHTTPClient` which never touches the network.
+"""
+from __future__ import annotations
+
+import itertools
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import discord
+
+__all__ = ("FakeHTTPClient", "SyntheticGuild")
+
+_snowflakes = itertools.count(discord.utils.time_snowflake(datetime.now(timezone.utc)))
+
+
+def next_snowflake() -> int:
+    return next(_snowflakes)
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def user_payload(user_id: int, name: str, *, bot: bool = False) -> Dict[str, Any]:
+    return {
+        "id": str(user_id),
+        "username": name,
+        "discriminator": "0",
+        "global_name": None,
+        "avatar": None,
+        "bot": bot,
+    }
+
+
+def message_payload(
+    *,
+    channel_id: int,
+    guild_id: Optional[int],
+    author: Dict[str, Any],
+    content: str,
+    member: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    payload = {
+        "id": str(next_snowflake()),
+        "channel_id": str(channel_id),
+        "author": author,
+        "content": content,
+        "timestamp": _timestamp(),
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+    }
+    if guild_id is not None:
+        payload["guild_id"] = str(guild_id)
+    if member is not None:
+        payload["member"] = member
+    return payload
+
+
+class FakeHTTPClient:
+    """
+    Stand-in for `discord.http.HTTPClient` that records calls instead of making requests.
+
+    Message creation returns a valid message payload, all other routes return ``None``.
+    """
+
+    def __init__(self, bot_user: Dict[str, Any]) -> None:
+        self.bot_user = bot_user
+        self.calls: Counter = Counter()
+
+    async def send_message(self, channel_id: int, *, params: Any) -> Dict[str, Any]:
+        self.calls["send_message"] += 1
+        payload = params.payload or {}
+        return message_payload(
+            channel_id=channel_id,
+            guild_id=None,
+            author=self.bot_user,
+            content=payload.get("content") or "",
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        async def route(*args: Any, **kwargs: Any) -> None:
+            self.calls[name] += 1
+
+        return route
+
+
+class SyntheticGuild:
+    """A guild with a text channel, the bot's member and a pool of regular members."""
+
+    def __init__(
+        self, state: Any, *, bot_user: Dict[str, Any], owner_id: int, member_count: int = 50
+    ) -> None:
+        self.id = next_snowflake()
+        self.channel_id = next_snowflake()
+        bot_role_id = next_snowflake()
+        self.owner_payload = user_payload(owner_id, "owner")
+        self.member_payloads: List[Dict[str, Any]] = [
+            user_payload(next_snowflake(), f"member{idx}") for idx in range(member_count)
+        ]
+        everyone = discord.Permissions.general()
+        everyone.update(send_messages=True, read_message_history=True)
+        data = {
+            "id": str(self.id),
+            "name": "Benchmark Guild",
+            "owner_id": str(owner_id),
+            "member_count": member_count + 2,
+            "roles": [
+                self._role_payload(self.id, "@everyone", everyone.value, 0),
+                self._role_payload(bot_role_id, "Bot", discord.Permissions.all().value, 1),
+            ],
+            "channels": [
+                {
+                    "id": str(self.channel_id),
+                    "type": 0,
+                    "name": "general",
+                    "position": 0,
+                    "permission_overwrites": [],
+                    "nsfw": False,
+                    "parent_id": None,
+                    "topic": None,
+                    "rate_limit_per_user": 0,
+                    "last_message_id": None,
+                }
+            ],
+            "members": [
+                self._member_payload(bot_user, [bot_role_id]),
+                self._member_payload(self.owner_payload),
+                *(self._member_payload(user) for user in self.member_payloads),
+            ],
+        }
+        self.guild = discord.Guild(data=data, state=state)
+        state._add_guild(self.guild)
+        self.channel = self.guild.get_channel(self.channel_id)
+        self._state = state
+
+    @staticmethod
+    def _role_payload(role_id: int, name: str, permissions: int, position: int) -> Dict[str, Any]:
+        return {
+            "id": str(role_id),
+            "name": name,
+            "permissions": str(permissions),
+            "position": position,
+            "color": 0,
+            "hoist": False,
+            "managed": False,
+            "mentionable": False,
+        }
+
+    @staticmethod
+    def _member_payload(user: Dict[str, Any], roles: Optional[List[int]] = None) -> Dict[str, Any]:
+        return {
+            "user": user,
+            "roles": [str(role_id) for role_id in roles or ()],
+            "joined_at": _timestamp(),
+            "deaf": False,
+            "mute": False,
+            "nick": None,
+            "flags": 0,
+        }
+
+    def message(self, author: Dict[str, Any], content: str) -> discord.Message:
+        member = self._member_payload(author)
+        del member["user"]
+        data = message_payload(
+            channel_id=self.channel_id,
+            guild_id=self.id,
+            author=author,
+            content=content,
+            member=member,
+        )
+        return discord.Message(state=self._state, channel=self.channel, data=data)
@@ -0,0 +1,51 @@
+"""Helpers for reporting benchmark results."""
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+__all__ = ("benchmark", "env", "summarize", "write_results")
+
+#: Marks benchmarks, which are skipped unless the ``RED_BENCHMARKS`` environment variable is set.
+benchmark = pytest.mark.skipif(
+    not os.environ.get("RED_BENCHMARKS"),
+    reason="benchmarks only run when the RED_BENCHMARKS environment variable is set",
+)
+
+
+def env(name: str, default: str) -> str:
+    return os.environ.get(name, default)
+
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    """Summarize the given durations (in seconds)."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    count = len(ordered)
+    total = sum(ordered)
+    return {
+        "count": count,
+        "total": total,
+        "mean": total / count,
+        "p50": ordered[(count - 1) // 2],
+        "p99": ordered[min(count - 1, int(count * 0.99))],
+        "max": ordered[-1],
+        "ops_per_second": count / total if total else None,
+    }
+
+
+def write_results(name: str, results: Any) -> None:
+    """
+    Write the results of the named benchmark as JSON
+    to the directory set with the ``RED_BENCH_OUTPUT`` environment variable.
+    """
+    output = os.environ.get("RED_BENCH_OUTPUT")
+    if not output:
+        return
+    path = Path(output)
+    path.mkdir(parents=True, exist_ok=True)
+    with (path / f"{name}.json").open("w", encoding="utf-8") as fp:
+        json.dump(results, fp, indent=4)
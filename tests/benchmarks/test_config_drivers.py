@@ -0,0 +1,162 @@
+"""
+Benchmark of Config operations on the configured storage backend.
+
+The backend is the one the test session runs with, so the same suite can be run
+against every driver, for example::
+
+    RED_BENCHMARKS=1 pytest tests/benchmarks/test_config_drivers.py -s
+    RED_BENCHMARKS=1 RED_STORAGE_TYPE=postgres pytest tests/benchmarks/test_config_drivers.py -s
+
+(the latter is what ``RED_BENCHMARKS=1 tox -e postgres -- tests/benchmarks -s`` does).
+Benchmarks are skipped unless the ``RED_BENCHMARKS`` environment variable is set.
+
+The benchmark can be configured with environment variables:
+
+- ``RED_BENCH_CONFIG_SIZES`` - comma-separated numbers of primary keys that the data set
+  is populated with (default: 1000), e.g. ``1000,100000,1000000``
+- ``RED_BENCH_CONFIG_OPS`` - number of times each single-key operation is measured (default: 100)
+- ``RED_BENCH_CONFIG_WRITERS`` - number of concurrent writers (default: 10)
+- ``RED_BENCH_SEED`` - seed of the random generator used to pick the keys (default: 0)
+- ``RED_BENCH_OUTPUT`` - directory that the JSON results should be written to
+"""
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+import discord
+import pytest
+
+from redbot.core import Config, data_manager
+
+from ._report import benchmark, env, summarize, write_results
+
+pytestmark = benchmark
+
+SIZES = [int(size) for size in env("RED_BENCH_CONFIG_SIZES", "1000").split(",")]
+#: Maximum number of members stored per guild in the member data set.
+MEMBERS_PER_GUILD = 1000
+#: Number of times the whole-scope operations (``all_guilds()``, ``all_members()``) are measured.
+SCOPE_OPS = 3
+
+GUILD_DEFAULTS = {"enabled": False, "counter": 0, "nested": {"a": {"b": 0}}, "items": []}
+MEMBER_DEFAULTS = {"points": 0, "flags": {}}
+
+
+async def _measure(op: Callable[[int], Awaitable[Any]], repeat: int) -> Dict[str, Any]:
+    samples: List[float] = []
+    for idx in range(repeat):
+        start = time.perf_counter()
+        await op(idx)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+async def _populate(config: Config, size: int) -> Dict[int, List[int]]:
+    guild_data = {
+        str(guild_id): {"enabled": True, "counter": guild_id, "nested": {"a": {"b": guild_id}}}
+        for guild_id in range(1, size + 1)
+    }
+    await config._get_base_group(Config.GUILD).set(guild_data)
+    del guild_data
+
+    guild_count = max(1, size // MEMBERS_PER_GUILD)
+    per_guild = size // guild_count
+    member_ids = {
+        guild_id: list(range(guild_id * per_guild, (guild_id + 1) * per_guild))
+        for guild_id in range(1, guild_count + 1)
+    }
+    member_data = {
+        str(guild_id): {str(member_id): {"points": member_id} for member_id in members}
+        for guild_id, members in member_ids.items()
+    }
+    await config._get_base_group(Config.MEMBER).set(member_data)
+    return member_ids
+
+
+@pytest.mark.parametrize("size", SIZES)
+async def test_config_driver(config, size):
+    config.register_guild(**GUILD_DEFAULTS)
+    config.register_member(**MEMBER_DEFAULTS)
+    ops = int(env("RED_BENCH_CONFIG_OPS", "100"))
+    writers = int(env("RED_BENCH_CONFIG_WRITERS", "10"))
+    rng = random.Random(int(env("RED_BENCH_SEED", "0")))
+
+    start = time.perf_counter()
+    member_ids = await _populate(config, size)
+    populate_time = time.perf_counter() - start
+
+    guild_ids = [rng.randint(1, size) for _ in range(ops)]
+    # guilds that are not in the data set, so that defaults are used
+    missing_ids = [size + 1 + idx for idx in range(ops)]
+
+    async def nested_update(idx: int) -> None:
+        async with config.guild_from_id(guild_ids[idx]).nested() as nested:
+            nested["a"]["b"] += 1
+
+    async def set_raw(idx: int) -> None:
+        await config.guild_from_id(guild_ids[idx]).set_raw("nested", "a", "b", value=idx)
+
+    results: Dict[str, Any] = {
+        "get": await _measure(lambda idx: config.guild_from_id(guild_ids[idx]).counter(), ops),
+        "get_default": await _measure(
+            lambda idx: config.guild_from_id(missing_ids[idx]).counter(), ops
+        ),
+        "get_group": await _measure(lambda idx: config.guild_from_id(guild_ids[idx]).all(), ops),
+        "set": await _measure(
+            lambda idx: config.guild_from_id(guild_ids[idx]).counter.set(idx), ops
+        ),
+        "set_new": await _measure(
+            lambda idx: config.guild_from_id(missing_ids[idx]).counter.set(idx), ops
+        ),
+        "set_raw": await _measure(set_raw, ops),
+        "nested_update": await _measure(nested_update, ops),
+        "clear": await _measure(lambda idx: config.guild_from_id(guild_ids[idx]).clear(), ops),
+        "all_guilds": await _measure(lambda idx: config.all_guilds(), SCOPE_OPS),
+        "all_members": await _measure(lambda idx: config.all_members(), SCOPE_OPS),
+        "all_members_of_guild": await _measure(
+            lambda idx: config.all_members(discord.Object(idx % len(member_ids) + 1)), SCOPE_OPS
+        ),
+    }
+
+    # all writers update the same values, the final values show whether any update was lost
+    shared = config.guild_from_id(size + ops + 1)
+    writes_per_writer = max(1, ops // writers)
+    samples: List[float] = []
+
+    async def writer(writer_id: int) -> None:
+        for _ in range(writes_per_writer):
+            start = time.perf_counter()
+            async with shared.nested() as nested:
+                nested["a"]["b"] += 1
+            async with shared.items() as items:
+                items.append(writer_id)
+            samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(writer(writer_id) for writer_id in range(writers)))
+    concurrent_time = time.perf_counter() - start
+    total_writes = writers * writes_per_writer
+    assert await shared.nested.a.b() == total_writes
+    assert len(await shared.items()) == total_writes
+    results["concurrent_writers"] = {
+        "writers": writers,
+        "elapsed": concurrent_time,
+        "updates_per_second": total_writes * 2 / concurrent_time,
+        "per_writer_iteration": summarize(samples),
+    }
+
+    report = {
+        "backend": data_manager.storage_type(),
+        "size": size,
+        "ops": ops,
+        "populate_time": populate_time,
+        "results": results,
+    }
+    print(f"\nConfig driver benchmark ({report['backend']}, {size} keys):")
+    for name, stats in results.items():
+        if name == "concurrent_writers":
+            print(f"  {name}: {stats['updates_per_second']:.0f} updates/s")
+        else:
+            print(f"  {name}: {stats['mean'] * 1000:.3f}ms mean, {stats['p99'] * 1000:.3f}ms p99")
+    write_results(f"config_{report['backend'].lower()}_{size}", report)
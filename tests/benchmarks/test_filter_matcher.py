@@ -0,0 +1,89 @@
+"""
+Benchmark of Filter's word matching against the regex alternation it used previously.
+
+The benchmark can be configured with environment variables:
+
+- ``RED_BENCH_FILTER_WORDS`` - number of filtered words (default: 10000)
+- ``RED_BENCH_FILTER_MESSAGES`` - number of matched messages (default: 300)
+- ``RED_BENCH_SEED`` - seed of the random generator used to generate the words (default: 0)
+- ``RED_BENCH_OUTPUT`` - directory that the JSON results should be written to
+
+Benchmarks are skipped unless the ``RED_BENCHMARKS`` environment variable is set.
+Run it with ``RED_BENCHMARKS=1 pytest tests/benchmarks/test_filter_matcher.py -s``
+to see the report.
+"""
+import random
+import re
+import string
+import time
+from typing import Any, Callable, Dict, List, Set
+
+from redbot.cogs.filter.matcher import WordMatcher
+
+from ._report import benchmark, env, summarize, write_results
+
+pytestmark = benchmark
+
+
+def _random_word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+
+
+def _measure(find: Callable[[str], Set[str]], messages: List[str]) -> Dict[str, Any]:
+    samples = []
+    for message in messages:
+        start = time.perf_counter()
+        find(message)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def test_filter_matcher():
+    word_count = int(env("RED_BENCH_FILTER_WORDS", "10000"))
+    message_count = int(env("RED_BENCH_FILTER_MESSAGES", "300"))
+    rng = random.Random(int(env("RED_BENCH_SEED", "0")))
+
+    words = list({_random_word(rng) for _ in range(word_count)})
+    messages = []
+    for _ in range(message_count):
+        message = [_random_word(rng) for _ in range(rng.randint(5, 40))]
+        if rng.random() < 0.1:
+            message.insert(rng.randrange(len(message)), rng.choice(words).upper())
+        messages.append(" ".join(message))
+
+    start = time.perf_counter()
+    pattern = re.compile("|".join(rf"\b{re.escape(w)}\b" for w in words), flags=re.I)
+    regex_build = time.perf_counter() - start
+    start = time.perf_counter()
+    matcher = WordMatcher(words)
+    matcher.find("")
+    matcher.find("warm up")
+    matcher_build = time.perf_counter() - start
+
+    for message in messages:
+        assert matcher.find(message) >= set(pattern.findall(message))
+
+    # a word added to the filter, which recompiled the whole regex
+    start = time.perf_counter()
+    matcher.add("added")
+    matcher.find("added")
+    matcher_add = time.perf_counter() - start
+
+    results = {
+        "words": len(words),
+        "messages": message_count,
+        "regex": {"build": regex_build, "find": _measure(pattern.findall, messages)},
+        "matcher": {
+            "build": matcher_build,
+            "add": matcher_add,
+            "find": _measure(matcher.find, messages),
+        },
+    }
+    print(f"\nFilter matching ({len(words)} words):")
+    for name in ("regex", "matcher"):
+        stats = results[name]
+        print(
+            f"  {name}: {stats['build'] * 1000:.1f}ms build,"
+            f" {stats['find']['mean'] * 1e6:.1f}us mean, {stats['find']['p99'] * 1e6:.1f}us p99"
+        )
+    write_results("filter_matcher", results)
@@ -0,0 +1,187 @@
+"""
+Replay benchmark of Red's per-message overhead.
+
+A stream of command and non-command messages is dispatched through Red
+(the same way the gateway's MESSAGE_CREATE does it, which ends up in `Red.process_commands`)
+with Permissions, Filter, Mod, Alias and CustomCommands loaded on the JSON driver.
+No network connection is made.
+
+The stream can be configured with environment variables:
+
+- ``RED_BENCH_MESSAGES`` - number of replayed messages (default: 300)
+- ``RED_BENCH_COMMAND_RATIO`` - fraction of messages that are commands (default: 0.2)
+- ``RED_BENCH_SEED`` - seed of the random generator used to build the stream (default: 0)
+- ``RED_BENCH_OUTPUT`` - directory that the JSON results should be written to
+
+Benchmarks are skipped unless the ``RED_BENCHMARKS`` environment variable is set.
+Run them with ``RED_BENCHMARKS=1 pytest tests/benchmarks -s`` to see the report.
+"""
+import asyncio
+import gc
+import importlib
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+import discord
+import pytest
+
+from redbot.core import bank, modlog, scheduler
+from redbot.core.core_commands import Core
+
+from ._gateway import FakeHTTPClient, SyntheticGuild, next_snowflake, user_payload
+from ._report import benchmark, env, write_results
+
+pytestmark = benchmark
+
+PREFIX = "!"
+PACKAGES = ("permissions", "filter", "mod", "alias", "customcom")
+SETUP_COMMANDS = (
+    "filter add badword",
+    "modset deleterepeats 5",
+    "modset mentionspam ban 10",
+    "alias add hi uptime",
+    "customcom create simple hello Hello there!",
+)
+COMMANDS = ("uptime", "hi", "hello", "filter list", "nosuchcommand")
+CHATTER = (
+    "hello everyone",
+    "how is it going?",
+    "did anyone see the match yesterday",
+    "this is a badword right here",
+    "lol",
+    "can someone help me with my code",
+)
+
+
+def build_stream(
+    guild: SyntheticGuild, count: int, command_ratio: float, seed: int
+) -> List[discord.Message]:
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        author = rng.choice(guild.member_payloads)
+        if rng.random() < command_ratio:
+            content = PREFIX + rng.choice(COMMANDS)
+        else:
+            content = rng.choice(CHATTER)
+        messages.append(guild.message(author, content))
+    return messages
+
+
+class Replayer:
+    def __init__(self, red) -> None:
+        self.red = red
+        self._tasks: List[asyncio.Task] = []
+        schedule_event = red._schedule_event
+
+        def tracking_schedule_event(*args: Any, **kwargs: Any) -> asyncio.Task:
+            task = schedule_event(*args, **kwargs)
+            self._tasks.append(task)
+            return task
+
+        red._schedule_event = tracking_schedule_event
+
+    async def drain(self) -> None:
+        # events dispatched by listeners (e.g. `on_command`) are scheduled while draining
+        while self._tasks:
+            tasks, self._tasks = self._tasks, []
+            await asyncio.gather(*tasks)
+
+    async def replay(self, messages: List[discord.Message], batch_size: int = 50) -> None:
+        for idx, message in enumerate(messages, 1):
+            self.red.dispatch("message", message)
+            if idx % batch_size == 0:
+                await self.drain()
+        await self.drain()
+
+
+@pytest.fixture()
+async def bot(red):
+    await red._async_setup_hook()
+    state = red._connection
+    bot_user = user_payload(next_snowflake(), "Red", bot=True)
+    state.user = discord.ClientUser(state=state, data=bot_user)
+    http = FakeHTTPClient(bot_user)
+    red.http = state.http = http
+    owner_id = next_snowflake()
+    red.owner_ids.add(owner_id)
+
+    await red._config.prefix.set([PREFIX])
+    # the instance is brand new, there's nothing to migrate
+    await red._config.schema_version.set(3)
+    await red._pre_login()
+    await red.add_cog(Core(red))
+    await modlog._init(red)
+    await bank._init(red)
+    await scheduler._init(red)
+    for package in PACKAGES:
+        # `Red.load_extension()` can't be used with modules loaded by pytest's import hook
+        lib = importlib.import_module(f"redbot.cogs.{package}")
+        await lib.setup(red)
+        red._BotBase__extensions[package] = lib
+    red._red_ready.set()
+
+    guild = SyntheticGuild(state, bot_user=bot_user, owner_id=owner_id)
+    yield red, guild, http
+
+    for package in PACKAGES:
+        await red.unload_extension(package)
+    await scheduler._shutdown()
+
+
+async def test_message_hot_path(bot):
+    red, guild, http = bot
+    replayer = Replayer(red)
+
+    await replayer.replay(
+        [guild.message(guild.owner_payload, PREFIX + command) for command in SETUP_COMMANDS]
+    )
+    assert http.calls["send_message"] >= len(SETUP_COMMANDS)
+
+    count = int(env("RED_BENCH_MESSAGES", "300"))
+    command_ratio = float(env("RED_BENCH_COMMAND_RATIO", "0.2"))
+    seed = int(env("RED_BENCH_SEED", "0"))
+
+    # warm up caches so that the measured run reflects the steady state
+    await replayer.replay(build_stream(guild, min(count, 100), command_ratio, seed + 1))
+
+    messages = build_stream(guild, count, command_ratio, seed)
+    http.calls.clear()
+    gc.collect()
+    start = time.perf_counter()
+    await replayer.replay(messages)
+    elapsed = time.perf_counter() - start
+
+    assert http.calls["send_message"] > 0
+    assert http.calls["delete_message"] > 0
+
+    messages = build_stream(guild, count, command_ratio, seed + 2)
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        await replayer.replay(messages)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    retained_blocks = sys.getallocatedblocks() - blocks_before
+
+    results: Dict[str, Any] = {
+        "messages": count,
+        "command_ratio": command_ratio,
+        "seed": seed,
+        "elapsed": elapsed,
+        "messages_per_second": count / elapsed,
+        "retained_blocks_per_message": retained_blocks / count,
+        "peak_traced_bytes_per_message": peak / count,
+        "http_calls": dict(http.calls),
+    }
+    print(
+        "\nMessage hot path: {messages_per_second:.1f} messages/s,"
+        " {retained_blocks_per_message:.1f} retained blocks/message,"
+        " {peak_traced_bytes_per_message:.0f} peak traced bytes/message".format(**results)
+    )
+    write_results("message_hot_path", results)
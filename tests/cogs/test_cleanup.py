@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import discord
+
+
+async def test_purge_channels(red, config, monkeypatch):
+    from redbot.core import Config
+    from redbot.cogs.cleanup import cleanup as cleanup_module
+    from redbot.cogs.cleanup.cleanup import Cleanup
+
+    monkeypatch.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+    monkeypatch.setattr(cleanup_module, "CHANNEL_CONCURRENCY", 2)
+    cog = Cleanup(red)
+    now = datetime.now(timezone.utc)
+    running = 0
+    max_running = 0
+
+    def make_channel(channel_id, messages, *, broken=False):
+        fetched = []
+
+        async def history(**kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            try:
+                if broken:
+                    raise discord.Forbidden(SimpleNamespace(status=403, reason=""), "")
+                for message in messages:
+                    await asyncio.sleep(0)
+                    fetched.append(message)
+                    yield message
+            finally:
+                running -= 1
+
+        async def delete_messages(messages, *, reason):
+            assert reason == f"Reason for #{channel_id}"
+            deleted.extend(messages)
+
+        deleted = []
+        channel = SimpleNamespace(
+            id=channel_id, name=str(channel_id), history=history, delete_messages=delete_messages
+        )
+        return channel, fetched, deleted
+
+    def message(author_id, age):
+        return SimpleNamespace(
+            author=SimpleNamespace(id=author_id), created_at=now - age, pinned=False
+        )
+
+    recent = [message(10 + idx % 2, timedelta(hours=idx)) for idx in range(6)]
+    old = [message(10, timedelta(days=15 + idx)) for idx in range(3)]
+    channels = [
+        make_channel(1, recent + old),
+        make_channel(2, recent[:2]),
+        make_channel(3, [], broken=True),
+        make_channel(4, old),
+    ]
+    ctx = SimpleNamespace(guild=SimpleNamespace(id=1), channel=None, message=None)
+
+    deleted, failed = await cog.purge_channels(
+        ctx,
+        [channel for channel, _fetched, _deleted in channels],
+        check=lambda m: m.author.id == 10,
+        reason=lambda channel: f"Reason for #{channel.id}",
+    )
+    assert deleted == {1: 3, 2: 1, 4: 0}
+    assert failed == [channels[2][0]]
+    assert max_running == 2
+    # the history stops at the first message that can't be bulk deleted
+    assert channels[0][1] == recent + old[:1]
+    assert channels[0][2] == recent[::2]
+    assert channels[1][2] == recent[:1]
+    assert channels[3][1] == old[:1]
+
+
+def test_duplicate_filter():
+    from redbot.cogs.cleanup.cleanup import _DuplicateFilter
+
+    def message(author_id, content, *, embeds=(), attachments=()):
+        return SimpleNamespace(
+            author=SimpleNamespace(id=author_id),
+            content=content,
+            embeds=[discord.Embed.from_dict(embed) for embed in embeds],
+            stickers=[],
+            attachments=list(attachments),
+        )
+
+    check = _DuplicateFilter(max_size=2)
+    assert not check(message(1, "spam"))
+    assert check(message(1, "  spam\n"))
+    assert not check(message(2, "spam"))
+    assert not check(message(1, "spam", embeds=[{"title": "a", "description": "b"}]))
+    assert check(message(1, "spam", embeds=[{"description": "b", "title": "a"}]))
+    assert not check(message(1, "spam", attachments=["file"]))
+    # only the 2 most recently repeated messages are remembered
+    assert not check(message(1, "spam"))
+    assert check(message(1, "spam", embeds=[{"title": "a", "description": "b"}]))
+
+
+def test_get_cleanable_channels():
+    from redbot.cogs.cleanup.cleanup import Cleanup
+
+    bot, author = object(), object()
+
+    def make_channel(channel_id, bot_perms, author_perms):
+        perms = {
+            bot: discord.Permissions(**bot_perms),
+            author: discord.Permissions(**author_perms),
+        }
+        return SimpleNamespace(id=channel_id, permissions_for=perms.__getitem__)
+
+    full = {"view_channel": True, "read_message_history": True, "manage_messages": True}
+    text = make_channel(1, full, full)
+    thread = make_channel(2, full, full)
+    guild = SimpleNamespace(
+        me=bot,
+        text_channels=[text, make_channel(3, full, {"view_channel": True})],
+        voice_channels=[make_channel(4, {"manage_messages": True}, full)],
+        stage_channels=[make_channel(5, full, {"manage_messages": True})],
+        threads=[thread],
+    )
+    assert Cleanup.get_cleanable_channels(guild, author) == [text, thread]
+
+
+async def test_server_cleanup_notification(red, config, monkeypatch):
+    from redbot.core import Config
+    from redbot.cogs.cleanup.cleanup import Cleanup
+
+    monkeypatch.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+    cog = Cleanup(red)
+    sent = []
+
+    async def send(content, *, delete_after):
+        sent.append(content)
+
+    channel = SimpleNamespace(guild=None, send=send)
+    for num, channel_count in ((0, 0), (1, 1), (5, 1), (5, 2)):
+        await cog.send_optional_notification(num, channel, channel_count=channel_count)
+    assert sent == [
+        "No messages were deleted.",
+        "1 message was deleted in 1 channel.",
+        "5 messages were deleted in 1 channel.",
+        "5 messages were deleted in 2 channels.",
+    ]
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from redbot.pytest.economy import *
 
@@ -73,3 +74,167 @@ async def test_nonint_transaction_amount(bank, member_factory):
         await bank.withdraw_credits(mbr1, 1.0)
     with pytest.raises(TypeError):
         await bank.transfer_credits(mbr1, mbr2, 1.0)
+
+
+async def test_bank_leaderboard(bank, member_factory):
+    mbr = member_factory.get()
+    members = [mbr._replace(id=mbr.id + idx) for idx in range(5)]
+    for member, balance in zip(members, (300, 100, 500, 100, 200)):
+        await bank.set_balance(member, balance)
+
+    leaderboard = await bank.get_leaderboard(guild=mbr.guild)
+    assert [user_id for user_id, _ in leaderboard] == [members[idx].id for idx in (2, 0, 4, 1, 3)]
+    assert leaderboard[0][1]["balance"] == 500
+    assert await bank.get_leaderboard_position(members[4]) == 3
+
+    # the cached leaderboard is updated by all operations changing balances
+    await bank.deposit_credits(members[3], 1000)
+    await bank.transfer_credits(members[2], members[1], 450)
+    assert [user_id for user_id, _ in await bank.get_leaderboard(2, mbr.guild)] == [
+        members[3].id,
+        members[1].id,
+    ]
+    assert await bank.get_leaderboard_position(members[2]) == 5
+    leaderboard[0][1]["balance"] = 0
+    assert (await bank.get_leaderboard(1, mbr.guild))[0][1]["balance"] == 1100
+
+    await bank.wipe_bank(mbr.guild)
+    assert await bank.get_leaderboard(guild=mbr.guild) == []
+    assert await bank.get_leaderboard_position(members[0]) is None
+
+
+async def test_bank_bulk_operations(bank, member_factory, monkeypatch):
+    from types import SimpleNamespace
+
+    # the members are used as dict keys and the mock members aren't hashable
+    class Member(SimpleNamespace):
+        __hash__ = object.__hash__
+
+    mbr = member_factory.get()
+    members = [
+        Member(id=mbr.id + idx, guild=mbr.guild, display_name=mbr.display_name) for idx in range(4)
+    ]
+    default_bal = await bank.get_default_balance(mbr.guild)
+    await bank.set_balance(members[0], 50)
+    await bank.set_balance(members[3], 10)
+
+    driver = bank._config._driver
+    writes = []
+    driver_set = driver.set
+
+    async def set(identifier_data, value=None):
+        writes.append(identifier_data)
+        await driver_set(identifier_data, value=value)
+
+    # each bank scope is written once, concurrently with the single account operations
+    with monkeypatch.context() as m:
+        m.setattr(driver, "set", set)
+        changes, _balance = await asyncio.gather(
+            bank.bulk_deposit({member: 100 for member in members[:3]}),
+            bank.deposit_credits(members[3], 5),
+        )
+    assert len(writes) == 2
+    # the account that isn't in the bulk operation keeps its concurrent change
+    assert await bank.get_balance(members[3]) == 15
+    assert [(change.old_balance, change.new_balance) for change in changes] == [
+        (50, 150),
+        (default_bal, default_bal + 100),
+        (default_bal, default_bal + 100),
+    ]
+    assert await bank.get_balance(members[2]) == default_bal + 100
+    assert await bank.get_leaderboard_position(members[0]) == 3
+
+    # nothing is changed when any of the operations is invalid
+    with pytest.raises(ValueError):
+        await bank.bulk_withdraw({members[0]: 10, members[1]: default_bal + 101})
+    assert await bank.get_balance(members[0]) == 150
+    with pytest.raises(TypeError):
+        await bank.bulk_deposit({members[0]: 1.0})
+
+    await bank.set_max_balance(1000, mbr.guild)
+    with pytest.raises(bank.errors.BalanceTooHigh):
+        await bank.bulk_set_balance({members[0]: 1, members[1]: 1001})
+    changes = await bank.bulk_deposit({members[0]: 900, members[1]: 1}, clamp_to_max=True)
+    assert [change.new_balance for change in changes] == [1000, default_bal + 101]
+
+    changes = await bank.bulk_withdraw({members[0]: 1000})
+    assert changes == [bank.BalanceChange(members[0], 1000, 0)]
+    assert await bank.get_balance(members[0]) == 0
+
+
+async def test_bank_ledger(bank, member_factory):
+    mbr = member_factory.get()
+    other = mbr._replace(id=mbr.id + 1)
+    await bank.set_balance(mbr, 100)
+    await bank._set_ledger_enabled(True)
+    try:
+        await bank.deposit_credits(mbr, 50)
+        await bank.transfer_credits(mbr, other, 30)
+        await bank.withdraw_credits(other, 10)
+        # balances are kept in memory until the next snapshot
+        assert (await bank._config.member(mbr).balance()) == 100
+        assert await bank.get_balance(mbr) == 120
+        assert await bank.get_leaderboard_position(other) == 2
+
+        history = await bank.get_history(mbr)
+        assert [(txn.change, txn.balance) for txn in history] == [(-30, 120), (50, 150)]
+        assert len(await bank.get_history(other, limit=1)) == 1
+
+        # transactions that weren't included in a snapshot are replayed
+        snapshot_txid = await bank._config.ledger_snapshot_txid()
+        bank._ledger.close()
+        bank._ledger_task.cancel()
+        bank._ledger = None
+        await bank._start_ledger()
+        assert await bank._config.ledger_snapshot_txid() > snapshot_txid
+        assert await bank._config.member(mbr).balance() == 120
+        assert await bank._config.member(other).balance() == await bank.get_balance(other)
+
+        await bank._process_data_deletion(requester="user", user_id=mbr.id)
+        assert await bank.get_history(mbr) == []
+        assert len(await bank.get_history(other)) == 2
+
+        # transactions recorded while the ledger is being rewritten aren't lost
+        deletion = asyncio.create_task(bank._ledger.delete_user(mbr.id))
+        await asyncio.gather(*(bank.deposit_credits(other, 1) for _ in range(20)))
+        await deletion
+        assert len(await bank.get_history(other)) == 22
+    finally:
+        await bank._set_ledger_enabled(False)
+    assert await bank.get_history(other) == []
+
+
+async def test_economy_cooldown_cache(config, member_factory):
+    from redbot.cogs.economy.economy import CooldownCache
+
+    config.register_member(next_payday=0, last_slot=0)
+    cache = CooldownCache(config, max_dirty=2, ttl=0)
+    mbr = member_factory.get()
+    key = cache.get_key(mbr, False)
+    await config.member(mbr).next_payday.set(100)
+
+    assert (await cache.get(key))["next_payday"] == 100
+    for now in range(1, 6):
+        await cache.set(key, "last_slot", now)
+    # nothing is written until the cache is flushed
+    assert await config.member(mbr).last_slot() == 0
+    assert (await cache.get(key))["last_slot"] == 5
+
+    await cache.flush()
+    assert await config.member(mbr).all() == {"next_payday": 100, "last_slot": 5}
+    # flushed entries that weren't used recently are evicted
+    assert key not in cache._entries
+
+    await cache.set(key, "next_payday", 200)
+    # the user is forgotten after the running flush, which can't save them back
+    flush = asyncio.create_task(cache.flush())
+    await asyncio.sleep(0)
+    await cache.forget_user(mbr.id)
+    await flush
+    await cache.set(key, "next_payday", 300)
+    await cache.forget_user(mbr.id)
+    await cache.close()
+    assert await config.member(mbr).next_payday() == 200
+    # entries that disappeared don't break the flushes
+    cache._dirty.add(key)
+    await cache.flush()
@@ -0,0 +1,72 @@
+import re
+
+from redbot.cogs.filter.matcher import WordMatcher, normalize_text
+
+
+def test_word_matcher_matches_regex():
+    words = ["bad", "bad word", "!bang", "c++", "naïve", "x"]
+    matcher = WordMatcher(words)
+    pattern = re.compile("|".join(rf"\b{re.escape(w)}\b" for w in words), flags=re.I)
+    for text in (
+        "abad bad_ badword BAD!",
+        "say !bang now, a!bang",
+        "i like c++ and c++x",
+        "NAÏVE x-ray",
+        "nothing to see here",
+    ):
+        assert matcher.find(text) == set(pattern.findall(text))
+
+    # overlapping words are all found
+    assert matcher.find("Bad word") == {"Bad", "Bad word"}
+
+
+def test_word_matcher_add_remove():
+    matcher = WordMatcher(["bad"])
+    matcher.add("worse")
+    matcher.add("bad")
+    assert matcher.find("bad and worse") == {"bad", "worse"}
+
+    # words are counted
+    assert matcher.remove("bad")
+    assert matcher.find("bad") == {"bad"}
+    assert matcher.remove("bad")
+    assert not matcher.remove("bad")
+    assert matcher.find("bad and worse") == {"worse"}
+    assert len(matcher) == 1
+
+
+def test_word_matcher_normalize():
+    assert normalize_text("ＢÀd") == "bad"
+    matcher = WordMatcher(["naive", "bad"], normalize=True)
+    # "а" is cyrillic
+    assert matcher.find("so nаïve, ＢＡＤ") == {"nаïve", "ＢＡＤ"}
+    assert WordMatcher(["naive"]).find("so nаïve") == set()
+
+
+async def test_filter_counts_are_saved_lazily(red):
+    from redbot.cogs.filter.filter import FILTER_COUNT_BUCKET, Filter
+
+    cog = Filter(red)
+    member = await cog._get_filter_count(1, 2)
+    assert member == {"filter_count": 0, "next_reset_time": 0}
+    cog._update_filter_count(1, 2, member, count=1, next_reset_time=1)
+    assert await cog.config.member_from_ids(1, 2).filter_count() == 0
+
+    # the count is saved and, as its timeframe is over, dropped from memory
+    await cog.flush_filter_counts()
+    assert await cog.config.member_from_ids(1, 2).all() == {
+        "filter_count": 1,
+        "next_reset_time": 1,
+    }
+    assert not cog._filter_counts
+    assert not cog._filter_count_buckets
+
+    member = await cog._get_filter_count(1, 2)
+    cog._update_filter_count(1, 2, member, count=2, next_reset_time=10 * FILTER_COUNT_BUCKET)
+    await cog.red_delete_data_for_user(requester="discord_deleted_user", user_id=2)
+    await cog.flush_filter_counts()
+    assert not cog._filter_counts
+    assert await cog.config.member_from_ids(1, 2).all() == {
+        "filter_count": 0,
+        "next_reset_time": 0,
+    }
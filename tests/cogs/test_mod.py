@@ -1,3 +1,4 @@
+import asyncio
 from collections import namedtuple
 import pytest
 
@@ -39,3 +40,324 @@ async def test_modlog_case_create(mod, ctx, monkeypatch, member_factory, empty_u
 async def test_modlog_set_modlog_channel(mod, ctx):
     await mod.set_modlog_channel(ctx.guild, ctx.channel)
     assert await mod.get_modlog_channel(ctx.guild) == ctx.channel.id
+
+
+async def test_modlog_case_index(mod, ctx, monkeypatch, member_factory, empty_user):
+    from datetime import datetime, timezone
+
+    await test_modlog_register_casetype(mod)
+    mock_connection = namedtuple("Connection", "user")
+    monkeypatch.setattr(ctx.bot, "_connection", mock_connection(empty_user))
+    guild = ctx.guild
+    usr1 = member_factory.get()
+    usr2 = member_factory.get()
+    created_at = datetime.now(timezone.utc)
+    for usr in (usr1, usr2, usr1):
+        await mod.create_case(ctx.bot, guild, created_at, "ban", usr, ctx.author)
+    await mod._commit_pending_cases()
+
+    assert await mod._get_indexed_case_numbers(guild.id, "user", usr1.id) == [1, 3]
+    assert await mod._get_indexed_case_numbers(guild.id, "user", usr2.id) == [2]
+    assert await mod._get_indexed_case_numbers(guild.id, "moderator", ctx.author.id) == [1, 2, 3]
+    assert await mod._get_indexed_case_numbers(guild.id, "action_type", "ban") == [1, 2, 3]
+    # each case is a separate entry of the index
+    index = mod._config.custom(mod._CASE_INDEX, str(guild.id), "user")
+    assert await index.get_raw(str(usr1.id)) == {"1": True, "3": True}
+
+    case = await mod.create_case(ctx.bot, guild, created_at, "ban", usr2)
+    await case.edit({"user": usr1.id, "moderator": ctx.author.id})
+    assert await mod._get_indexed_case_numbers(guild.id, "user", usr1.id) == [1, 3, 4]
+    assert await mod._get_indexed_case_numbers(guild.id, "user", usr2.id) == [2]
+    assert await mod._get_indexed_case_numbers(guild.id, "moderator", ctx.author.id) == [
+        1,
+        2,
+        3,
+        4,
+    ]
+
+    await mod.reset_cases(guild)
+    assert await mod._get_indexed_case_numbers(guild.id, "user", usr1.id) == []
+    assert await mod._get_indexed_case_numbers(guild.id, "action_type", "ban") == []
+
+
+async def test_modlog_case_pages(mod, ctx, monkeypatch, member_factory, empty_user):
+    from datetime import datetime, timezone
+    from types import SimpleNamespace
+
+    await test_modlog_register_casetype(mod)
+    mock_connection = namedtuple("Connection", "user get_user")
+    monkeypatch.setattr(ctx.bot, "_connection", mock_connection(empty_user, lambda user_id: None))
+    guild = SimpleNamespace(
+        id=ctx.guild.id, get_channel=lambda channel_id: None, get_channel_or_thread=lambda c: None
+    )
+    usr1 = member_factory.get()
+    usr2 = member_factory.get()
+    created_at = datetime.now(timezone.utc)
+    for usr in (usr1, usr2, usr1, usr1, usr2):
+        await mod.create_case(ctx.bot, guild, created_at, "ban", usr, ctx.author)
+
+    cases = [case async for case in mod.iter_cases(guild)]
+    assert [case.case_number for case in cases] == [5, 4, 3, 2, 1]
+    assert cases[0].user == usr2.id
+    cases = [case async for case in mod.iter_cases(guild, newest_first=False, start=2, limit=2)]
+    assert [case.case_number for case in cases] == [2, 3]
+    cases = [case async for case in mod.iter_cases(guild, start=4, member_id=usr1.id)]
+    assert [case.case_number for case in cases] == [4, 3, 1]
+
+    page = await mod.get_case_page(guild, 1, per_page=2)
+    assert [case.case_number for case in page.cases] == [3, 2]
+    assert page.page_count == 3
+    page = await mod.get_case_page(guild, 0, per_page=2, member_id=usr2.id, newest_first=False)
+    assert [case.case_number for case in page.cases] == [2, 5]
+    assert page.page_count == 1
+    assert (await mod.get_case_page(guild, 3, per_page=2)).cases == []
+
+
+async def test_modlog_case_queue(mod, ctx, monkeypatch, member_factory, empty_user):
+    from datetime import datetime, timezone
+
+    await test_modlog_register_casetype(mod)
+    dispatched = []
+    mock_connection = namedtuple("Connection", "user")
+    monkeypatch.setattr(ctx.bot, "_connection", mock_connection(empty_user))
+    monkeypatch.setattr(ctx.bot, "dispatch", lambda event, case: dispatched.append(case))
+    guild = ctx.guild
+    created_at = datetime.now(timezone.utc)
+    users = [member_factory.get() for _ in range(20)]
+    cases = await asyncio.gather(
+        *(mod.create_case(ctx.bot, guild, created_at, "ban", usr, ctx.author) for usr in users)
+    )
+
+    assert [case.case_number for case in cases] == list(range(1, 21))
+    assert [case.case_number for case in dispatched] == list(range(1, 21))
+    # cases that weren't written yet can still be retrieved
+    assert await mod.get_case(20, guild, ctx.bot) is cases[-1]
+    assert (await mod.get_latest_case(guild, ctx.bot)).case_number == 20
+
+    await mod._commit_pending_cases()
+    assert await mod._config.guild(guild).latest_case_number() == 20
+    assert await mod._get_indexed_case_numbers(guild.id, "action_type", "ban") == list(
+        range(1, 21)
+    )
+    assert await mod._get_indexed_case_numbers(guild.id, "user", users[4].id) == [5]
+
+
+async def test_modlog_case_queue_messages(mod, monkeypatch):
+    from types import SimpleNamespace
+
+    import discord
+
+    sent = []
+
+    async def send(content=None, *, embeds=None):
+        message = SimpleNamespace(content=content, embeds=embeds)
+        sent.append(message)
+        return message
+
+    async def get_modlog_channel(guild):
+        return SimpleNamespace(send=send)
+
+    use_embeds = True
+
+    async def embed_requested(channel):
+        return use_embeds
+
+    class StubCase:
+        def __init__(self, case_number):
+            self.case_number = case_number
+            self.guild = None
+            self.bot = SimpleNamespace(embed_requested=embed_requested)
+            self.message = None
+
+        async def message_content(self, embed):
+            if embed:
+                return discord.Embed(title=f"Case #{self.case_number}", description="a" * 1000)
+            return f"Case #{self.case_number}"
+
+        async def _set_message(self, message):
+            self.message = message
+
+    monkeypatch.setattr(mod, "get_modlog_channel", get_modlog_channel)
+    queue = mod._CaseQueue(1)
+    cases = [StubCase(case_number) for case_number in range(1, 13)]
+    await queue._send_messages(cases)
+    # the embeds are combined into messages of up to 6000 characters
+    assert [len(message.embeds) for message in sent] == [5, 5, 2]
+    for case in cases:
+        assert f"Case #{case.case_number}" in [embed.title for embed in case.message.embeds]
+
+    sent.clear()
+    use_embeds = False
+    await queue._send_messages(cases)
+    assert [case.message.content for case in cases] == [message.content for message in sent]
+    assert len(sent) == 12
+
+
+async def test_modlog_case_archive(mod, ctx, monkeypatch, member_factory, empty_user):
+    from datetime import datetime, timezone
+    from types import SimpleNamespace
+
+    await test_modlog_register_casetype(mod)
+    mock_connection = namedtuple("Connection", "user get_user")
+    monkeypatch.setattr(ctx.bot, "_connection", mock_connection(empty_user, lambda user_id: None))
+    monkeypatch.setattr(ctx.bot, "dispatch", lambda event, case: None)
+    monkeypatch.setattr(mod, "_ARCHIVE_SEGMENT_SIZE", 4)
+    guild = SimpleNamespace(
+        id=ctx.guild.id,
+        name="Test Guild",
+        get_channel=lambda channel_id: None,
+        get_channel_or_thread=lambda c: None,
+    )
+    created_at = datetime.now(timezone.utc)
+    users = [member_factory.get() for _ in range(10)]
+    for usr in users:
+        await mod.create_case(ctx.bot, guild, created_at, "ban", usr, ctx.author)
+    await mod._commit_pending_cases()
+
+    assert await mod._archive_guild_cases(guild.id, max_age=None, keep_latest=3) == 7
+    assert await mod._archive_guild_cases(guild.id, max_age=None, keep_latest=3) == 0
+    assert await mod._get_archived_through(guild.id) == 7
+    assert sorted(map(int, await mod._config.custom(mod._CASES, str(guild.id)).all())) == [
+        8,
+        9,
+        10,
+    ]
+
+    # both tiers are read transparently
+    case = await mod.get_case(2, guild, ctx.bot)
+    assert case.user == users[1].id
+    assert (await mod.get_case(9, guild, ctx.bot)).user == users[8].id
+    assert [int(case.case_number) for case in await mod.get_all_cases(guild, ctx.bot)] == list(
+        range(1, 11)
+    )
+    assert [case.case_number async for case in mod.iter_cases(guild, start=5, limit=3)] == [
+        5,
+        4,
+        3,
+    ]
+    cases = await mod.get_cases_for_member(guild, ctx.bot, member_id=users[4].id)
+    assert [case.case_number for case in cases] == [5]
+
+    await case.edit({"reason": "Archived reason"})
+    mod._segment_cache.clear()
+    assert (await mod.get_case(2, guild, ctx.bot)).reason == "Archived reason"
+
+    await mod.reset_cases(guild)
+    assert await mod._get_archived_through(guild.id) == 0
+    assert not mod._get_archive_path(guild.id).exists()
+    with pytest.raises(RuntimeError):
+        await mod.get_case(2, guild, ctx.bot)
+
+
+def test_duplicate_detector():
+    from redbot.cogs.mod.duplicates import DuplicateDetector
+
+    detector = DuplicateDetector(max_authors=2)
+    assert not detector.check(1, 10, "spam", 3)
+    assert not detector.check(1, 10, "spam", 3)
+    # authors are tracked per guild
+    assert not detector.check(2, 10, "spam", 3)
+    assert detector.check(1, 10, "spam", 3)
+    assert detector.check(1, 10, "spam", 3)
+    assert not detector.check(1, 10, "ham", 3)
+
+    # the least recently active author is evicted
+    assert not detector.check(1, 20, "spam", 3)
+    assert detector.stats() == (2, 7, 2, 1)
+    detector.forget_user(10)
+    assert detector.stats().authors == 1
+
+    detector = DuplicateDetector(ttl=0)
+    assert not detector.check(1, 10, "spam", 2)
+    assert not detector.check(1, 10, "spam", 2)
+    assert detector.stats().evictions == 2
+
+
+async def test_name_history(config):
+    from redbot.cogs.mod.name_history import MAX_PAST_NAMES, NameHistory
+
+    config.register_user(past_names=[], past_display_names=[])
+    config.register_member(past_nicks=[])
+    await config.user_from_id(1).past_names.set(["old", None])
+    history = NameHistory(config)
+
+    for idx in range(MAX_PAST_NAMES + 5):
+        await history.add_name(1, "past_names", f"name{idx}")
+    await history.add_name(1, "past_names", "name10")
+    await history.add_nick(2, 1, "nick")
+    usernames, display_names = await history.get_names(1)
+    assert len(usernames) == MAX_PAST_NAMES
+    assert usernames[0] == "name5"
+    assert usernames[-1] == "name10"
+    assert display_names == []
+    assert await history.get_nicks(2, 1) == ["nick"]
+    # nothing is saved until the history is flushed
+    assert await config.user_from_id(1).past_names() == ["old", None]
+
+    await history.flush()
+    assert await config.user_from_id(1).past_names() == usernames
+    assert await config.member_from_ids(2, 1).past_nicks() == ["nick"]
+
+    await history.add_nick(2, 1, "other")
+    await history.forget_user(1)
+    await history.flush()
+    assert await config.member_from_ids(2, 1).past_nicks() == ["nick"]
+
+
+async def test_modlog_create_cases(mod, ctx, monkeypatch, member_factory, empty_user):
+    from datetime import datetime, timezone
+
+    await test_modlog_register_casetype(mod)
+    mock_connection = namedtuple("Connection", "user")
+    monkeypatch.setattr(ctx.bot, "_connection", mock_connection(empty_user))
+    guild = ctx.guild
+    created_at = datetime.now(timezone.utc)
+    await mod.create_case(ctx.bot, guild, created_at, "ban", member_factory.get(), ctx.author)
+    users = [member_factory.get() for _ in range(5)]
+    cases = await mod.create_cases(ctx.bot, guild, created_at, "ban", users, ctx.author, "Raid")
+
+    assert [case.case_number for case in cases] == list(range(2, 7))
+    assert [case.user for case in cases] == users
+    assert all(case.reason == "Raid" for case in cases)
+    assert await mod.create_cases(ctx.bot, guild, created_at, "ban", [], ctx.author) == []
+
+    await mod._commit_pending_cases()
+    assert await mod._config.guild(guild).latest_case_number() == 6
+
+
+async def test_modlog_create_cases_messages(mod, ctx, monkeypatch, member_factory, empty_user):
+    from datetime import datetime, timezone
+    from types import SimpleNamespace
+
+    await test_modlog_register_casetype(mod)
+    mock_connection = namedtuple("Connection", "user get_user")
+    monkeypatch.setattr(ctx.bot, "_connection", mock_connection(empty_user, lambda user_id: None))
+    monkeypatch.setattr(ctx.bot, "dispatch", lambda event, case: None)
+    message_ids = iter(range(1000, 2000))
+    sent = []
+
+    async def send(content=None, *, embeds=None):
+        message = SimpleNamespace(id=next(message_ids), embeds=embeds)
+        sent.append(message)
+        return message
+
+    async def get_modlog_channel(guild):
+        return SimpleNamespace(send=send)
+
+    async def embed_requested(channel):
+        return True
+
+    monkeypatch.setattr(mod, "get_modlog_channel", get_modlog_channel)
+    monkeypatch.setattr(ctx.bot, "embed_requested", embed_requested)
+    user_ids = [member_factory.get().id for _ in range(25)]
+    cases = await mod.create_cases(
+        ctx.bot, ctx.guild, datetime.now(timezone.utc), "ban", user_ids, ctx.author.id, "Raid"
+    )
+    await mod._get_case_queue(ctx.guild.id)._task
+
+    # the cases of a raid share fewer messages, each case still knows its message
+    assert len(sent) < len(cases)
+    for case in cases:
+        data = await mod._config.custom(mod._CASES, str(ctx.guild.id), str(case.case_number)).all()
+        message = next(message for message in sent if message.id == data["message"])
+        assert case.case_number in [int(embed.title.split()[1][1:]) for embed in message.embeds]
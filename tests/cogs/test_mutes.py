@@ -0,0 +1,118 @@
+import asyncio
+from types import SimpleNamespace
+
+import discord
+
+from redbot.cogs.mutes.overwrites import OverwriteEdit, OverwriteExecutor
+
+
+def make_error(status: int) -> discord.HTTPException:
+    return discord.HTTPException(SimpleNamespace(status=status, reason=""), "")
+
+
+async def test_overwrite_executor():
+    executor = OverwriteExecutor(max_concurrency=4, retry_delay=0)
+    overwrite = discord.PermissionOverwrite(send_messages=False)
+    active = 0
+    max_active = 0
+
+    def make_channel(channel_id: int, errors):
+        overwrites = {}
+        errors = list(errors)
+
+        async def set_permissions(target, *, overwrite, reason):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            try:
+                await asyncio.sleep(0.01)
+                if errors:
+                    raise errors.pop(0)
+                overwrites[target] = overwrite
+            finally:
+                active -= 1
+
+        return SimpleNamespace(
+            id=channel_id,
+            set_permissions=set_permissions,
+            overwrites_for=lambda target: overwrites.get(target, discord.PermissionOverwrite()),
+        )
+
+    channels = [make_channel(idx, []) for idx in range(20)]
+    # retried server errors
+    channels.append(make_channel(20, [make_error(500), make_error(503)]))
+    # errors that aren't retried
+    channels.append(make_channel(21, [make_error(403)]))
+    # errors that keep happening
+    channels.append(make_channel(22, [make_error(500)] * 10))
+
+    edits = [OverwriteEdit(channel, "role", overwrite) for channel in channels]
+    errors = await executor.apply(edits)
+    assert max_active <= 4
+    assert sorted(edit.channel.id for edit, error in errors) == [21, 22]
+    assert all(channel.overwrites_for("role") == overwrite for channel in channels[:21])
+    # the concurrency was lowered after the server errors
+    assert executor.concurrency < 4
+
+    # applying the edits again only retries the failed ones
+    retried = []
+
+    async def set_permissions(target, *, overwrite, reason):
+        retried.append(target)
+
+    for channel in channels:
+        channel.set_permissions = set_permissions
+    assert await executor.apply(edits) == []
+    assert len(retried) == 2
+
+
+async def test_channel_mute_index(red, config, monkeypatch):
+    from redbot.core import Config
+    from redbot.cogs.mutes.mutes import Mutes
+
+    monkeypatch.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+    cog = Mutes(red)
+
+    def mute(guild_id, user_id):
+        return {"guild": guild_id, "member": user_id, "until": None, "voice_mute": False}
+
+    cog._set_channel_mute(10, 1, mute(100, 1))
+    cog._set_channel_mute(11, 1, mute(100, 1))
+    cog._set_channel_mute(11, 2, mute(100, 2))
+    cog._set_channel_mute(20, 1, mute(200, 1))
+    assert cog._get_member_channel_mutes(100, 1) == {10: mute(100, 1), 11: mute(100, 1)}
+    assert cog._get_member_channel_mutes(200, 1) == {20: mute(200, 1)}
+    assert cog._get_member_channel_mutes(200, 2) == {}
+
+    assert cog._pop_channel_mute(11, 1) == mute(100, 1)
+    assert cog._pop_channel_mute(11, 1) is None
+    assert cog._get_member_channel_mutes(100, 1) == {10: mute(100, 1)}
+    assert cog._pop_channel_mute(10, 1) == mute(100, 1)
+    assert cog._get_member_channel_mutes(100, 1) == {}
+    assert cog._channel_mutes == {10: {}, 11: {2: mute(100, 2)}, 20: {1: mute(200, 1)}}
+
+
+async def test_unmute_job_of_unavailable_guild(red, config, monkeypatch):
+    from datetime import datetime, timezone
+
+    from redbot.core import Config, scheduler
+    from redbot.cogs.mutes import mutes as mutes_module
+    from redbot.cogs.mutes.mutes import Mutes
+
+    monkeypatch.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+    monkeypatch.setattr(red, "get_guild", lambda guild_id: None)
+    scheduled = []
+
+    async def schedule(owner, job_id, due, payload=None):
+        scheduled.append((owner, job_id, due, payload))
+
+    monkeypatch.setattr(mutes_module.scheduler, "schedule", schedule)
+    cog = Mutes(red)
+    payload = {"guild": 100, "member": 1}
+    job = scheduler.Job(cog.qualified_name, "100-1", datetime.now(timezone.utc), payload)
+
+    # the unmute is retried later instead of being dropped
+    await cog._handle_unmute_job(job)
+    ((owner, job_id, due, retry_payload),) = scheduled
+    assert (owner, job_id, retry_payload) == (job.owner, job.id, payload)
+    assert due > job.due
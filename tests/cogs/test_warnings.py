@@ -0,0 +1,61 @@
+from redbot.cogs.warnings.helpers import ActionThresholds
+
+
+def test_action_thresholds():
+    def action(name, points):
+        return {"action_name": name, "points": points}
+
+    # same order as in Config, by points in decreasing order and then by addition
+    actions = ActionThresholds(
+        [action("ban", 10), action("mute", 5), action("kick", 5), action("note", 2)]
+    )
+    assert actions.exceeded(1) is None
+    assert actions.exceeded(2)["action_name"] == "note"
+    assert actions.exceeded(7)["action_name"] == "mute"
+    assert actions.exceeded(100)["action_name"] == "ban"
+    assert actions.dropped(7) is None
+    assert actions.dropped(10)["action_name"] == "note"
+    assert ActionThresholds([]).exceeded(5) is None
+
+
+async def test_warnings_index(red, config, monkeypatch):
+    from redbot.core import Config
+    from redbot.cogs.warnings.warnings import Warnings
+
+    monkeypatch.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+    # data saved before the index was added
+    for guild_id, member_id, mod_id in ((1, 10, 20), (1, 11, 20), (2, 10, 21)):
+        await config.member_from_ids(guild_id, member_id).set_raw(
+            "warnings",
+            str(member_id * 100 + guild_id),
+            value={"points": 1, "description": "Spam", "mod": mod_id},
+        )
+    for idx in range(25):
+        await config.member_from_ids(3, 12).set_raw(
+            "warnings", str(idx), value={"points": 1, "description": "Spam", "mod": 20}
+        )
+    cog = Warnings(red)
+    await cog._maybe_update_config()
+
+    entries, page_count = await cog.get_warnings_page(3, 12, 2)
+    assert page_count == 3
+    assert [warn_id for warn_id, warning in entries] == [str(idx) for idx in range(20, 25)]
+    # the pages past the last page return the last page
+    assert await cog.get_warnings_page(3, 12, 5) == (entries, page_count)
+
+    await cog.red_delete_data_for_user(requester="discord_deleted_user", user_id=10)
+    assert await config.member_from_ids(1, 10).warnings() == {}
+    assert await config.member_from_ids(2, 10).warnings() == {}
+    assert await config.member_from_ids(1, 11).warnings() != {}
+    # the deleted user is removed from the index of the moderators who warned them
+    assert await config.custom("WARNING_INDEX", 20).issued() == {
+        "1": {"11": {"1101": True}},
+        "3": {"12": {str(idx): True for idx in range(25)}},
+    }
+    assert "10" not in (await config.custom("WARNING_INDEX", 21).issued()).get("2", {})
+
+    await cog.red_delete_data_for_user(requester="discord_deleted_user", user_id=20)
+    assert (await config.member_from_ids(1, 11).get_raw("warnings", "1101", "mod")) == 0xDE1
+    assert (await config.member_from_ids(3, 12).get_raw("warnings", "0", "mod")) == 0xDE1
+    # the member's data was deleted before, it mustn't be recreated
+    assert await config.member_from_ids(1, 10).warnings() == {}
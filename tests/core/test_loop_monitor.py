@@ -0,0 +1,37 @@
+import asyncio
+import time
+
+from redbot.core._loop_monitor import LoopLagMonitor, _get_owner
+
+
+def test_get_owner():
+    assert _get_owner("redbot.cogs.audio.core.utilities.local_tracks") == "audio"
+    assert _get_owner("redbot.core._drivers.json") == "core"
+    assert _get_owner("mycog.mycog") == "mycog"
+
+
+def _block_the_loop():
+    time.sleep(0.3)
+
+
+async def test_loop_lag_monitor_attributes_stalls():
+    monitor = LoopLagMonitor(threshold=0.05)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.1)
+        _block_the_loop()
+        await asyncio.sleep(0.1)
+    finally:
+        monitor.stop()
+
+    summary = monitor.get_summary()
+    assert summary["stall_count"] == 1
+    assert summary["lag"]["max"] >= 0.25
+    culprit = summary["culprits"][0]
+    assert culprit["count"] == 1
+    assert "_block_the_loop" in culprit["location"]
+
+    monitor.reset()
+    summary = monitor.get_summary()
+    assert summary["stall_count"] == 0
+    assert summary["culprits"] == []
@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from redbot.core import scheduler as scheduler_module
+
+
+@pytest.fixture()
+async def scheduler(config, monkeypatch, red):
+    from redbot.core import Config
+
+    monkeypatch.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+    red._red_ready.set()
+    await scheduler_module._init(red)
+    yield scheduler_module
+    await scheduler_module._shutdown()
+
+
+async def test_scheduler_runs_due_jobs(scheduler):
+    handled = asyncio.Queue()
+
+    async def handler(job):
+        await handled.put(job)
+
+    now = datetime.now(timezone.utc)
+    await scheduler.schedule("Owner", "later", now + timedelta(hours=1), {"n": 2})
+    await scheduler.schedule("Owner", "soon", now + timedelta(seconds=0.1), {"n": 1})
+    await scheduler.schedule("Owner", "cancelled", now, {"n": 0})
+    assert await scheduler.cancel("Owner", "cancelled")
+    assert not await scheduler.cancel("Owner", "cancelled")
+    assert [job.id for job in scheduler.get_jobs("Owner")] == ["soon", "later"]
+
+    scheduler.register_handler("Owner", handler)
+    job = await asyncio.wait_for(handled.get(), 5)
+    assert (job.id, job.payload) == ("soon", {"n": 1})
+    await asyncio.sleep(0.1)
+    assert handled.empty()
+    assert scheduler.get_job("Owner", "soon") is None
+    assert scheduler.get_job("Owner", "later") is not None
+
+
+async def test_scheduler_rehydrates_jobs(scheduler, red):
+    handled = asyncio.Queue()
+
+    async def handler(job):
+        await handled.put(job)
+
+    due = datetime.now(timezone.utc) - timedelta(minutes=5)
+    await scheduler.schedule("Owner", "missed", due, {"n": 1})
+    # the job becomes due while its owner has no handler
+    await asyncio.sleep(0.1)
+    assert scheduler.get_job("Owner", "missed") is not None
+
+    # a restart keeps the job
+    await scheduler._shutdown()
+    await scheduler._init(red)
+    job = scheduler.get_job("Owner", "missed")
+    assert job == scheduler.Job("Owner", "missed", due, {"n": 1})
+
+    scheduler.register_handler("Owner", handler)
+    assert await asyncio.wait_for(handled.get(), 5) == job
+    await asyncio.sleep(0.1)
+
+    # handled jobs are removed from Config
+    await scheduler._shutdown()
+    await scheduler._init(red)
+    assert scheduler.get_jobs("Owner") == []
@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+
+from redbot.core._timings import (
+    BUCKET_BOUNDS,
+    PHASE_SEND,
+    PHASE_TOTAL,
+    CommandTimingsManager,
+    ListenerTimingsManager,
+    TimingHistogram,
+)
+
+
+def test_histogram_record():
+    histogram = TimingHistogram()
+    for elapsed in (0.00005, 0.003, 0.003, 20.0):
+        histogram.record(elapsed)
+
+    assert histogram.count == 4
+    assert histogram.max == 20.0
+    assert histogram.buckets[0] == 1
+    assert histogram.buckets[BUCKET_BOUNDS.index(0.005)] == 2
+    assert histogram.buckets[-1] == 1
+    assert histogram.total == 0.00005 + 0.003 + 0.003 + 20.0
+
+
+def test_histogram_quantile():
+    histogram = TimingHistogram()
+    assert histogram.quantile(0.99) == 0.0
+
+    for _ in range(99):
+        histogram.record(0.0008)
+    histogram.record(0.2)
+
+    assert histogram.quantile(0.5) == 0.001
+    assert histogram.quantile(0.99) == 0.001
+    assert histogram.quantile(1.0) == 0.2
+
+    histogram.reset()
+    assert histogram.count == 0
+    assert not any(histogram.buckets)
+
+
+def test_timings_manager():
+    manager = CommandTimingsManager()
+    manager.record("ping", PHASE_TOTAL, 0.01)
+    manager.record("ping", PHASE_SEND, 0.005)
+    manager.record("set bot name", PHASE_TOTAL, 0.5)
+
+    timings = manager.to_dict()
+    assert set(timings) == {"ping", "set bot name"}
+    assert set(timings["ping"]) == {"send", "total"}
+    assert timings["ping"]["total"]["count"] == 1
+
+    assert manager.to_dict("unknown") == {}
+    manager.reset("ping")
+    assert set(manager.to_dict()) == {"set bot name"}
+    manager.reset()
+    assert manager.to_dict() == {}
+
+
+def test_timings_manager_disabled():
+    manager = CommandTimingsManager(enabled=False)
+    manager.record("ping", PHASE_TOTAL, 0.01)
+    assert manager.to_dict() == {}
+
+
+async def test_listener_timings():
+    manager = ListenerTimingsManager(enabled=True)
+
+    async def on_message(value):
+        time.sleep(0.02)
+        await asyncio.sleep(0.1)
+        return value
+
+    async def on_error():
+        raise RuntimeError
+
+    assert await manager.wrap(on_message, "on_message")(1) == 1
+    with pytest.raises(RuntimeError):
+        await manager.wrap(on_error, "on_message")()
+
+    timings = manager.to_list()
+    assert [stats["listener"] for stats in timings] == ["on_message", "on_error"]
+    stats = timings[0]
+    assert stats["event"] == "on_message"
+    assert stats["calls"] == 1
+    assert stats["exceptions"] == 0
+    assert 0.02 <= stats["busy"]["total"] < 0.09 <= stats["wall"]["total"]
+    assert timings[1]["exceptions"] == 1
+
+    manager.reset()
+    assert manager.to_list() == []
+
+
+async def test_listener_timings_cancellation():
+    manager = ListenerTimingsManager(enabled=True)
+    cancelled = False
+
+    async def on_message():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    task = asyncio.create_task(manager.wrap(on_message, "on_message")())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cancelled
+    assert manager.to_list()[0]["calls"] == 1
@@ -258,3 +258,142 @@ def test_pagify_length_hint():
         assert operator.length_hint(it) == remaining
 
     assert operator.length_hint(it) == 0
+
+
+async def test_mass_ban():
+    from types import SimpleNamespace
+
+    import discord
+
+    from redbot.core.utils.mod import mass_ban
+
+    def make_error(status: int) -> discord.HTTPException:
+        response = SimpleNamespace(status=status, reason="")
+        return discord.HTTPException(response, "")
+
+    banned = []
+
+    async def ban(user, **kwargs):
+        if user.id % 10 == 0:
+            raise make_error(400)
+        banned.append(user.id)
+
+    async def bulk_ban(users, **kwargs):
+        if len(users) < 200:
+            raise make_error(500)
+        ok = [user for user in users if user.id % 10]
+        banned.extend(user.id for user in ok)
+        return SimpleNamespace(banned=ok, failed=[user for user in users if not user.id % 10])
+
+    def make_guild(manage_guild: bool, **methods):
+        me = SimpleNamespace(guild_permissions=discord.Permissions(manage_guild=manage_guild))
+        return SimpleNamespace(me=me, **methods)
+
+    user_ids = list(range(1, 251))
+    expected_failed = {user_id for user_id in user_ids if not user_id % 10}
+
+    # bulk bans, with the last (smaller) chunk failing and falling back to single bans
+    steps = [
+        step
+        async for step in mass_ban(
+            make_guild(True, ban=ban, bulk_ban=bulk_ban), user_ids, concurrency=10
+        )
+    ]
+    assert len(steps[0].banned) + len(steps[0].failed) == 200
+    assert all(error is None for error in steps[0].failed.values())
+    assert len(steps) == 1 + 5
+    assert sorted(banned) == [user_id for user_id in user_ids if user_id % 10]
+    assert {user_id for step in steps for user_id in step.failed} == expected_failed
+
+    # single bans only, without the Manage Server permission
+    banned.clear()
+    steps = [
+        step
+        async for step in mass_ban(
+            make_guild(False, ban=ban, bulk_ban=bulk_ban), user_ids, concurrency=50
+        )
+    ]
+    assert len(steps) == 5
+    assert sorted(banned) == [user_id for user_id in user_ids if user_id % 10]
+    failed = {user_id: error for step in steps for user_id, error in step.failed.items()}
+    assert failed.keys() == expected_failed
+    assert all(isinstance(error, discord.HTTPException) for error in failed.values())
+
+
+async def test_mass_purge():
+    from types import SimpleNamespace
+
+    from redbot.core.utils.mod import mass_purge
+
+    fetched = 0
+    deleted = []
+    max_pending = 0
+
+    async def delete_messages(messages, *, reason):
+        nonlocal max_pending
+        max_pending = max(max_pending, fetched - len(deleted))
+        await asyncio.sleep(0)
+        deleted.extend(messages)
+
+    async def history(count):
+        nonlocal fetched
+        for idx in range(count):
+            fetched += 1
+            yield idx
+            await asyncio.sleep(0)
+
+    channel = SimpleNamespace(delete_messages=delete_messages)
+    reported = []
+
+    async def progress(processed):
+        reported.append(processed)
+
+    assert await mass_purge(history(1050), channel, progress=progress) == 1050
+    assert deleted == list(range(1050))
+    assert reported == [100 * n for n in range(1, 11)] + [1050]
+    # the history isn't fetched much further ahead of the deletions
+    assert max_pending <= 400
+
+    deleted.clear()
+    assert await mass_purge(list(range(150)), channel) == 150
+    assert deleted == list(range(150))
+
+    async def broken_history():
+        yield 1
+        raise RuntimeError
+
+    deleted.clear()
+    with pytest.raises(RuntimeError):
+        await mass_purge(broken_history(), channel)
+    assert deleted == [1]
+
+
+async def test_simple_menu_page_source():
+    from redbot.core.utils.views import SimpleMenu
+    from redbot.vendored.discord.ext import menus
+
+    class Source(menus.PageSource):
+        def __init__(self):
+            self.fetched = []
+
+        def is_paginating(self):
+            return True
+
+        def get_max_pages(self):
+            return 30
+
+        async def get_page(self, page_number):
+            if not 0 <= page_number < 30:
+                raise IndexError(page_number)
+            self.fetched.append(page_number)
+            return page_number
+
+        async def format_page(self, view, page):
+            return f"Page {page}"
+
+    source = Source()
+    menu = SimpleMenu(source, page_start=3)
+    assert menu.source is source
+    assert len(menu.select_options) == 30
+    assert (await menu.get_page(menu.current_page))["content"] == "Page 3"
+    assert source.fetched == [3]